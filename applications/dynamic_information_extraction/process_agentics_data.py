@@ -93,17 +93,13 @@ def data_processing():
             start_index = selected_start
             end_index = selected_end
 
+            # range reductions reuse the batches and subtrees computed for earlier ranges
             sentiment = asyncio.run(
-                (
-                    AG(
-                        atype=st.session_state.pydantic_class,
-                        transduction_type="areduce",
-                        areduce_batch_size=batch_size,
-                    )
-                    << st.session_state.dataset.filter_states(
-                        start=start_index, end=end_index + 1
-                    )
-                )
+                AG(
+                    atype=st.session_state.pydantic_class,
+                    transduction_type="areduce",
+                    areduce_batch_size=batch_size,
+                ).areduce_range(st.session_state.dataset, start_index, end_index)
             )
             sentiment.states += sentiment.areduce_batches
             sentiment = sentiment.add_attribute("question", default_value=question)
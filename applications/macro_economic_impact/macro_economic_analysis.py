@@ -83,16 +83,14 @@ def macro_economic_analysis_ui():
             start_index = st.session_state.market_dataset_index[str(selected_start)]
             end_index = st.session_state.market_dataset_index[str(selected_end)]
 
+            # range reductions reuse the batches and subtrees computed for earlier ranges
             sentiment = asyncio.run(
-                (
-                    AG(
-                        atype=st.session_state.pydantic_class,
-                        transduction_type="areduce",
-                        areduce_batch_size=areduce_batch_size,
-                    )
-                    << st.session_state.market_dataset.filter_states(
-                        start=start_index, end=end_index + 1
-                    )
+                AG(
+                    atype=st.session_state.pydantic_class,
+                    transduction_type="areduce",
+                    areduce_batch_size=areduce_batch_size,
+                ).areduce_range(
+                    st.session_state.market_dataset, start_index, end_index
                 )
             )
             import yaml
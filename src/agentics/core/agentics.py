@@ -1,19 +1,19 @@
 import asyncio
-import csv
 import io
-import json
 import os
 import random
-from collections.abc import Iterable
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 from copy import copy, deepcopy
 from functools import partial, reduce
-from itertools import zip_longest
+from itertools import islice, zip_longest
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Dict,
     Generic,
     List,
+    Literal,
     Optional,
     Tuple,
     Type,
@@ -27,11 +27,22 @@ import yaml
 from crewai import LLM
 from langchain_core.prompts import PromptTemplate
 from loguru import logger
+from openai import AsyncOpenAI
 from pandas import DataFrame
 from pydantic import BaseModel, Field, ValidationError, create_model
 
+from agentics.core.arrow import (
+    ARROW_BATCH_SIZE,
+    arrow_atype,
+    arrow_schema,
+    iter_arrow_states,
+    iter_batches,
+    pa,
+    pq,
+)
 from agentics.core.async_executor import (
     PydanticTransducerCrewAI,
+    PydanticTransducerLLM,
     PydanticTransducerVLLM,
     aMap,
 )
@@ -41,22 +52,60 @@ from agentics.core.atype import (
     get_pydantic_fields,
     import_pydantic_from_code,
     make_all_fields_optional,
+    pydantic_model_from_columns,
     pydantic_model_from_csv,
     pydantic_model_from_dataframe,
     pydantic_model_from_dict,
     pydantic_model_from_jsonl,
 )
+from agentics.core.cache import get_transduction_cache
+from agentics.core.checkpoint import CheckpointStore, open_checkpoint
+from agentics.core.columns import (
+    ColumnarStates,
+    column_lists,
+    column_values,
+    extend_atype,
+    field_dtype,
+    output_columns,
+    states_to_frame,
+    warn_columnar_copies,
+)
+from agentics.core.concurrency import AdaptiveLimiter, get_limiter
+from agentics.core.csvio import (
+    ShortRowError,
+    iter_arrow_csv_frames,
+    iter_csv_frames,
+    pyarrow_csv_available,
+)
 from agentics.core.errors import AmapError, InvalidStateError
+from agentics.core.export import (
+    EXPORT_CHUNK_SIZE,
+    Compression,
+    ExportFormat,
+    infer_compression,
+    write_sharded,
+    write_states,
+)
+from agentics.core.fewshot import FEW_SHOTS_HEADER, FewShotIndex, format_few_shot
+from agentics.core.jsonio import iter_json_records
 from agentics.core.llm_connections import available_llms, get_llm_provider
 from agentics.core.mapping import AttributeMapping, ATypeMapping
+from agentics.core.prompts import PromptUsage, canonical_json
+from agentics.core.reduce import ReductionIndex, TreeReducer
+from agentics.core.shards import run_sharded
 from agentics.core.utils import (
+    DEFAULT_MAX_WORKERS,
+    cached_model,
     chunk_list,
-    clean_for_json,
+    get_json_schema,
+    get_type_adapter,
     is_str_or_list_of_str,
+    llm_acall,
     make_states_list_model,
     remap_dict_keys,
-    sanitize_dict_keys,
+    sanitize_field_name,
 )
+from agentics.core.workers import ExecutorKind, StateWorkers, is_async_callable
 
 AG = TypeVar("AG", bound="AG")
 T = TypeVar("T", bound="BaseModel")
@@ -84,7 +133,10 @@ class AG(BaseModel, Generic[T]):
         None,
         description="""Python code for the used type""",
     )
-    states: List[BaseModel] = []
+    states: Union[ColumnarStates, List[BaseModel]] = Field(
+        [],
+        description="""The states, either a list of pydantic objects or a ColumnarStates storing one column per field, see to_columnar""",
+    )
     tools: Optional[List[Any]] = Field(None, exclude=True)
     transduce_fields: Optional[List[str]] = Field(
         None,
@@ -118,14 +170,95 @@ class AG(BaseModel, Generic[T]):
         None,
         description="""If not null, the specified file will be created and used to save the intermediate results of transduction from each batch. The file will be updated in real time and can be used for monitoring""",
     )
+    adaptive_concurrency: bool = Field(
+        False,
+        description="""If True, LLM calls go through the AIMD limiter of the llm provider (see agentics.core.concurrency), which raises concurrency while calls are healthy and cuts it on 429s and timeouts, up to max_workers""",
+    )
+    checkpoint_path: Optional[str] = Field(
+        None,
+        description="""If not null, amap and transduction append each completed state to this JSONL checkpoint, keyed by input position and input content hash""",
+    )
+    resume_from_checkpoint: bool = Field(
+        False,
+        description="""If True, states already stored in checkpoint_path for the same input are not recomputed""",
+    )
     transduction_timeout: float | None = None
+    max_workers: int = Field(
+        DEFAULT_MAX_WORKERS,
+        description="Maximum number of states processed concurrently by amap and transduction. Inputs are consumed lazily, so memory stays bounded for any number of states",
+    )
+    shards: int = Field(
+        1,
+        description="""Number of worker processes amap and transduction split states across, each running its own event loop with max_workers // shards concurrent states. Results are reassembled in order. Checkpointing is not used by sharded runs, and deduplicate_transductions only merges duplicates within each shard""",
+    )
     verbose_transduction: bool = True
     verbose_agent: bool = False
+    transduction_cache: Optional[Any] = Field(
+        None,
+        exclude=True,
+        description="""Opt-in persistent cache of transduction outputs, either a TransductionCache or a path to its SQLite file. Outputs are keyed by model id, instructions, target schema and input prompt""",
+    )
+    transduction_cache_mode: Literal["use", "bypass", "refresh"] = Field(
+        "use",
+        description="""use: serve hits from the cache and store misses, bypass: ignore the cache, refresh: recompute every state and overwrite cached outputs""",
+    )
+    transduction_batch_size: int = Field(
+        1,
+        description="""Number of input states packed into a single LLM call. When larger than 1, each call returns a list of outputs which are split back by position, batches with a wrong count or failed validation are transduced again one state at a time""",
+    )
+    sampling_params: Optional[Dict[str, Any]] = Field(
+        None,
+        description="""Extra chat completion parameters for transductions run against an OpenAI-compatible server (llm is an AsyncOpenAI client, e.g. vLLM), such as n_samples, logprobs, temperature or max_tokens""",
+    )
+    few_shot_k: int = Field(
+        5,
+        description="""Maximum number of few shot examples added to each transduction prompt. Few shots are the states of the target AG whose transduce_fields are all filled, paired with the source states at the same position""",
+    )
+    few_shot_strategy: Literal["similar", "random", "first", "all", "none"] = Field(
+        "similar",
+        description="""similar: the few_shot_k examples with the most similar source (TF-IDF), random: a sample seeded by each input, first: in order, all: every example in the shared instructions, none: no few shots""",
+    )
+    few_shot_max_tokens: Optional[int] = Field(
+        2000,
+        description="Approximate token budget of the few shots of each prompt",
+    )
+    deduplicate_transductions: bool = Field(
+        True,
+        description="""If True, identical input prompts are transduced once and the output is copied to all their positions""",
+    )
+    dedup_normalizer: Optional[Callable[[str], str]] = Field(
+        None,
+        exclude=True,
+        description="""Optional function mapping a rendered prompt to the key used for deduplication, e.g. lambda p: " ".join(p.lower().split()) to fold near duplicates. The first prompt of each group is sent""",
+    )
+    deduplicated_calls: int = Field(
+        0,
+        exclude=True,
+        description="Number of LLM calls saved by deduplication in the transduction that returned this AG",
+    )
+    prompt_usage: Optional[Any] = Field(
+        None,
+        exclude=True,
+        description="""PromptUsage of the transduction that returned this AG: prompt tokens served from the provider prompt cache versus uncached ones, when the provider reports them""",
+    )
+    logprobs: Optional[List[Optional[Dict[str, Any]]]] = Field(
+        None,
+        exclude=True,
+        description="""Set on the output of a transduction run with sampling_params={"logprobs": True}: the raw samples and token logprobs of each output state, by position, None for states served from the cache or not transduced""",
+    )
     areduce_batch_size: int = Field(
         10,
         description="The size of the bathes to be used when transduction type is areduce",
     )
-    areduce_batches: List[BaseModel] = []
+    areduce_batches: List[BaseModel] = Field(
+        [],
+        description="The intermediate states of the last areduce transduction, level by level",
+    )
+    areduce_tree: Optional[Any] = Field(
+        None,
+        exclude=True,
+        description="Root ReductionNode of the last areduce transduction, see agentics.core.reduce",
+    )
 
     crew_prompt_params: Optional[Dict[str, str]] = Field(
         {
@@ -150,6 +283,15 @@ class AG(BaseModel, Generic[T]):
         """Returns the list of atype model fields"""
         return list(self.atype.model_fields)
 
+    @property
+    def concurrency_limiter(self) -> Optional[AdaptiveLimiter]:
+        """The adaptive limiter shared by all the AGs using the same llm provider, when enabled"""
+        if not self.adaptive_concurrency:
+            return None
+        limiter = get_limiter(self.llm, max_limit=self.max_workers)
+        limiter.set_max_limit(self.max_workers)
+        return limiter
+
     @property
     def timeout(self):
         return self.transduction_timeout
@@ -179,9 +321,35 @@ class AG(BaseModel, Generic[T]):
 
         sample_size = int(len(self.states) * percent)
         output = self.clone()
-        output.states = random.sample(self.states, sample_size)
+        if isinstance(self.states, ColumnarStates):
+            output.states = self.states.take(
+                random.sample(range(len(self.states)), sample_size)
+            )
+        else:
+            output.states = random.sample(self.states, sample_size)
         return output
 
+    def to_columnar(self) -> AG:
+        """
+        Store the states in a ColumnarStates, one column per atype field, instead of a list of
+        pydantic objects. The AG API is unchanged: states are built on access, and bulk operations
+        (slicing, projection, rebind_atype, merge, product, vmap, to_dataframe) work on columns.
+        amap, apply and transductions keep the columnar backend of their input.
+
+        The states returned by ag[i] and by iteration are copies built from the columns, so
+        changing a field in place (ag[i].field = x) is lost: assign the state back with
+        ag[i] = state, or use amap.
+        """
+        if not isinstance(self.states, ColumnarStates) and self.states:
+            self.states = ColumnarStates.from_states(self.states, self.atype)
+        return self
+
+    def _keep_backend(self, states: List[BaseModel]) -> Union[ColumnarStates, List]:
+        """states in the backend of self.states"""
+        if isinstance(self.states, ColumnarStates) and states:
+            return ColumnarStates.from_states(states, self.atype)
+        return states
+
     #################
     ##### LLMs  #####
     #################
@@ -256,9 +424,18 @@ class AG(BaseModel, Generic[T]):
         return len(self.states)
 
     def __getitem__(self, index: int):
-        """Returns the state for the provided index"""
+        """
+        Returns the state for the provided index. With columnar states it is a new object built
+        from the columns, assign it back (ag[i] = state) to keep changes made to it.
+        """
+        if isinstance(self.states, ColumnarStates):
+            warn_columnar_copies()
         return self.states[index]
 
+    def __setitem__(self, index: int, state: BaseModel):
+        """Replace the state at the provided index"""
+        self.states[index] = state
+
     def append(self, state: BaseModel):
         """Append the state into the list of states"""
         self.states.append(state)
@@ -341,20 +518,79 @@ class AG(BaseModel, Generic[T]):
     ##### aMapReduce Functionalities #####
     ######################################
 
-    async def amap(self, func: StateOperator, timeout=None) -> AG:
-        """Asynchronous map with exception-safe job gathering"""
-
-        mapper = aMap(func=func, timeout=timeout)
+    async def amap(
+        self,
+        func: StateOperator,
+        timeout=None,
+        max_workers: Optional[int] = None,
+        resume: Optional[bool] = None,
+        executor: Optional[ExecutorKind] = None,
+        shards: Optional[int] = None,
+    ) -> AG:
+        """Asynchronous map with exception-safe job gathering.
+        At most `max_workers` (default: self.max_workers) states are processed concurrently.
+        `func` can be a coroutine function, or a plain function run in a pool of threads or, with
+        executor="process", of processes (func must then be defined at module level), one per CPU
+        unless max_workers is given.
+        With `shards` (default: self.shards) larger than 1, states are split across as many
+        worker processes, each with its own event loop (see run_sharded).
+        When checkpoint_path is set, each state is checkpointed as soon as it completes and
+        `resume` (default: self.resume_from_checkpoint) skips the states completed by a previous run.
+        """
+        # process pools default to one worker per CPU rather than self.max_workers
+        pool_size = max_workers if executor == "process" else None
+        max_workers = max_workers or self.max_workers
         hints = get_type_hints(func)
         if "state" in hints and not issubclass(hints["state"], self.atype):
             raise AmapError(
                 f"The input type {hints['state']} of the provided function is not a subclass of the required atype {self.atype}"
             )
+        output_type = None
         if "return" in hints and issubclass(hints["return"], BaseModel):
-            self.atype = hints["return"]
-        try:
+            output_type = hints["return"]
+
+        shards = shards or self.shards
+        if shards > 1 and len(self.states) > 1:
+            output = await self._sharded_amap(
+                func, shards, output_type, timeout=timeout, executor=executor
+            )
+            if output is not None:
+                return output
+        if output_type is not None:
+            self.atype = output_type
+
+        workers = None
+        if executor is not None or not is_async_callable(func):
+            workers = StateWorkers(
+                func,
+                executor or "thread",
+                pool_size or max_workers,
+                output_type=output_type,
+            )
+        mapper = aMap(func=workers or func, timeout=timeout, max_workers=max_workers)
+
+        async def run(states, on_result):
             results = await mapper.execute(
-                *self.states, description=f"Executing amap on {func.__name__}"
+                *states,
+                description=f"Executing amap on {func.__name__}",
+                on_result=on_result,
+            )
+            return results if isinstance(results, list) else [results]
+
+        try:
+            results = await self._checkpointed(
+                run,
+                self.states,
+                (
+                    [
+                        CheckpointStore.hash_input(func.__qualname__, state)
+                        for state in self.states
+                    ]
+                    if self.checkpoint_path
+                    else []
+                ),
+                self.atype,
+                self.resume_from_checkpoint if resume is None else resume,
             )
             if self.transduction_logs_path:
                 with open(self.transduction_logs_path, "a") as f:
@@ -363,6 +599,9 @@ class AG(BaseModel, Generic[T]):
 
         except Exception:
             results = self.states
+        finally:
+            if workers is not None:
+                workers.close()
 
         _states = []
         n_errors = 0
@@ -378,25 +617,247 @@ class AG(BaseModel, Generic[T]):
             if n_errors:
                 logger.debug(f"Error, {n_errors} states have not been transduced")
 
-        self.states = _states
+        self.states = self._keep_backend(_states)
+        return self
+
+    async def _sharded_amap(
+        self,
+        func: StateOperator,
+        shards: int,
+        output_type: Optional[Type[BaseModel]],
+        **kwargs,
+    ) -> Optional[AG]:
+        """
+        amap over shards, states that were not transformed keep the input atype. None when the
+        run can't be sharded, see run_sharded
+        """
+        output_type = output_type or self.atype
+        results = await run_sharded(
+            self, "amap", func, len(self.states), shards, **kwargs
+        )
+        if results is None:
+            return None
+        self.states = [
+            (output_type if transformed else self.atype).model_validate_json(data)
+            for shard in results
+            for transformed, data in shard
+        ]
+        self.atype = output_type
         return self
 
-    async def apply(self, func: StateOperator, first_n: Optional[int] = None) -> AG:
+    async def _checkpointed(
+        self,
+        run: Callable[[List[Any], Optional[Callable[[int, Any], None]]], Any],
+        inputs: List[Any],
+        hashes: List[str],
+        output_type: Type[BaseModel],
+        resume: bool,
+    ) -> List[Any]:
+        """
+        Execute `run(inputs, on_result)`, appending each output to the checkpoint store as soon as
+        it completes. When resuming, inputs whose position and hash match a stored output are
+        skipped and the stored outputs are merged back in position.
+        """
+        store, completed = open_checkpoint(self.checkpoint_path, hashes, resume)
+        if store is None:
+            return await run(inputs, None)
+
+        results: List[Any] = [None] * len(inputs)
+        for i, state in completed.items():
+            try:
+                results[i] = output_type.model_validate(state)
+            except ValidationError:
+                pass
+        todo = [i for i, result in enumerate(results) if result is None]
+
+        def on_result(j: int, output: Any):
+            if isinstance(output, BaseModel):
+                store.append(todo[j], hashes[todo[j]], output)
+
+        # finished states are already flushed, closing also on cancellation or Ctrl-C
+        with store:
+            if todo:
+                outputs = await run([inputs[i] for i in todo], on_result)
+                for i, output in zip(todo, outputs):
+                    results[i] = output
+        return results
+
+    async def _deduplicated(
+        self,
+        run: Callable[[List[str], Optional[Callable[[int, Any], None]]], Any],
+        prompts: List[str],
+        on_result: Optional[Callable[[int, Any], None]] = None,
+        saved: Optional[List[int]] = None,
+    ) -> List[Any]:
+        """
+        Execute `run` only on the distinct prompts, compared after dedup_normalizer, and fan each
+        output back out to all the positions of its prompt. Duplicates get their own deep copy.
+        The number of calls saved is appended to `saved`.
+        """
+        if not self.deduplicate_transductions:
+            return await run(prompts, on_result)
+        unique_positions: Dict[str, int] = {}
+        unique_prompts: List[str] = []
+        members: List[List[int]] = []
+        for i, prompt in enumerate(prompts):
+            key = self.dedup_normalizer(prompt) if self.dedup_normalizer else prompt
+            j = unique_positions.get(key)
+            if j is None:
+                j = unique_positions[key] = len(unique_prompts)
+                unique_prompts.append(prompt)
+                members.append([])
+            members[j].append(i)
+        if len(unique_prompts) == len(prompts):
+            return await run(prompts, on_result)
+
+        def fan_out(j: int, output: Any):
+            for i in members[j]:
+                on_result(i, output)
+
+        outputs = await run(unique_prompts, fan_out if on_result else None)
+        if saved is not None:
+            saved.append(len(prompts) - len(unique_prompts))
+        results: List[Any] = [None] * len(prompts)
+        for j, output in enumerate(outputs):
+            for k, i in enumerate(members[j]):
+                results[i] = (
+                    output.model_copy(deep=True)
+                    if k and isinstance(output, BaseModel)
+                    else output
+                )
+        return results
+
+    async def amap_stream(
+        self,
+        func: StateOperator,
+        states: Optional[Union[Iterable[BaseModel], AsyncIterable[BaseModel]]] = None,
+        timeout=None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, BaseModel]]:
+        """
+        Streaming version of amap: yields `(index, state)` pairs as soon as each state is processed,
+        in completion order. States are taken from `states` (any iterable or async iterable) or from
+        self.states, and consumed lazily. States that fail are yielded unchanged. self is not modified.
+        """
+        hints = get_type_hints(func)
+        if (
+            "state" in hints
+            and self.atype
+            and not issubclass(hints["state"], self.atype)
+        ):
+            raise AmapError(
+                f"The input type {hints['state']} of the provided function is not a subclass of the required atype {self.atype}"
+            )
+        mapper = aMap(
+            func=func, timeout=timeout, max_workers=max_workers or self.max_workers
+        )
+
+        # states are kept only while in flight, to be returned unchanged on failure
+        pending: Dict[int, BaseModel] = {}
+        states = self.states if states is None else states
+        if isinstance(states, AsyncIterable):
+
+            async def inputs():
+                index = 0
+                async for state in states:
+                    pending[index] = state
+                    yield state
+                    index += 1
+
+            inputs = inputs()
+        else:
+            inputs = (pending.setdefault(i, state) for i, state in enumerate(states))
+
+        async for i, result in mapper.stream(inputs):
+            state = pending.pop(i)
+            if isinstance(result, Exception):
+                if self.verbose_transduction:
+                    logger.debug(f"⚠️ Error processing state {i}: {result}")
+                result = state
+            if self.transduction_logs_path:
+                with open(self.transduction_logs_path, "a") as f:
+                    f.write(result.model_dump_json() + "\n")
+            yield i, result
+
+    async def apply(
+        self,
+        func: StateOperator,
+        first_n: Optional[int] = None,
+        executor: Optional[ExecutorKind] = None,
+        max_workers: Optional[int] = None,
+    ) -> AG:
         """
         Applies a function to each state in the Agentics object.
 
         Parameters:
         - func: A function that takes a Pydantic model (a state) and returns a modified Pydantic model.
+        - executor: "thread" or "process" to apply func in a pool of max_workers (default:
+          self.max_workers threads, or one process per CPU) workers instead of the calling
+          thread. States keep their order.
 
         Returns:
         - A new Agentics object with the transformed states.
         """
-        if first_n is None:
-            self.states = [func(state) for state in self.states]
+        n = len(self.states) if first_n is None else first_n
+        if executor is None:
+            outputs = [func(state) for state in self.states[:n]]
         else:
-            self.states = [
-                func(state) for state in self.states[:first_n]
-            ] + self.states[first_n:]
+            if executor == "thread":
+                max_workers = max_workers or self.max_workers
+            with StateWorkers(func, executor, max_workers) as workers:
+                outputs = await asyncio.gather(
+                    *(workers(state) for state in self.states[:n])
+                )
+        self.states = self._keep_backend(list(outputs) + list(self.states[n:]))
+        return self
+
+    async def vmap(
+        self,
+        func: Callable[..., Any],
+        fields: Optional[List[str]] = None,
+        output_fields: Optional[List[str]] = None,
+        column_format: Literal["numpy", "pandas"] = "numpy",
+    ) -> AG:
+        """
+        Vectorized map: calls func once on whole columns instead of once per state.
+
+        With column_format="numpy", func gets one NumPy array per field in `fields` (default: all
+        the fields of atype) as keyword arguments, with "pandas" a DataFrame of those fields.
+        It returns a dict or DataFrame of output columns, or a single column written to
+        output_fields[0] (default: the only input field). Missing values are NaN in numeric
+        columns and None otherwise, and NaN in outputs is written back as None. Output fields not
+        in atype are added to it. States are rebuilt in bulk without per-field validation.
+        """
+        if not self.states:
+            return self
+        atype = self.atype or type(self.states[0])
+        fields = fields or list(atype.model_fields)
+        frame = states_to_frame(self.states, fields)
+        if column_format == "pandas":
+            result = func(frame)
+        elif column_format == "numpy":
+            result = func(**{field: frame[field].to_numpy() for field in fields})
+        else:
+            raise ValueError(f"Unknown column format {column_format}")
+
+        columns = output_columns(result, output_fields, fields)
+        values = {
+            name: column_values(column, len(self.states), name)
+            for name, column in columns.items()
+        }
+        if not values:
+            return self
+        self.atype = extend_atype(atype, columns)
+        if isinstance(self.states, ColumnarStates):
+            self.states = self.states.with_columns(self.atype, values)
+            return self
+        self.states = [
+            self.atype.model_construct(
+                _fields_set=state.model_fields_set | values.keys(),
+                **{**state.__dict__, **dict(zip(values, row))},
+            )
+            for state, row in zip(self.states, zip(*values.values()))
+        ]
         return self
 
     async def areduce(self, func: StateReducer) -> AG:
@@ -434,6 +895,11 @@ class AG(BaseModel, Generic[T]):
         atype: Type[BaseModel] = None,
         max_rows: int = None,
         task_description: str = None,
+        usecols: Optional[List[str]] = None,
+        trusted: bool = False,
+        chunk_size: int = 100_000,
+        engine: Optional[Literal["c", "pyarrow"]] = None,
+        columnar: bool = False,
     ):
         """
         Import an Agentics (AG) from CSV.
@@ -443,16 +909,25 @@ class AG(BaseModel, Generic[T]):
         - a text or binary stream (StringIO, BytesIO, file handle)
         - a Streamlit UploadedFile
         - a raw CSV string
-        If `atype` is not provided, it is inferred from the header with
-        `pydantic_model_from_csv` and all fields are optional strings.
+        If `atype` is not provided, it is inferred from the header and all fields are optional
+        strings.
+
+        Rows are parsed in chunks and each chunk is validated at once with a cached TypeAdapter
+        of List[atype]. Values are read as strings, empty cells included.
+        - usecols: only parse these columns
+        - trusted: skip validation for files known to match atype. int, float and bool fields
+          are parsed by the CSV reader, empty cells as None, and the parsed columns are stored as
+          they are in ColumnarStates, without building a pydantic object per row
+        - engine: "pyarrow" (the default when pyarrow is installed) streams the file one block at
+          a time through the pyarrow CSV reader, files with short rows are parsed again with the
+          csv module so that their missing cells are None. "c" (the default otherwise) parses
+          `chunk_size` rows at a time with the pandas C parser, which reads missing cells as
+          empty strings
+        - columnar: store the states as ColumnarStates (see to_columnar)
         """
 
         def _to_text_stream(src) -> io.TextIOBase:
-            # 1) Path on disk
-            if isinstance(src, (str, os.PathLike)) and os.path.exists(src):
-                # use utf-8-sig to gracefully handle a BOM if present
-                return open(src, "r", encoding="utf-8-sig", newline="")
-
+            # 1) Paths on disk are read by pandas directly
             # 2) Raw CSV string (heuristic: contains a newline or a comma)
             if isinstance(src, str) and ("\n" in src or "," in src):
                 return io.StringIO(src)
@@ -460,7 +935,7 @@ class AG(BaseModel, Generic[T]):
             # 3) Streamlit UploadedFile (has getbuffer/getvalue)
             if hasattr(src, "getbuffer"):
                 return io.StringIO(src.getbuffer().tobytes().decode("utf-8-sig"))
-            if hasattr(src, "getvalue"):
+            if hasattr(src, "getvalue") and not isinstance(src, io.TextIOBase):
                 return io.StringIO(src.getvalue().decode("utf-8-sig"))
 
             # 4) Already a text stream
@@ -481,55 +956,131 @@ class AG(BaseModel, Generic[T]):
 
             raise TypeError(f"Unsupported CSV input type: {type(src).__name__}")
 
-        # Decide/Infer atype first (works with path/stream/string)
         if atype is not None:
-            new_type = atype
-            if "logger" in globals():
-                logger.debug(
-                    f"Importing Agentics of type {atype.__name__} from CSV {type(csv_file).__name__}"
-                )
-        else:
-            # pydantic_model_from_csv already handles path/stream/string
-            new_type = make_all_fields_optional(pydantic_model_from_csv(csv_file))
+            logger.debug(
+                f"Importing Agentics of type {atype.__name__} from CSV {type(csv_file).__name__}"
+            )
 
-        # Normalize to a text stream for DictReader
-        f = _to_text_stream(csv_file)
-        close_after = isinstance(csv_file, (str, os.PathLike)) and os.path.exists(
+        source = (
             csv_file
+            if isinstance(csv_file, (str, os.PathLike)) and os.path.exists(csv_file)
+            else _to_text_stream(csv_file)
         )
+        read_options = dict(
+            dtype=str,
+            keep_default_na=False,
+            usecols=usecols,
+            nrows=max_rows,
+            encoding="utf-8-sig",
+        )
+        if trusted and atype is not None:
+            # values are not validated, so typed columns are parsed by pandas
+            dtypes = {
+                name: field_dtype(field.annotation)
+                for name, field in atype.model_fields.items()
+            }
+            typed = {name: dtype for name, dtype in dtypes.items() if dtype}
+            read_options["dtype"] = {name: typed.get(name, str) for name in dtypes}
+            read_options["na_values"] = {
+                name: [""] for name, dtype in typed.items() if dtype != "string"
+            }
+        engine = engine or ("pyarrow" if pyarrow_csv_available() else "c")
+        if engine == "pyarrow" and isinstance(source, io.TextIOBase):
+            # the pyarrow reader parses bytes
+            source = io.BytesIO(source.read().encode("utf-8"))
+
+        def parsed_chunks():
+            if isinstance(source, io.BytesIO):
+                source.seek(0)
+            if engine == "c" or trusted:
+                return pd.read_csv(
+                    source, engine="c", chunksize=chunk_size, **read_options
+                )
+            return iter_csv_frames(source, usecols, max_rows, chunk_size)
 
-        try:
+        def load(chunks):
+            new_type = atype
             states: List[BaseModel] = []
-            reader = csv.DictReader(f)
-            if not reader.fieldnames:
-                raise ValueError("CSV appears to have no header row.")
-
-            for c_row, row in enumerate(reader):
-                if max_rows is not None and c_row >= max_rows:
-                    break
-                # Build the state using the inferred/provided Pydantic model
-                state = new_type(**row)
-                states.append(state)
-
-        finally:
-            # Only close if we opened a real file path
-            if close_after:
-                f.close()
+            frames: List[pd.DataFrame] = []
+            for chunk in chunks:
+                if new_type is None:
+                    new_type = make_all_fields_optional(
+                        pydantic_model_from_columns(list(chunk.columns))
+                    )
+                chunk = chunk.rename(
+                    columns={
+                        c: sanitize_field_name(c)
+                        for c in chunk.columns
+                        if c not in new_type.model_fields
+                        and sanitize_field_name(c) in new_type.model_fields
+                    }
+                )
+                fields = [c for c in chunk.columns if c in new_type.model_fields]
+                if trusted:
+                    frames.append(chunk[fields])
+                    continue
+                columns = column_lists(chunk, fields)
+                chunk_states = get_type_adapter(List[new_type]).validate_python(
+                    [dict(zip(fields, row)) for row in zip(*columns.values())]
+                )
+                if columnar:
+                    frames.append(
+                        ColumnarStates.from_states(chunk_states, new_type).frame
+                    )
+                else:
+                    states.extend(chunk_states)
+            return new_type, states, frames
 
-        return cls(states=states, atype=new_type, task_description=task_description)
+        try:
+            if engine == "pyarrow":
+                try:
+                    new_type, states, frames = load(
+                        iter_arrow_csv_frames(
+                            source, usecols, max_rows, atype if trusted else None
+                        )
+                    )
+                except ShortRowError:
+                    # rows with missing cells are read again by the default parser
+                    logger.debug("CSV has short rows, parsing it without pyarrow")
+                    new_type, states, frames = load(parsed_chunks())
+            else:
+                new_type, states, frames = load(parsed_chunks())
+        except pd.errors.EmptyDataError:
+            raise ValueError("CSV appears to have no header row.")
+
+        if columnar or trusted:
+            states = ColumnarStates.from_frame(
+                new_type,
+                pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(),
+                validate=False,
+            )
+        output = cls(atype=new_type, task_description=task_description)
+        # the states already are instances of new_type, AG doesn't need to check them again
+        output.states = states
+        return output
 
     @classmethod
     def from_dataframe(
-        cls, dataframe: DataFrame, atype: Type[BaseModel] = None, max_rows: int = None
+        cls,
+        dataframe: DataFrame,
+        atype: Type[BaseModel] = None,
+        max_rows: int = None,
+        columnar: bool = False,
     ) -> AG:
         """
         Import an object of type Agentics from a Pandas DataFrame object.
         If atype is not provided it will be automatically inferred from the column names and
-        all attributes will be set as strings
+        all attributes will be set as strings.
+        With columnar=True the states are validated chunk by chunk and stored as ColumnarStates.
         """
         states: List[BaseModel] = []
         new_type = atype or pydantic_model_from_dataframe(dataframe)
         logger.debug(f"Importing Agentics of type {new_type.__name__} from DataFrame")
+        if columnar:
+            frame = dataframe.head(max_rows) if max_rows else dataframe
+            return cls(
+                states=ColumnarStates.from_frame(new_type, frame), atype=new_type
+            )
 
         for i, row in dataframe.iterrows():
             if max_rows and i >= max_rows:
@@ -545,44 +1096,129 @@ class AG(BaseModel, Generic[T]):
         atype: Optional[Type[BaseModel]] = None,
         max_rows: Optional[int] = None,
         jsonl: bool = True,
+        chunk_size: int = 10_000,
     ) -> AG:
         """
-        Import an object of type Agentics from jsonl file.
+        Import an object of type Agentics from jsonl file, or from a json array if jsonl=False.
         If atype is not provided it will be automatically inferred from the json schema.
+        Records are parsed incrementally, stopping after max_rows, and validated chunk_size at a
+        time.
         """
+        new_type = cls._json_atype(path_to_json_file, atype, jsonl, max_rows)
+        states = cls.iter_jsonl(
+            path_to_json_file,
+            atype=new_type,
+            max_rows=max_rows,
+            jsonl=jsonl,
+            chunk_size=chunk_size,
+        )
+        return cls(states=list(states), atype=new_type)
+
+    @classmethod
+    def _json_atype(
+        cls,
+        path_to_json_file: str,
+        atype: Optional[Type[BaseModel]],
+        jsonl: bool,
+        max_rows: Optional[int] = None,
+    ) -> Type[BaseModel]:
+        if atype:
+            return atype
         if jsonl:
-            states: List = []
-            c_row = 0
-            new_type = None
-            if atype:
-                new_type = atype
-            else:
-                new_type = pydantic_model_from_jsonl(path_to_json_file)
-            for line in open(path_to_json_file, encoding="utf-8"):
-                if not max_rows or c_row < max_rows:
-                    state_dict = sanitize_dict_keys(json.loads(line))
-                    states.append(new_type(**state_dict))
-                c_row += 1
-            return cls(states=states, atype=new_type)
-        else:
-            c_row = 0
-            input_states = json.load(open(path_to_json_file, encoding="utf-8"))
-            states = []
-            if atype:
-                new_type = atype
-            else:
-                new_type = (
-                    pydantic_model_from_dict(input_states[0])
-                    if len(input_states) > 0
-                    else BaseModel
-                )
+            return pydantic_model_from_jsonl(
+                path_to_json_file, sample_size=min(100, max_rows or 100)
+            )
+        first = next(
+            iter_json_records(path_to_json_file, jsonl=False, max_rows=1), None
+        )
+        return pydantic_model_from_dict(first) if first is not None else BaseModel
 
-            for state in input_states:
-                if not max_rows or c_row < max_rows:
-                    state_dict = sanitize_dict_keys(state)
-                    states.append(new_type(**state_dict))
-                c_row += 1
-            return cls(states=states, atype=new_type)
+    @classmethod
+    def iter_jsonl(
+        cls,
+        path_to_json_file: str,
+        atype: Optional[Type[BaseModel]] = None,
+        max_rows: Optional[int] = None,
+        jsonl: bool = True,
+        chunk_size: int = 1000,
+    ) -> Iterator[BaseModel]:
+        """
+        Lazily read the states of a jsonl file (or json array if jsonl=False) as atype, inferred
+        as in from_jsonl if not provided. Only chunk_size records are in memory at a time, so the
+        iterator can be passed directly to astream or amap_stream for files larger than memory.
+
+        Usage:
+            async for i, state in target.astream(AG.iter_jsonl("data.jsonl", atype=Question)):
+                ...
+        """
+        new_type = cls._json_atype(path_to_json_file, atype, jsonl, max_rows)
+        adapter = get_type_adapter(List[new_type])
+        records = iter_json_records(path_to_json_file, jsonl=jsonl, max_rows=max_rows)
+        while chunk := list(islice(records, chunk_size)):
+            yield from adapter.validate_python(chunk)
+
+    @classmethod
+    def from_arrow(
+        cls,
+        data: Any,
+        atype: Optional[Type[BaseModel]] = None,
+        max_rows: Optional[int] = None,
+        transduce_fields: Optional[List[str]] = None,
+        batch_size: int = ARROW_BATCH_SIZE,
+    ) -> AG:
+        """
+        Import an object of type Agentics from a pyarrow Table, RecordBatch or RecordBatchReader.
+        If atype is not provided it will be inferred from the Arrow schema, see from_parquet
+        for transduce_fields.
+        """
+        new_type = arrow_atype(data, atype, transduce_fields)
+        states = iter_arrow_states(
+            data, new_type, max_rows, transduce_fields, batch_size
+        )
+        return cls(
+            states=list(states), atype=new_type, transduce_fields=transduce_fields
+        )
+
+    @classmethod
+    def from_parquet(
+        cls,
+        path: str,
+        atype: Optional[Type[BaseModel]] = None,
+        max_rows: Optional[int] = None,
+        transduce_fields: Optional[List[str]] = None,
+        batch_size: int = ARROW_BATCH_SIZE,
+    ) -> AG:
+        """
+        Import an object of type Agentics from a parquet file, read one row group at a time.
+        If atype is not provided it will be inferred from the Arrow schema.
+        Only the columns of transduce_fields are read when given (otherwise those of atype),
+        and they are set as the transduce_fields of the returned AG. Requires pyarrow.
+        """
+        new_type = arrow_atype(path, atype, transduce_fields)
+        states = cls.iter_parquet(
+            path, new_type, max_rows, transduce_fields, batch_size
+        )
+        return cls(
+            states=list(states), atype=new_type, transduce_fields=transduce_fields
+        )
+
+    @classmethod
+    def iter_parquet(
+        cls,
+        path: str,
+        atype: Optional[Type[BaseModel]] = None,
+        max_rows: Optional[int] = None,
+        transduce_fields: Optional[List[str]] = None,
+        batch_size: int = ARROW_BATCH_SIZE,
+    ) -> Iterator[BaseModel]:
+        """
+        Lazily read the states of a parquet file as in from_parquet, batch_size rows at a time,
+        e.g. as the input of astream for files larger than memory.
+        """
+        new_type = arrow_atype(path, atype, transduce_fields)
+        yield from iter_arrow_states(
+            path, new_type, max_rows, transduce_fields, batch_size
+        )
 
     ##################################
     ##### Export Functionalities #####
@@ -601,28 +1237,85 @@ class AG(BaseModel, Generic[T]):
         print(output)
         return output
 
-    def to_csv(self, csv_file: str) -> Any:
+    def to_csv(
+        self,
+        csv_file: str,
+        compression: Optional[Compression] = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+        shards: int = 1,
+    ) -> List[str]:
+        """
+        Export the states to CSV, with a column per atype field. Nested fields are written as
+        JSON. See to_jsonl for compression, chunk_size and shards.
+        """
         if self.verbose_transduction:
             logger.debug(f"Exporting {len(self.states)} Agentics to CSV {csv_file}")
-        field_names = self.atype.model_fields.keys()
-        with open(csv_file, mode="w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=field_names)
-            writer.writeheader()
-            for state in self.states:
-                writer.writerow(state.model_dump())
-
-    def to_jsonl(self, jsonl_file: str) -> Any:
+        return self._export(csv_file, "csv", compression, chunk_size, shards)
+
+    def to_jsonl(
+        self,
+        jsonl_file: str,
+        compression: Optional[Compression] = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+        shards: int = 1,
+    ) -> List[str]:
+        """
+        Export the states to jsonl, serialized chunk_size states at a time by pydantic-core.
+        The file is compressed with gzip or zstd (which requires zstandard) when compression is
+        given or the file name ends with .gz or .zst. With shards > 1 the states are split in
+        files named like out-00000-of-00004.jsonl, written in parallel.
+        Returns the paths of the written files.
+        """
         if self.verbose_transduction:
             logger.debug(
                 f"Exporting {len(self.states)} states or atype {self.atype} to {jsonl_file}"
             )
-        with open(jsonl_file, mode="w", newline="", encoding="utf-8") as f:
-            for state in self.states:
-                try:
-                    f.write(json.dumps(clean_for_json(state)) + "\n")
-                except Exception as e:
-                    logger.debug(f"⚠️ Failed to serialize state: {e}")
-                    f.write(json.dumps(self.atype().model_dump()))
+        return self._export(jsonl_file, "jsonl", compression, chunk_size, shards)
+
+    def _export(
+        self,
+        path: str,
+        format: ExportFormat,
+        compression: Optional[Compression],
+        chunk_size: int,
+        shards: int,
+    ) -> List[str]:
+        path = os.fspath(path)
+        options = dict(
+            format=format,
+            compression=compression or infer_compression(path),
+            chunk_size=chunk_size,
+        )
+        if shards > 1 and len(self.states) > 1:
+            return write_sharded(path, self.states, self.atype, shards, **options)
+        write_states(path, self.states, self.atype, **options)
+        return [path]
+
+    def to_arrow(self, chunk_size: int = EXPORT_CHUNK_SIZE) -> Any:
+        """
+        Converts the states into a pyarrow Table with the schema of the atype. Fields that
+        can't be represented in Arrow are stored as JSON strings. Requires pyarrow.
+        """
+        batches = list(iter_batches(self.states, self.atype, chunk_size))
+        return pa.Table.from_batches(batches, schema=arrow_schema(self.atype))
+
+    def to_parquet(
+        self,
+        path: str,
+        compression: str = "snappy",
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> List[str]:
+        """
+        Export the states to a parquet file, converting and writing chunk_size states at a
+        time, one row group each. Returns the paths of the written files. Requires pyarrow.
+        """
+        if self.verbose_transduction:
+            logger.debug(f"Exporting {len(self.states)} states to parquet {path}")
+        schema = arrow_schema(self.atype)
+        with pq.ParquetWriter(path, schema, compression=compression) as writer:
+            for batch in iter_batches(self.states, self.atype, chunk_size):
+                writer.write_batch(batch)
+        return [os.fspath(path)]
 
     def to_dataframe(self) -> DataFrame:
         """
@@ -631,6 +1324,8 @@ class AG(BaseModel, Generic[T]):
         Returns:
             DataFrame: A pandas DataFrame representing the current states.
         """
+        if isinstance(self.states, ColumnarStates):
+            return pd.DataFrame(column_lists(self.states.frame))
         data = [state.model_dump() for state in self.states]
         return pd.DataFrame(data)
 
@@ -646,196 +1341,614 @@ class AG(BaseModel, Generic[T]):
         from agentics.core.atype import AGString
 
         async def llm_call(input: AGString) -> AGString:
-            input.string = self.llm.call(input.string)
+            input.string = await llm_acall(self.llm, input.string)
             return input
 
         if not self.atype and isinstance(other, str):
-            return self.llm.call(other)
+            return await llm_acall(self.llm, other)
 
         if not self.atype and is_str_or_list_of_str(other):
             if self.transduction_type == "amap":
-                input_messages = AG(states=[AGString(string=x) for x in other])
+                input_messages = AG(
+                    states=[AGString(string=x) for x in other],
+                    llm=self.llm,
+                    max_workers=self.max_workers,
+                )
                 input_messages = await input_messages.amap(llm_call)
                 return [x.string for x in input_messages.states]
 
         if self.transduction_type == "areduce":
-            if is_str_or_list_of_str(other):
-                chunks = chunk_list(other, chunk_size=self.areduce_batch_size)
-            else:
-                chunks = chunk_list(other.states, chunk_size=self.areduce_batch_size)
-            if len(chunks) == 1:
-                self.transduction_type = "amap"
-                self = await (self << str(chunks[0]))
-                self.transduction_type = "areduce"
-                return self
-            else:
-                self.transduction_type = "amap"
-                reduced_chunks = await (self << [str(x) for x in chunks])
-                self.transduction_type = "areduce"
-                self.areduce_batches += reduced_chunks.states
-                return await (self << reduced_chunks)
+            return await self._tree_reduce(other)
 
+        if self.shards > 1 and isinstance(other, (AG, list)) and len(other) > 1:
+            output = await self._sharded_transduction(other)
+            if output is not None:
+                return output
+        return await self._transduce(other)
+
+    async def _transduce(
+        self, other: Any, span: Optional[Tuple[int, int]] = None
+    ) -> AG:
+        """
+        Transduction of other into the states of self. With span=(start, end) only the inputs at
+        those positions are transduced, few shots are still drawn from all the states.
+        """
         output = self.clone()
         output.states = []
 
-        input_prompts = (
-            []
-        )  # gather input prompts for transduction by dumping input states
+        # gather input prompts for transduction by dumping input states
         target_type = (
             self.subset_atype(self.transduce_fields)
             if self.transduce_fields
             else self.atype
         )
+        start, end = span or (0, None)
         if isinstance(other, AG):
-            if other.prompt_template:
-                prompt_template = PromptTemplate.from_template(other.prompt_template)
-            else:
-                prompt_template = None
-            i = 0
-            for i in range(len(other.states)):
-                if prompt_template:
-                    input_prompts.append(
-                        "SOURCE:\n"
-                        + prompt_template.invoke(
-                            other.states[i].model_dump(include=other.transduce_fields)
-                        ).text
-                    )
-                else:
-                    input_prompts.append(
-                        "SOURCE:\n"
-                        + json.dumps(
-                            other.states[i].model_dump(include=other.transduce_fields)
-                        )
-                    )
-
+            prompt_template = (
+                PromptTemplate.from_template(other.prompt_template)
+                if other.prompt_template
+                else None
+            )
+            input_prompts = [
+                self._render_source(state, prompt_template, other.transduce_fields)
+                for state in (other.states[start:end] if span else other.states)
+            ]
         elif is_str_or_list_of_str(other):
             if isinstance(other, str):
                 other = [other]
-            input_prompts = ["\nSOURCE:\n" + x for x in other]
+            input_prompts = [self._render_source(x) for x in other[start:end]]
         elif isinstance(other, list):
             try:
-                input_prompts = ["\nSOURCE:\n" + str(x) for x in other]
+                input_prompts = [self._render_source(x) for x in other[start:end]]
             except:
                 return ValueError
         else:
             try:
-                input_prompts = ["\nSOURCE:\n" + str(other)]
+                input_prompts = [self._render_source(other)]
             except:
                 return ValueError
 
-        ## collect few shots, only when all target slots are non null TODO need to improve with some non null
-        instructions = ""
-
-        # Add instructions
-        if self.skip_intentional_definition:
-            instructions = f"{self.instructions}" if self.instructions else "\n"
-        else:
-            instructions += "\nYour task is to transduce a source Pydantic Object into the specified Output type. Generate only slots that are logically deduced from the input information, otherwise live then null.\n"
-            if self.instructions:
-                instructions += (
-                    "\nRead carefully the following instructions for executing your task:\n"
-                    + self.instructions
-                )
-
-        # Gather few shots
-        few_shots = ""
-        for i in range(len(self.states)):
-            if self.states[i] and get_active_fields(
-                self.states[i], allowed_fields=set(self.transduce_fields)
-            ) == set(self.transduce_fields):
-                few_shots += (
-                    "Example\nSOURCE:\n"
-                    + other.states[i].model_dump_json(include=other.transduce_fields)
-                    + "\nTARGET:\n"
-                    + self.states[i].model_dump_json(include=self.transduce_fields)
-                    + "\n"
-                )
-        if len(few_shots) > 0:
-            instructions += (
-                "Here is a list of few shots examples for your task:\n" + few_shots
-            )
+        few_shots = self._few_shot_index(other)
+        input_prompts = [
+            self._add_few_shots(few_shots, i, prompt)
+            for i, prompt in enumerate(input_prompts, start)
+        ]
 
         # Perform Transduction
-        transducer_class = (
-            PydanticTransducerCrewAI
-            if type(self.llm) == LLM
-            else PydanticTransducerVLLM
-        )
-        try:
-            transduced_type = (
-                self.subset_atype(self.transduce_fields)
-                if self.transduce_fields
-                else self.atype
+        transduction_cache = get_transduction_cache(self.transduction_cache)
+        if transduction_cache is not None:
+            cache_hits, cache_misses = (
+                transduction_cache.hits,
+                transduction_cache.misses,
             )
-            pt = transducer_class(
-                transduced_type,
-                tools=self.tools,
-                llm=self.llm,
-                intentional_definiton=instructions,
-                verbose=self.verbose_agent,
-                max_iter=self.max_iter,
-                timeout=self.timeout,
-                reasoning=self.reasoning,
-                **self.crew_prompt_params,
-            )
-            transduced_results = await pt.execute(
-                *input_prompts,
-                description=f"Transducing {self.__name__} << {'AG[str]' if not isinstance(other, AG) else other.__name__}",
-                transient_pbar=self.transient_pbar,
+        usage = PromptUsage()
+        saved: List[int] = []
+        logprobs: Dict[str, Any] = {}
+        try:
+            instructions = self._transduction_instructions(few_shots)
+            description = f"Transducing {self.__name__} << {'AG[str]' if not isinstance(other, AG) else other.__name__}"
+
+            async def dispatch(prompts, on_result):
+                if self.transduction_batch_size > 1 and len(prompts) > 1:
+                    return await self._batched_transduction(
+                        prompts,
+                        instructions,
+                        description,
+                        on_result=on_result,
+                        usage=usage,
+                    )
+                pt = self._make_transducer(instructions, usage=usage, logprobs=logprobs)
+                return await pt.execute(
+                    *prompts,
+                    description=description,
+                    transient_pbar=self.transient_pbar,
+                    on_result=on_result,
+                )
+
+            transduced_results = await self._checkpointed(
+                partial(self._deduplicated, dispatch, saved=saved),
+                input_prompts,
+                (
+                    [
+                        CheckpointStore.hash_input(
+                            instructions, get_json_schema(target_type), prompt
+                        )
+                        for prompt in input_prompts
+                    ]
+                    if self.checkpoint_path
+                    else []
+                ),
+                target_type,
+                self.resume_from_checkpoint,
             )
         except Exception as e:
-            transduced_results = self.states
+            transduced_results = self.states[start:end] if span else self.states
 
         n_errors = 0
         output_states = []
-        for i, result in enumerate(transduced_results):
+        for i, result in enumerate(transduced_results, start):
             if isinstance(result, Exception):
-                output_states.append(
-                    self.states[i] if i < len(self.states) else target_type()
-                )
                 n_errors += 1
-            else:
-                output_states.append(result)
+            output_states.append(self._transduction_output(i, result, target_type))
         if self.verbose_transduction:
             if n_errors:
                 logger.debug(f"Error: {n_errors} states have not been transduced")
+            if sum(saved):
+                logger.debug(f"Deduplication saved {sum(saved)} LLM calls")
+            if usage.requests:
+                logger.debug(f"Prompt cache: {usage}")
+            if transduction_cache is not None and self.transduction_cache_mode == "use":
+                logger.debug(
+                    f"Transduction cache: {transduction_cache.hits - cache_hits} hits, "
+                    f"{transduction_cache.misses - cache_misses} misses"
+                )
+
+        # reported on the output only, concurrent transductions from self don't share them
+        output.prompt_usage = usage
+        output.deduplicated_calls = sum(saved)
+        output.logprobs = (
+            [logprobs.get(prompt) for prompt in input_prompts] if logprobs else None
+        )
 
         if self.transduction_logs_path:
             with open(self.transduction_logs_path, "a") as f:
                 for state in output_states:
-                    if state:
-                        f.write(state.model_dump_json() + "\n")
-                    else:
-                        f.write(self.atype().model_dump_json() + "\n")
+                    self._log_transduced_state(f, state)
 
         if isinstance(other, AG):
-            for i in range(len(other.states)):
-                output_state = output_states[i]
-                if isinstance(output_state, tuple):
-                    output_state_dict = dict([output_state])
-                else:
-                    output_state_dict = output_state.model_dump()
-
-                merged = self.atype(
-                    **(
-                        (self[i].model_dump() if len(self) > i else {})
-                        | other[i].model_dump()
-                        | output_state_dict
-                    )
-                )
-                output.states.append(merged)
+            for i, output_state in enumerate(output_states, start):
+                output.states.append(self._merge_transduced(i, other[i], output_state))
         # elif is_str_or_list_of_str(other):
         elif isinstance(other, list):
-            for i in range(len(other)):
-                if isinstance(output_states[i], self.atype):
-                    output.states.append(self.atype(**output_states[i].model_dump()))
-                else:
-                    output.states.append(self.atype())
+            for i, output_state in enumerate(output_states, start):
+                output.states.append(self._merge_transduced(i, None, output_state))
         else:
             if isinstance(output_states[0], self.atype):
                 output.states.append(self.atype(**output_states[i].model_dump()))
+        output.states = self._keep_backend(output.states)
+        return output
+
+    async def _sharded_transduction(
+        self, other: Union["AG", List[Any]]
+    ) -> Optional[AG]:
+        """
+        Transduction over shards of the source, see run_sharded. Each shard sees all the target
+        and source states for few shots, but duplicate prompts are only merged within a shard.
+        None when the transduction can't be sharded.
+        """
+        results = await run_sharded(self, "transduce", other, len(other), self.shards)
+        if results is None:
+            return None
+        output = self.clone()
+        output.states = self._keep_backend(
+            [
+                self.atype.model_validate_json(data)
+                for states, _, _ in results
+                for data in states
+            ]
+        )
+        output.logprobs = None
+        usage = PromptUsage()
+        for _, shard_usage, _ in results:
+            if shard_usage:
+                usage.add(
+                    prompt_tokens=shard_usage["prompt_tokens"],
+                    cached_tokens=shard_usage["cached_tokens"],
+                    completion_tokens=shard_usage["completion_tokens"],
+                    requests=shard_usage["requests"],
+                )
+        output.deduplicated_calls = sum(calls for _, _, calls in results)
+        output.prompt_usage = usage
+        return output
+
+    async def astream(
+        self,
+        other: Union["AG", str, Iterable[Any], AsyncIterable[Any]],
+        usage: Optional[PromptUsage] = None,
+    ) -> AsyncIterator[Tuple[int, BaseModel]]:
+        """
+        Streaming transduction: yields `(index, state)` pairs as soon as each input is transduced,
+        in completion order. `other` can be an AG, a string, or any iterable / async iterable of
+        strings or pydantic states, so a producer can keep feeding inputs while earlier ones are
+        still being processed. Inputs are consumed lazily through the bounded worker pool.
+        The prompt tokens used are added to `usage` when given.
+
+        Usage:
+            async for i, state in target.astream(source):
+                ...
+        """
+        if not self.atype:
+            raise ValueError("Streaming transduction requires an atype")
+        if self.transduction_type != "amap":
+            raise ValueError("Streaming transduction only supports amap transductions")
+
+        prompt_template = None
+        include = None
+        if isinstance(other, str):
+            sources = [other]
+        elif isinstance(other, AG):
+            if other.prompt_template:
+                prompt_template = PromptTemplate.from_template(other.prompt_template)
+            include = other.transduce_fields
+            sources = other.states
+        else:
+            sources = other
+
+        target_type = (
+            self.subset_atype(self.transduce_fields)
+            if self.transduce_fields
+            else self.atype
+        )
+        few_shots = self._few_shot_index(other)
+        pt = self._make_transducer(
+            self._transduction_instructions(few_shots), usage=usage
+        )
+
+        # sources are kept only while in flight, to be merged with their outputs
+        pending: Dict[int, Any] = {}
+
+        def render(index: int, source: Any) -> str:
+            pending[index] = source
+            return self._add_few_shots(
+                few_shots,
+                index,
+                self._render_source(source, prompt_template, include),
+            )
+
+        if isinstance(sources, AsyncIterable):
+
+            async def input_prompts():
+                index = 0
+                async for source in sources:
+                    yield render(index, source)
+                    index += 1
+
+            input_prompts = input_prompts()
+        else:
+            input_prompts = (render(i, source) for i, source in enumerate(sources))
+
+        async for i, result in pt.stream(input_prompts):
+            source = pending.pop(i)
+            if isinstance(result, Exception) and self.verbose_transduction:
+                logger.debug(f"⚠️ Error transducing state {i}: {result}")
+            state = self._merge_transduced(
+                i,
+                source if isinstance(source, BaseModel) else None,
+                self._transduction_output(i, result, target_type),
+            )
+            if self.transduction_logs_path:
+                with open(self.transduction_logs_path, "a") as f:
+                    self._log_transduced_state(f, state)
+            yield i, state
+
+    async def _tree_reduce(self, other: Union["AG", str, Iterable[Any]]) -> AG:
+        """
+        areduce transduction: states or strings are reduced areduce_batch_size at a time into
+        states of the target type, which are reduced again up to a single state (see TreeReducer).
+        Returns a new AG holding the final state, self is not modified.
+        """
+        if isinstance(other, str):
+            items = [other]
+        elif isinstance(other, AG):
+            items = other.states
+        else:
+            items = other
+        root = await TreeReducer(
+            self._batch_reducer(
+                self._make_transducer(self._transduction_instructions())
+            ),
+            fan_in=max(self.areduce_batch_size, 2),
+            max_workers=self.max_workers,
+        )(items)
+
+        output = self.clone()
+        output.areduce_tree = root
+        output.states = []
+        output.areduce_batches = []
+        if root is not None:
+            if root.error is not None and self.verbose_transduction:
+                logger.debug(f"Error reducing states: {root.error}")
+            output.states = [self._merge_transduced(0, None, root.value)]
+            internal_nodes = [
+                node for node in root.walk() if not node.is_leaf and node is not root
+            ]
+            output.areduce_batches = [
+                self._merge_transduced(0, None, node.value)
+                for node in sorted(internal_nodes, key=lambda n: (n.level, n.start))
+            ]
+        return output
+
+    async def areduce_range(self, other: AG, start: int, end: int) -> AG:
+        """
+        areduce transduction of other[start : end + 1], reusing the reductions of aligned batches
+        and subtrees already computed for any range over the same content (see ReductionIndex).
+        Reductions are stored in transduction_cache when set, in a process-wide in-memory cache
+        bounded to MEMORY_CACHE_MAX_ENTRIES otherwise, so interactive range queries only reduce
+        what they haven't seen yet. Only the states of the nodes covering the range are hashed.
+        """
+        instructions = self._transduction_instructions()
+        pt = self._make_transducer(instructions)
+        index = ReductionIndex(
+            other.states,
+            self._batch_reducer(pt),
+            pt.atype,
+            batch_size=max(self.areduce_batch_size, 1),
+            fan_in=max(self.areduce_batch_size, 2),
+            cache=get_transduction_cache(self.transduction_cache or ":memory:"),
+            key_parts=(pt.model_id, pt.cache_context),
+            max_workers=self.max_workers,
+        )
+        root = await index.query(start, end)
+        output = self.clone()
+        output.areduce_tree = root
+        output.states = [self._merge_transduced(0, None, root.value)]
+        output.areduce_batches = [
+            self._merge_transduced(0, None, node.value) for node in root.children
+        ]
         return output
 
+    def _batch_reducer(self, pt) -> Callable[[List[Any]], Awaitable[BaseModel]]:
+        """Reduction of a batch of states or strings into a single state, with transducer pt"""
+
+        async def reduce_batch(values: List[Any]) -> BaseModel:
+            prompt = "\nSOURCE:\n" + canonical_json(
+                [v.model_dump() if isinstance(v, BaseModel) else v for v in values]
+            )
+            [result] = await pt.execute(prompt, transient_pbar=True)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return reduce_batch
+
+    def _render_source(
+        self,
+        source: Any,
+        prompt_template: Optional[PromptTemplate] = None,
+        include: Optional[List[str]] = None,
+    ) -> str:
+        """Render a single input (state or text) as the SOURCE of a transduction prompt"""
+        if isinstance(source, BaseModel):
+            if prompt_template:
+                return (
+                    "SOURCE:\n"
+                    + prompt_template.invoke(source.model_dump(include=include)).text
+                )
+            return "SOURCE:\n" + canonical_json(source.model_dump(include=include))
+        return "\nSOURCE:\n" + str(source)
+
+    def _transduction_instructions(
+        self, few_shots: Optional[FewShotIndex] = None
+    ) -> str:
+        """Compose the instructions shared by all the prompts of a transduction, including every
+        few shot with the `all` few_shot_strategy"""
+        instructions = ""
+
+        # Add instructions
+        if self.skip_intentional_definition:
+            instructions = f"{self.instructions}" if self.instructions else "\n"
+        else:
+            instructions += "\nYour task is to transduce a source Pydantic Object into the specified Output type. Generate only slots that are logically deduced from the input information, otherwise live then null.\n"
+            if self.instructions:
+                instructions += (
+                    "\nRead carefully the following instructions for executing your task:\n"
+                    + self.instructions
+                )
+
+        if few_shots is not None and self.few_shot_strategy == "all":
+            instructions += FEW_SHOTS_HEADER + "".join(
+                format_few_shot(source, target)
+                for source, target in zip(few_shots.sources, few_shots.targets)
+            )
+        return instructions
+
+    def _few_shot_index(self, other: Any) -> Optional[FewShotIndex]:
+        """
+        Index the few shots available for a transduction from other, i.e. the states of self
+        whose transduce_fields are all filled, paired with the source states at the same position
+        """
+        if (
+            not isinstance(other, AG)
+            or not self.transduce_fields
+            or self.few_shot_strategy == "none"
+        ):
+            return None
+        target_fields = set(self.transduce_fields)
+        ids, sources, targets = [], [], []
+        for i in range(min(len(self.states), len(other.states))):
+            if not self.states[i]:
+                continue
+            target = self.states[i].model_dump(include=target_fields)
+            if len(target) == len(target_fields) and all(
+                v is not None and v != "" for v in target.values()
+            ):
+                ids.append(i)
+                sources.append(
+                    canonical_json(
+                        other.states[i].model_dump(include=other.transduce_fields)
+                    )
+                )
+                targets.append(canonical_json(target))
+        return FewShotIndex(sources, targets, ids=ids) if ids else None
+
+    def _add_few_shots(
+        self, few_shots: Optional[FewShotIndex], i: int, prompt: str
+    ) -> str:
+        """Prepend the few shots selected for the i-th input to its prompt"""
+        if few_shots is None or self.few_shot_strategy in ("all", "none"):
+            return prompt
+        examples = few_shots.select(
+            prompt,
+            self.few_shot_k,
+            strategy=self.few_shot_strategy,
+            max_tokens=self.few_shot_max_tokens,
+            exclude=i,
+        )
+        if not examples:
+            return prompt
+        return (
+            FEW_SHOTS_HEADER
+            + "".join(format_few_shot(source, target) for source, target in examples)
+            + prompt
+        )
+
+    async def _batched_transduction(
+        self,
+        input_prompts: List[str],
+        instructions: str,
+        description: str,
+        on_result: Optional[Callable[[int, Any], None]] = None,
+        usage: Optional[PromptUsage] = None,
+    ) -> List[Any]:
+        """
+        Micro-batched transduction: packs `transduction_batch_size` SOURCE items into a single prompt
+        and requests an ATypeList output, whose states are split back by position.
+        Batches that fail or return the wrong number of states are transduced again one state at a time.
+        """
+        target_type = (
+            self.subset_atype(self.transduce_fields)
+            if self.transduce_fields
+            else self.atype
+        )
+        list_type = make_states_list_model(target_type)
+        batches = chunk_list(input_prompts, self.transduction_batch_size)
+        batch_prompts = [
+            "\n".join(f"\nITEM {j}:{prompt}" for j, prompt in enumerate(batch))
+            for batch in batches
+        ]
+        batch_transducer = self._make_transducer(
+            instructions
+            + "\nThe input contains a numbered list of ITEMs, each with its own SOURCE. "
+            "Transduce each ITEM independently and return exactly one output per ITEM "
+            "in the `states` list, in the same order as the ITEMs.\n",
+            atype=list_type,
+            usage=usage,
+        )
+
+        def _is_complete_batch(b: int, result: Any) -> bool:
+            return isinstance(result, list_type) and len(result.states) == len(
+                batches[b]
+            )
+
+        def on_batch_result(b: int, result: Any):
+            if on_result and _is_complete_batch(b, result):
+                for k, state in enumerate(result.states):
+                    on_result(b * self.transduction_batch_size + k, state)
+
+        batch_results = await batch_transducer.execute(
+            *batch_prompts,
+            description=f"{description} (batches of {self.transduction_batch_size})",
+            transient_pbar=self.transient_pbar,
+            on_result=on_batch_result,
+        )
+
+        results: List[Any] = [None] * len(input_prompts)
+        fallback: List[int] = []
+        for b, (batch, result) in enumerate(zip(batches, batch_results)):
+            offset = b * self.transduction_batch_size
+            if _is_complete_batch(b, result):
+                results[offset : offset + len(batch)] = result.states
+            else:
+                fallback.extend(range(offset, offset + len(batch)))
+
+        if fallback:
+            if self.verbose_transduction:
+                logger.debug(
+                    f"Falling back to single state transduction for {len(fallback)} states"
+                )
+            single_results = await self._make_transducer(
+                instructions, usage=usage
+            ).execute(
+                *[input_prompts[i] for i in fallback],
+                description=f"{description} (fallback)",
+                transient_pbar=True,
+                on_result=(
+                    (lambda j, state: on_result(fallback[j], state))
+                    if on_result
+                    else None
+                ),
+            )
+            for i, result in zip(fallback, single_results):
+                results[i] = result
+        return results
+
+    def _make_transducer(
+        self,
+        instructions: str,
+        atype: Optional[Type[BaseModel]] = None,
+        usage: Optional[PromptUsage] = None,
+        logprobs: Optional[Dict[str, Any]] = None,
+    ):
+        """Instantiate the pydantic transducer matching the configured llm, counting its
+        token usage in `usage` and collecting logprobs by prompt in `logprobs` when given
+        """
+        extra_params = dict(self.crew_prompt_params)
+        if isinstance(self.llm, AsyncOpenAI):
+            transducer_class = PydanticTransducerVLLM
+            extra_params.update(self.sampling_params or {})
+        elif self.tools:
+            transducer_class = PydanticTransducerCrewAI
+        else:
+            # without tools a single structured completion replaces the agent loop
+            transducer_class = PydanticTransducerLLM
+        transduced_type = atype or (
+            self.subset_atype(self.transduce_fields)
+            if self.transduce_fields
+            else self.atype
+        )
+        transducer = transducer_class(
+            transduced_type,
+            tools=self.tools,
+            llm=self.llm,
+            intentional_definiton=instructions,
+            verbose=self.verbose_agent,
+            max_iter=self.max_iter,
+            timeout=self.timeout,
+            max_workers=self.max_workers,
+            cache=get_transduction_cache(self.transduction_cache),
+            cache_mode=self.transduction_cache_mode,
+            limiter=self.concurrency_limiter,
+            reasoning=self.reasoning,
+            **extra_params,
+        )
+        transducer.usage = usage
+        transducer.logprobs = logprobs
+        return transducer
+
+    def _transduction_output(
+        self, i: int, result: Any, target_type: Type[BaseModel]
+    ) -> BaseModel:
+        """Failed transductions fall back to the existing state, or to an empty target"""
+        if isinstance(result, Exception):
+            return self.states[i] if i < len(self.states) else target_type()
+        return result
+
+    def _merge_transduced(
+        self, i: int, source: Optional[BaseModel], output_state: Any
+    ) -> BaseModel:
+        """Build the i-th output state, merging the current state, the source state and the transduced slots"""
+        if source is None:
+            if isinstance(output_state, self.atype):
+                return self.atype(**output_state.model_dump())
+            return self.atype()
+        if isinstance(output_state, tuple):
+            output_state_dict = dict([output_state])
+        else:
+            output_state_dict = output_state.model_dump()
+        return self.atype(
+            **(
+                (self.states[i].model_dump() if len(self) > i else {})
+                | source.model_dump()
+                | output_state_dict
+            )
+        )
+
+    def _log_transduced_state(self, f, state: Optional[BaseModel]):
+        if state:
+            f.write(state.model_dump_json() + "\n")
+        else:
+            f.write(self.atype().model_dump_json() + "\n")
+
     async def copy_fewshots_from_ground_truth(
         self, source_target_pairs: List[Tuple[str, str]], first_n: Optional[int] = None
     ) -> AG:
@@ -921,25 +2034,37 @@ class AG(BaseModel, Generic[T]):
         Usage: AG1 is an optimizer and AG2 is evaluation set.
         duplicate dataset AG2 per each AG1 optimization parameter set.
         """
-        new_fields = {}
-        for field in other.atype.model_fields.keys():
-            new_fields[field] = (
-                other.atype.model_fields[field].annotation,
-                Field(
-                    default=other.atype.model_fields[field].default,
-                    description=other.atype.model_fields[field].description,
-                ),
-            )
 
-        for field in self.atype.model_fields.keys():
-            new_fields[field] = (
-                self.atype.model_fields[field].annotation,
-                Field(
-                    default=self.atype.model_fields[field].default,
-                    description=self.atype.model_fields[field].description,
+        def build() -> Type[BaseModel]:
+            new_fields = {}
+            for field in other.atype.model_fields.keys():
+                new_fields[field] = (
+                    other.atype.model_fields[field].annotation,
+                    Field(
+                        default=other.atype.model_fields[field].default,
+                        description=other.atype.model_fields[field].description,
+                    ),
+                )
+
+            for field in self.atype.model_fields.keys():
+                new_fields[field] = (
+                    self.atype.model_fields[field].annotation,
+                    Field(
+                        default=self.atype.model_fields[field].default,
+                        description=self.atype.model_fields[field].description,
+                    ),
+                )
+            return create_model(f"{self.__name__}__{other.__name__}", **new_fields)
+
+        prod_atype = cached_model(("product", self.atype, other.atype), build)
+        if isinstance(self.states, ColumnarStates):
+            return AG(
+                atype=prod_atype,
+                llm=self.llm,
+                states=self.states.product(
+                    ColumnarStates.from_states(other.states, other.atype), prod_atype
                 ),
             )
-        prod_atype = create_model(f"{self.__name__}__{other.__name__}", **new_fields)
 
         extended_ags = []
         for state in self.states:
@@ -965,26 +2090,38 @@ class AG(BaseModel, Generic[T]):
         """
 
         # 1) Build combined atype (prefer RIGHT field definitions on conflicts)
-        new_fields: Dict[str, tuple[Type, Field]] = {}
+        def build() -> Type[BaseModel]:
+            new_fields: Dict[str, tuple[Type, Field]] = {}
+
+            # left first, then overlay right (right wins), keeping default factories
+            for name, f in [
+                *self.atype.model_fields.items(),
+                *other.atype.model_fields.items(),
+            ]:
+                default = (
+                    {"default_factory": f.default_factory}
+                    if f.default_factory is not None
+                    else {"default": f.default}
+                )
+                new_fields[name] = (
+                    f.annotation,
+                    Field(**default, description=f.description),
+                )
 
-        # left first...
-        for name, f in self.atype.model_fields.items():
-            new_fields[name] = (
-                f.annotation,
-                Field(default=f.default, description=f.description),
+            return create_model(
+                f"{self.__name__}__merge__{other.__name__}", **new_fields
             )
 
-        # ...then overlay right (right wins)
-        for name, f in other.atype.model_fields.items():
-            new_fields[name] = (
-                f.annotation,
-                Field(default=f.default, description=f.description),
+        merged_atype = cached_model(("merge", self.atype, other.atype), build)
+        if isinstance(self.states, ColumnarStates):
+            return AG(
+                atype=merged_atype,
+                llm=self.llm,
+                states=self.states.merge(
+                    ColumnarStates.from_states(other.states, other.atype), merged_atype
+                ),
             )
 
-        merged_atype = create_model(
-            f"{self.__name__}__merge__{other.__name__}", **new_fields
-        )
-
         # 2) Pairwise merge states (right wins on value conflicts)
         merged_states = []
         for left_state, right_state in zip_longest(
@@ -1060,14 +2197,19 @@ class AG(BaseModel, Generic[T]):
 
     def subset_atype(self, include_fields: set[str]) -> Type[BaseModel]:
         """Generate a type which is a subset of a_type containing only fields in include list"""
-        fields = {
-            field: (
-                self.atype.model_fields[field].annotation,
-                self.atype.model_fields[field].default,
-            )
-            for field in include_fields
-        }
-        return create_model("_".join(include_fields), **fields)
+        include_fields = tuple(include_fields)
+
+        def build() -> Type[BaseModel]:
+            fields = {
+                field: (
+                    self.atype.model_fields[field].annotation,
+                    self.atype.model_fields[field].default,
+                )
+                for field in include_fields
+            }
+            return create_model("_".join(include_fields), **fields)
+
+        return cached_model(("subset", self.atype, include_fields), build)
 
     def rebind_atype(
         self, new_atype: Type[BaseModel], mapping: Dict[str, str] | None = None
@@ -1087,6 +2229,13 @@ class AG(BaseModel, Generic[T]):
         Returns:
             AG: a new Agentics object with states of type `new_atype`.
         """
+        if isinstance(self.states, ColumnarStates):
+            # columns are projected as they are, without validating them against new_atype
+            new_ag = copy(self)
+            new_ag.atype = new_atype
+            new_ag.states = self.states.project(new_atype, mapping)
+            return new_ag
+
         new_ag = deepcopy(self)
         new_ag.atype = new_atype
         new_ag.states = []
@@ -1126,26 +2275,40 @@ class AG(BaseModel, Generic[T]):
         Returns:
             Type[BaseModel]: A new Pydantic model with the added slot.
         """
-        # Clone existing fields
-        fields = {
-            field: (
-                self.atype.model_fields[field].annotation,
-                Field(
-                    default=self.atype.model_fields[field].default,
-                    description=self.atype.model_fields[field].description,
-                ),
+
+        def build() -> Type[BaseModel]:
+            # Clone existing fields
+            fields = {
+                field: (
+                    self.atype.model_fields[field].annotation,
+                    Field(
+                        default=self.atype.model_fields[field].default,
+                        description=self.atype.model_fields[field].description,
+                    ),
+                )
+                for field in self.atype.model_fields.keys()
+            }
+
+            # Add the new field
+            fields[slot_name] = (
+                slot_type,
+                Field(default=default_value, description=description),
             )
-            for field in self.atype.model_fields.keys()
-        }
 
-        # Add the new field
-        fields[slot_name] = (
-            slot_type,
-            Field(default=default_value, description=description),
+            # Create a new model with the added field
+            return create_model(f"{self.__name__}_extended", **fields)
+
+        new_model = cached_model(
+            (
+                "add_attribute",
+                self.atype,
+                slot_name,
+                slot_type,
+                default_value,
+                description,
+            ),
+            build,
         )
 
-        # Create a new model with the added field
-        new_model = create_model(f"{self.__name__}_extended", **fields)
-
         # Optionally re-assign it to self.atype
         return self.rebind_atype(new_model)
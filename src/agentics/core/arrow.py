@@ -0,0 +1,222 @@
+import datetime
+import types
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from agentics.core.atype import JSON_METADATA, pydantic_model_from_arrow_schema
+from agentics.core.export import EXPORT_CHUNK_SIZE, dump_rows
+from agentics.core.jsonio import json_loads
+from agentics.core.utils import get_type_adapter, sanitize_field_name
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional, install the arrow dependency group
+    pa = pq = None
+
+ArrowSource = Union[str, "pa.Table", "pa.RecordBatch", "pa.RecordBatchReader"]
+
+ARROW_BATCH_SIZE = 65_536
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "Arrow and Parquet support requires pyarrow, install it with "
+            "`pip install pyarrow` or `uv sync --group arrow`"
+        )
+
+
+def arrow_type(annotation: Any) -> Optional["pa.DataType"]:
+    """Arrow type of a field annotation, None when it can't be represented"""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    if get_origin(annotation) is Literal:
+        values = get_args(annotation)
+        return pa.string() if all(isinstance(v, str) for v in values) else None
+    if get_origin(annotation) in (list, List):
+        (item,) = get_args(annotation) or (None,)
+        item_type = arrow_type(item)
+        return pa.list_(item_type) if item_type is not None else None
+    if get_origin(annotation) in (dict, Dict):
+        key, value = get_args(annotation) or (None, None)
+        value_type = arrow_type(value)
+        if key is str and value_type is not None:
+            return pa.map_(pa.string(), value_type)
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        struct_fields = []
+        for name, field in annotation.model_fields.items():
+            field_type = arrow_type(field.annotation)
+            if field_type is None:
+                return None
+            struct_fields.append(pa.field(name, field_type))
+        return pa.struct(struct_fields)
+    return {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+        bytes: pa.binary(),
+        datetime.datetime: pa.timestamp("us"),
+        datetime.date: pa.date32(),
+        datetime.time: pa.time64("us"),
+    }.get(annotation)
+
+
+def arrow_schema(atype: Type[BaseModel]) -> "pa.Schema":
+    """Arrow schema of an atype. Fields without an Arrow type are stored as JSON strings"""
+    require_pyarrow()
+    fields = []
+    for name, field in atype.model_fields.items():
+        field_type = arrow_type(field.annotation)
+        if field_type is None:
+            fields.append(pa.field(name, pa.string(), metadata=JSON_METADATA))
+        else:
+            fields.append(pa.field(name, field_type))
+    return pa.schema(fields)
+
+
+def states_to_batch(
+    states: Sequence[BaseModel], atype: Type[BaseModel], schema: "pa.Schema"
+) -> "pa.RecordBatch":
+    rows = dump_rows(states, atype, mode="python")
+    arrays = []
+    for field in schema:
+        values = [row.get(field.name) for row in rows]
+        if field.metadata == JSON_METADATA:
+            adapter = get_type_adapter(atype.model_fields[field.name].annotation)
+            values = [
+                adapter.dump_json(value).decode() if value is not None else None
+                for value in values
+            ]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def iter_batches(
+    states: Sequence[BaseModel],
+    atype: Type[BaseModel],
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator["pa.RecordBatch"]:
+    schema = arrow_schema(atype)
+    for start in range(0, len(states), chunk_size):
+        yield states_to_batch(states[start : start + chunk_size], atype, schema)
+
+
+def source_schema(source: ArrowSource) -> "pa.Schema":
+    require_pyarrow()
+    if isinstance(source, (pa.Table, pa.RecordBatch, pa.RecordBatchReader)):
+        return source.schema
+    return pq.read_schema(source)
+
+
+def projected_columns(
+    schema: "pa.Schema",
+    atype: Optional[Type[BaseModel]] = None,
+    fields: Optional[List[str]] = None,
+) -> Optional[List[str]]:
+    """
+    Columns to read: those matching `fields` when given, otherwise those matching the atype
+    fields, matched by sanitized name. None reads all the columns.
+    """
+    if fields is None and atype is None:
+        return None
+    wanted = set(fields if fields is not None else atype.model_fields)
+    return [name for name in schema.names if sanitize_field_name(name) in wanted]
+
+
+def read_batches(
+    source: ArrowSource,
+    columns: Optional[List[str]] = None,
+    batch_size: int = ARROW_BATCH_SIZE,
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Record batches of a parquet file, streamed one row group at a time and reading only
+    `columns`, or of an in memory Arrow table, batch or stream.
+    """
+    require_pyarrow()
+    if isinstance(source, pa.RecordBatch):
+        source = pa.Table.from_batches([source])
+    if isinstance(source, pa.Table):
+        yield from (source.select(columns) if columns else source).to_batches(
+            batch_size
+        )
+    elif isinstance(source, pa.RecordBatchReader):
+        for batch in source:
+            yield batch.select(columns) if columns else batch
+    else:
+        with pq.ParquetFile(source) as parquet_file:
+            yield from parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+
+
+def states_from_batch(
+    batch: "pa.RecordBatch", atype: Type[BaseModel]
+) -> List[BaseModel]:
+    names = [sanitize_field_name(name) for name in batch.schema.names]
+    # converting column by column is several times faster than RecordBatch.to_pylist
+    columns = [column.to_pylist(maps_as_pydicts="strict") for column in batch.columns]
+    for i, (name, field) in enumerate(zip(names, batch.schema)):
+        if field.metadata != JSON_METADATA or name not in atype.model_fields:
+            continue
+        if arrow_type(atype.model_fields[name].annotation) is None:
+            # the JSON is decoded unless the atype reads the column as a string
+            columns[i] = [
+                json_loads(value) if value is not None else None for value in columns[i]
+            ]
+    rows = (
+        [dict(zip(names, values)) for values in zip(*columns)]
+        if columns
+        else [{} for _ in range(batch.num_rows)]
+    )
+    return get_type_adapter(List[atype]).validate_python(rows)
+
+
+def arrow_atype(
+    source: ArrowSource,
+    atype: Optional[Type[BaseModel]] = None,
+    fields: Optional[List[str]] = None,
+) -> Type[BaseModel]:
+    """The given atype, or the one inferred from the schema of the projected columns"""
+    if atype is not None:
+        return atype
+    schema = source_schema(source)
+    columns = projected_columns(schema, fields=fields)
+    if columns is not None:
+        schema = pa.schema([schema.field(name) for name in columns])
+    return pydantic_model_from_arrow_schema(schema)
+
+
+def iter_arrow_states(
+    source: ArrowSource,
+    atype: Type[BaseModel],
+    max_rows: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    batch_size: int = ARROW_BATCH_SIZE,
+) -> Iterator[BaseModel]:
+    """States of an Arrow source, validated one record batch at a time"""
+    columns = projected_columns(source_schema(source), atype, fields)
+    remaining = max_rows
+    for batch in read_batches(source, columns, batch_size):
+        if remaining is not None:
+            if remaining <= 0:
+                return
+            batch = batch.slice(0, remaining)
+            remaining -= batch.num_rows
+        yield from states_from_batch(batch, atype)
@@ -1,27 +1,73 @@
 import asyncio
 import os
+import random
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from typing import Any, Callable, List, Type, Union
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 from crewai import Agent, Crew, Process, Task
+from crewai.events import crewai_event_bus
 from dotenv import load_dotenv
 from loguru import logger
 from openai import AsyncOpenAI
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
+from agentics.core.cache import TransductionCache
+from agentics.core.concurrency import AdaptiveLimiter
+from agentics.core.errors import is_transient_error
 from agentics.core.llm_connections import watsonx_llm
-from agentics.core.utils import async_odered_progress, openai_response
+from agentics.core.prompts import (
+    PromptUsage,
+    build_messages,
+    canonical_json,
+    completion_usage,
+    supports_cache_control,
+    track_completion_usage,
+)
+from agentics.core.utils import (
+    DEFAULT_MAX_WORKERS,
+    async_odered_progress,
+    bounded_as_completed,
+    get_json_schema,
+    llm_acall,
+    openai_response,
+)
 
 load_dotenv()
 
+CREW_PROMPT_PARAMS = {"role", "goal", "backstory", "expected_output"}
+# llm attributes that change the completions, and so the cached transductions
+SAMPLING_PARAMS = (
+    "temperature",
+    "top_p",
+    "max_tokens",
+    "max_completion_tokens",
+    "n",
+    "seed",
+    "stop",
+    "presence_penalty",
+    "frequency_penalty",
+    "reasoning_effort",
+)
+
+
+def llm_sampling_params(llm: Any) -> Dict[str, Any]:
+    """Sampling parameters set on an llm object, e.g. a crewai LLM"""
+    params = {name: getattr(llm, name, None) for name in SAMPLING_PARAMS}
+    return {name: value for name, value in params.items() if value is not None}
+
 
 class AsyncExecutor(ABC):
 
     wait: int = 0.01
     max_retries: int = 2
+    max_permanent_retries: int = 1
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 30.0
     timeout: int | None = None
-    _retry: int = 0
+    max_workers: int = DEFAULT_MAX_WORKERS
+    limiter: Optional[AdaptiveLimiter] = None
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -33,47 +79,88 @@ class AsyncExecutor(ABC):
         *inputs: Union[BaseModel, str],
         description: str = "Executing",
         transient_pbar: bool = False,
+        on_result: Optional[Callable[[int, Any], None]] = None,
     ) -> Union[BaseModel, Iterable[BaseModel]]:
-        _inputs = []
-        _indices = []
+        """Execute all inputs, each one retried on its own as soon as it fails (see _attempt).
+        on_result(index, output) is invoked as soon as each input succeeds, e.g. to checkpoint
+        outputs while the batch is still running. Failures are returned in place of outputs.
+        """
         if len(inputs) == 1:
             # singular input awaits a single async call
             try:
-                return await asyncio.wait_for(
-                    self._execute(inputs[0]), timeout=self.timeout
-                )
+                answer = await self._attempt(inputs[0])
             except Exception as e:
-                if isinstance(e, Exception) and self._retry < self.max_retries:
-                    _indices = [0]
-                    _inputs = [inputs[0]]
-                answers = [e]
-        else:
-            # A list of inputs gathers all async calls as tasks
-            answers = await async_odered_progress(
-                inputs,
-                self._execute,
-                description=description,
-                timeout=self.timeout,
-                transient_pbar=transient_pbar,
-            )
-
-            for i, answer in enumerate(answers):
-                if isinstance(answer, Exception) and self._retry < self.max_retries:
-                    _inputs.append(inputs[i])
-                    _indices.append(i)
-        self._retry += 1
-        if _inputs:
-            logger.debug(f"retrying {len(_inputs)} state(s), attempt {self._retry}")
-            _answers = await self.execute(
-                *_inputs,
-                description=f"Retrying {len(_inputs)} state(s), attempt {self._retry}",
-                transient_pbar=True,
-            )
-            for i, answer in zip(_indices, _answers):
-                answers[i] = answer
-
-        self._retry = 0
-        return answers
+                return e
+            if on_result:
+                on_result(0, answer)
+            return answer
+
+        # A list of inputs is dispatched through a bounded worker pool
+        return await async_odered_progress(
+            inputs,
+            self._attempt,
+            description=description,
+            transient_pbar=transient_pbar,
+            max_workers=self.max_workers,
+            on_result=on_result,
+        )
+
+    async def stream(
+        self, inputs: Union[Iterable[Any], AsyncIterable[Any]]
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """Yield (index, output) pairs as soon as each input is executed, in completion order.
+        Inputs are consumed lazily, failures are yielded as exceptions in place of the output.
+        """
+        async for index, output in bounded_as_completed(
+            inputs, self._attempt, max_workers=self.max_workers
+        ):
+            yield index, output
+
+    async def _attempt(self, input: Union[BaseModel, str]) -> BaseModel:
+        """
+        Execute a single input with per-state retries, tracked locally so that concurrent
+        executions never share retry state. Transient errors (timeouts, 429, 5xx) are retried up
+        to max_retries times with exponential backoff plus jitter, permanent errors (e.g. validation)
+        up to max_permanent_retries times right away.
+        """
+        transient_failures = 0
+        permanent_failures = 0
+        while True:
+            try:
+                return await self._call(input)
+            except Exception as e:
+                if is_transient_error(e):
+                    transient_failures += 1
+                    if transient_failures > self.max_retries:
+                        raise
+                    delay = self._backoff(transient_failures)
+                else:
+                    permanent_failures += 1
+                    if permanent_failures > self.max_permanent_retries:
+                        raise
+                    delay = 0
+                logger.debug(
+                    f"retrying state after {type(e).__name__} "
+                    f"(transient {transient_failures}/{self.max_retries}, "
+                    f"permanent {permanent_failures}/{self.max_permanent_retries}) in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+    def _backoff(self, failures: int) -> float:
+        """Exponential backoff with equal jitter"""
+        delay = min(self.retry_max_delay, self.retry_base_delay * 2 ** (failures - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def _call(self, input: Union[BaseModel, str]) -> BaseModel:
+        """Entry point used by execute for every input, subclasses can wrap _execute here"""
+        return await self._limited_execute(input)
+
+    async def _limited_execute(self, input: Union[BaseModel, str]) -> BaseModel:
+        """_execute under the per-call timeout, holding a slot of the adaptive limiter if any"""
+        if self.limiter is None:
+            return await asyncio.wait_for(self._execute(input), timeout=self.timeout)
+        async with self.limiter.slot():
+            return await asyncio.wait_for(self._execute(input), timeout=self.timeout)
 
     @abstractmethod
     async def _execute(self, input: Union[BaseModel, str], **kwargs) -> BaseModel:
@@ -94,10 +181,62 @@ class aMap(AsyncExecutor):
 
 
 class PydanticTransducer(AsyncExecutor):
+    atype: Type[BaseModel]
+    intentional_definiton: str
+    cache: Optional[TransductionCache] = None
+    cache_mode: str = "use"
+    usage: Optional[PromptUsage] = None
+    # receives the raw samples and token logprobs of each transduced input, when requested
+    logprobs: Optional[Dict[str, Any]] = None
+
+    @property
+    def model_id(self) -> Optional[str]:
+        return getattr(self.llm, "model", None)
+
+    @property
+    def cache_context(self) -> Any:
+        """Everything but the input and the atype the completions depend on, part of the cache key"""
+        return {
+            "instructions": self.intentional_definiton,
+            "llm": llm_sampling_params(self.llm),
+        }
+
+    async def _call(self, input: str) -> BaseModel:
+        """Serve the transduction from the cache when enabled, see TransductionCache"""
+        if self.cache is None or self.cache_mode == "bypass":
+            return await self._counted_execute(input)
+        key = self.cache.make_key(
+            self.model_id, canonical_json(self.cache_context), self.atype, input
+        )
+        if self.cache_mode != "refresh":
+            cached = self.cache.get(key)
+            if cached is not None:
+                try:
+                    return self.atype.model_validate_json(cached)
+                except ValidationError:
+                    logger.debug("Discarding cached transduction that fails validation")
+        output = await self._counted_execute(input)
+        if isinstance(output, BaseModel):
+            self.cache.set(key, output.model_dump_json())
+        return output
+
+    async def _counted_execute(self, input: str) -> BaseModel:
+        """_limited_execute, adding the usage of the crewai LLM completions it makes to usage"""
+        if self.usage is None:
+            return await self._limited_execute(input)
+        track_completion_usage()
+        token = completion_usage.set(self.usage)
+        try:
+            return await self._limited_execute(input)
+        finally:
+            completion_usage.reset(token)
 
     async def execute(self, *inputs: str, **kwargs) -> List[BaseModel]:
         """Pydantic transduction always returns a list of pydantic models"""
         output = await super().execute(*inputs, **kwargs)
+        if self.usage is not None:
+            # completions are counted by crewai event handlers, wait for them
+            await asyncio.to_thread(crewai_event_bus.flush)
         if not isinstance(output, list):
             output = [output]
         return output
@@ -108,6 +247,14 @@ class PydanticTransducer(AsyncExecutor):
 
 
 class PydanticTransducerVLLM(PydanticTransducer):
+    """
+    Structured transduction against an OpenAI-compatible server (e.g. vLLM), decoding with
+    guided JSON from the atype schema. Inputs run on the bounded worker pool of AsyncExecutor,
+    each request with its own timeout. With n_samples > 1 the most frequent valid sample wins.
+    With logprobs=True the raw samples and their token logprobs of each input are added to the
+    `logprobs` dict when one is set, AG sets a new one for each transduction.
+    """
+
     llm: AsyncOpenAI
     intentional_definiton: str
     verbose: bool = False
@@ -120,7 +267,17 @@ class PydanticTransducerVLLM(PydanticTransducer):
         llm=None,
         tools=None,
         intentional_definiton=None,
-        timeout=10000,
+        timeout: float | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: Optional[TransductionCache] = None,
+        cache_mode: str = "use",
+        limiter: Optional[AdaptiveLimiter] = None,
+        model: Optional[str] = None,
+        n_samples: int = 1,
+        logprobs: bool = False,
+        request_timeout: float = 100,
+        max_iter=None,
+        reasoning=None,
         **kwargs,
     ):
         self.atype = atype
@@ -128,67 +285,171 @@ class PydanticTransducerVLLM(PydanticTransducer):
         self.llm = llm
         self.tools = tools
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.cache = cache
+        self.cache_mode = cache_mode
+        self.limiter = limiter
+        self.model = model or os.getenv("VLLM_MODEL_ID")
         self.intentional_definiton = (
             intentional_definiton
             or "Generate an object of the specified Pydantic Type from the following input."
         )
+        self.prompt_prefix = "\n".join(
+            [
+                self.intentional_definiton,
+                "Generate an object of the specified Pydantic Type from the following input.\n",
+            ]
+        )
         self.llm_params = {
-            "extra_body": {"guided_json": self.atype.model_json_schema()},
-            "logprobs": False,
-            "n": 1,
+            "extra_body": {"guided_json": get_json_schema(self.atype)},
+            "logprobs": logprobs,
+            "n": n_samples,
+            "timeout": request_timeout,
         }
-        self.llm_params.update(kwargs)
+        # crew prompt params (role, goal, ...) have no meaning for a plain chat completion
+        self.llm_params.update(
+            {k: v for k, v in kwargs.items() if k not in CREW_PROMPT_PARAMS}
+        )
 
-    async def execute(
+    async def _execute(self, input: str) -> BaseModel:
+        result = await openai_response(
+            model=self.model,
+            base_url=os.getenv("VLLM_URL"),
+            client=self.client,
+            system_prompt=self.prompt_prefix,
+            user_prompt=input[: self.MAX_CHAR_PROMPT],
+            usage=self.usage,
+            **self.llm_params,
+        )
+        if isinstance(result, dict):
+            if self.logprobs is not None:
+                self.logprobs[input] = result
+            samples = result["contents"]
+        else:
+            samples = result if isinstance(result, list) else [result]
+        return self._select_sample(samples)
+
+    def _select_sample(self, samples: List[str]) -> BaseModel:
+        """Majority vote among the samples that validate against atype, first one on ties"""
+        decoded, votes, error = {}, Counter(), None
+        for sample in samples:
+            try:
+                state = self.atype.model_validate_json(sample or "")
+            except ValidationError as e:
+                error = error or e
+                continue
+            key = state.model_dump_json()
+            decoded.setdefault(key, state)
+            votes[key] += 1
+        if not votes:
+            raise error
+        return decoded[votes.most_common(1)[0][0]]
+
+    @property
+    def model_id(self) -> Optional[str]:
+        return self.model
+
+    @property
+    def cache_context(self) -> Any:
+        # the request timeout and logprobs don't change the decoded outputs
+        params = {
+            k: v for k, v in self.llm_params.items() if k not in ("timeout", "logprobs")
+        }
+        return {"prompt": self.prompt_prefix, "llm": params}
+
+    @property
+    def client(self) -> Optional[AsyncOpenAI]:
+        """The llm when it is an OpenAI-compatible client, otherwise the shared client for VLLM_URL is used"""
+        return self.llm if isinstance(self.llm, AsyncOpenAI) else None
+
+
+class PydanticTransducerLLM(PydanticTransducer):
+    """
+    Structured transduction with a single completion of a crewai LLM, used when no tools are
+    needed. The prompt carries the same role, instructions and expected output as the Crew task,
+    without the agent scaffolding, and the output is requested with the atype as response model.
+    """
+
+    llm: Any
+    intentional_definiton: str
+    MAX_CHAR_PROMPT: int = 15000
+
+    def __init__(
         self,
-        input: Union[str, Iterable[str]],
-        logprobs: bool = False,
-        n_samples: int = 1,
+        atype: Type[BaseModel],
+        verbose: bool = False,
+        llm=None,
+        tools=None,
+        intentional_definiton=None,
+        timeout: float | None = 200,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: Optional[TransductionCache] = None,
+        cache_mode: str = "use",
+        limiter: Optional[AdaptiveLimiter] = None,
+        max_iter=None,
+        reasoning=None,
         **kwargs,
-    ) -> Union[BaseModel, Iterable[BaseModel]]:
-
-        default_user_prompt = "\n".join(
+    ):
+        self.atype = atype
+        self.verbose = verbose
+        self.llm = llm or watsonx_llm
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.cache = cache
+        self.cache_mode = cache_mode
+        self.limiter = limiter
+        self.intentional_definiton = (
+            intentional_definiton
+            or "Generate an object of the specified Pydantic Type from the following input."
+        )
+        self.prompt_params = {
+            "role": "Task Executor",
+            "goal": "You execute tasks",
+            "backstory": "You are always faithful and provide only fact based answers.",
+            "expected_output": "Described by Pydantic Type",
+        }
+        self.prompt_params.update(kwargs)
+        # everything but the input is shared by all the prompts, and sent first
+        self.prompt_prefix = "\n".join(
             [
+                f"You are {self.prompt_params['role']}. {self.prompt_params['backstory']}",
+                f"Your personal goal is: {self.prompt_params['goal']}",
                 self.intentional_definiton,
-                "Generate an object of the specified Pydantic Type from the following input.\n",
+                f"Expected output: {self.prompt_params['expected_output']}",
+                "Answer with a JSON object matching this schema:",
+                canonical_json(get_json_schema(self.atype)),
             ]
         )
-        self.llm_params.update(kwargs)
-        if isinstance(input, str):
-            result = await openai_response(
-                model=os.getenv("VLLM_MODEL_ID"),
-                base_url=os.getenv("VLLM_URL"),
-                user_prompt=default_user_prompt + str(state),
-                **self.llm_params,
-            )
-            decoded_result = self.atype.model_validate_json(result)
-            return decoded_result
-
-        elif isinstance(input, Iterable) and all(isinstance(i, str) for i in input):
-            processes = []
-            for state in input:
-                corutine = openai_response(
-                    model=os.getenv("VLLM_MODEL_ID"),
-                    base_url=os.getenv("VLLM_URL"),
-                    user_prompt=default_user_prompt + str(state),
-                    **self.llm_params,
-                )
-                processes.append(corutine)
-            results = await asyncio.wait_for(
-                asyncio.gather(*processes, return_exceptions=True), timeout=self.timeout
-            )
-
-            decoded_results = []
-            for result in results:
-                if issubclass(type(result), Exception):
-                    if self.verbose:
-                        logger.debug("Something went wrongs, generating empty states")
-                    decoded_results.append(self.atype())
-                else:
-                    decoded_results.append(self.atype.model_validate_json(result))
-            return decoded_results
-        else:
-            return NotImplemented
+
+    @property
+    def cache_context(self) -> Any:
+        return {"prompt": self.prompt_prefix, "llm": llm_sampling_params(self.llm)}
+
+    def _messages(self, input: str) -> List[dict]:
+        return build_messages(
+            self.prompt_prefix,
+            input[: self.MAX_CHAR_PROMPT],
+            cache_control=supports_cache_control(self.llm),
+        )
+
+    async def _execute(self, input: str) -> BaseModel:
+        answer = await llm_acall(
+            self.llm, self._messages(input), response_model=self.atype
+        )
+        return self._decode(answer)
+
+    def _decode(self, answer: Any) -> BaseModel:
+        if isinstance(answer, self.atype):
+            return answer
+        if isinstance(answer, BaseModel):
+            return self.atype.model_validate(answer.model_dump())
+        if isinstance(answer, dict):
+            return self.atype.model_validate(answer)
+        answer = str(answer).strip()
+        if answer.startswith("```"):
+            # drop a markdown code fence around the JSON
+            answer = answer.split("\n", 1)[-1].rsplit("```", 1)[0]
+        return self.atype.model_validate_json(answer)
 
 
 class PydanticTransducerCrewAI(PydanticTransducer):
@@ -208,11 +469,19 @@ class PydanticTransducerCrewAI(PydanticTransducer):
         intentional_definiton=None,
         max_iter=max_iter,
         timeout: float | None = 200,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: Optional[TransductionCache] = None,
+        cache_mode: str = "use",
+        limiter: Optional[AdaptiveLimiter] = None,
         **kwargs,
     ):
         self.atype = atype
         self.llm = llm or watsonx_llm
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.cache = cache
+        self.cache_mode = cache_mode
+        self.limiter = limiter
         self.intentional_definiton = (
             intentional_definiton
             or "Generate an object of the specified Pydantic Type from the following input."
@@ -251,6 +520,14 @@ class PydanticTransducerCrewAI(PydanticTransducer):
             chat_llm=self.llm,
         )
 
+    @property
+    def cache_context(self) -> Any:
+        return {
+            "instructions": self.intentional_definiton,
+            "prompt": self.prompt_params,
+            "llm": llm_sampling_params(self.llm),
+        }
+
     async def _execute(self, input: str) -> BaseModel:
         answer = await self.crew.kickoff_async(
             {"task_description": input[: self.MAX_CHAR_PROMPT]}
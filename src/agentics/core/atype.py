@@ -1,6 +1,8 @@
 import csv
+import datetime
 import json
 import types
+from itertools import islice
 from typing import (
     Any,
     Dict,
@@ -17,7 +19,8 @@ from typing import (
 import pandas as pd
 from pydantic import BaseModel, Field, create_model
 
-from agentics.core.utils import sanitize_field_name
+from agentics.core.jsonio import iter_jsonl_records
+from agentics.core.utils import cached_model, sanitize_field_name
 
 
 class AGString(BaseModel):
@@ -115,6 +118,15 @@ import os
 from typing import IO
 
 
+def pydantic_model_from_columns(columns: List[str]) -> type[BaseModel]:
+    """Model with an optional string field for each CSV column"""
+    columns = [sanitize_field_name(x) for x in columns]
+    model_name = "AType#" + ":".join(columns)
+    fields = {col: (Optional[str], None) for col in columns}
+
+    return create_model(model_name, **fields)
+
+
 def pydantic_model_from_csv(
     file_source: Union[str, os.PathLike, IO[str], IO[bytes], object],
 ) -> type[BaseModel]:
@@ -166,11 +178,7 @@ def pydantic_model_from_csv(
         if not reader.fieldnames:
             raise ValueError("CSV file appears to have no header row.")
 
-        columns = [sanitize_field_name(x) for x in reader.fieldnames]
-        model_name = "AType#" + ":".join(columns)
-        fields = {col: (Optional[str], None) for col in columns}
-
-        return create_model(model_name, **fields)
+        return pydantic_model_from_columns(reader.fieldnames)
     finally:
         if close_after:
             f.close()
@@ -222,7 +230,8 @@ def pydantic_model_from_dict(dict) -> type[BaseModel]:
 def pydantic_model_from_jsonl(
     file_path: str, sample_size: int = 100
 ) -> type[BaseModel]:
-    df = pd.read_json(file_path, lines=True, nrows=sample_size, encoding="utf-8")
+    # only the sampled lines are parsed, the rest of the file may not even be valid json
+    df = pd.DataFrame(list(islice(iter_jsonl_records(file_path), sample_size)))
 
     model_name = "AType#" + ":".join(df.columns)
     fields = {}
@@ -252,6 +261,66 @@ def pydantic_model_from_dataframe(
     return create_model(model_name, **fields)
 
 
+# metadata of Arrow string columns holding JSON, for field types Arrow can't represent
+JSON_METADATA = {b"agentics.encoding": b"json"}
+
+
+def pydantic_type_from_arrow(arrow_type: Any, name: str = "Struct") -> Any:
+    """Pydantic type of an Arrow type, nested models for structs, str when there is no match"""
+    import pyarrow.types as pat
+
+    if pat.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    if pat.is_boolean(arrow_type):
+        return bool
+    if pat.is_integer(arrow_type):
+        return int
+    if pat.is_floating(arrow_type) or pat.is_decimal(arrow_type):
+        return float
+    if pat.is_string(arrow_type) or pat.is_large_string(arrow_type):
+        return str
+    if pat.is_binary(arrow_type) or pat.is_large_binary(arrow_type):
+        return bytes
+    if pat.is_timestamp(arrow_type):
+        return datetime.datetime
+    if pat.is_date(arrow_type):
+        return datetime.date
+    if pat.is_time(arrow_type):
+        return datetime.time
+    if pat.is_list(arrow_type) or pat.is_large_list(arrow_type):
+        return List[Optional[pydantic_type_from_arrow(arrow_type.value_type, name)]]
+    if pat.is_map(arrow_type):
+        return Dict[
+            pydantic_type_from_arrow(arrow_type.key_type, name),
+            Optional[pydantic_type_from_arrow(arrow_type.item_type, name)],
+        ]
+    if pat.is_struct(arrow_type):
+        return pydantic_model_from_arrow_schema(list(arrow_type), name)
+    return str
+
+
+def pydantic_model_from_arrow_schema(schema: Any, name: str = None) -> Type[BaseModel]:
+    """
+    Atype of an Arrow schema (or list of fields), with an optional field per column. Column
+    names are sanitized and struct columns become nested models. JSON columns are typed Any, so
+    that their values are decoded.
+    """
+    names = [field.name for field in schema]
+    model_name = name or "AType#" + ":".join(names)
+    fields = {}
+    for field in schema:
+        field_name = sanitize_field_name(field.name)
+        if field.metadata == JSON_METADATA:
+            pydantic_type = Any
+        else:
+            pydantic_type = pydantic_type_from_arrow(
+                field.type, field_name.capitalize()
+            )
+        fields[field_name] = (Optional[pydantic_type], Field(default=None))
+
+    return create_model(model_name, **fields)
+
+
 def create_pydantic_model(
     fields: List[Tuple[str, str, str, bool]], name: str = None
 ) -> Type[BaseModel]:
@@ -309,23 +378,26 @@ def make_all_fields_optional(
     Returns:
         New Pydantic model class with all fields optional.
     """
-    fields = {}
-    for name, field in model_cls.model_fields.items():
-        # Original type
-        annotation = field.annotation
-        origin = get_origin(annotation)
-
-        # Make it Optional if not already
-        if origin is not Optional and annotation is not Any:
-            annotation = Optional[annotation]
-
-        fields[name] = (
-            annotation,
-            Field(default=None, title=field.title, description=field.description),
-        )
-
     new_name = rename_type or f"{model_cls.__name__}Optional"
-    return create_model(new_name, **fields)
+
+    def build() -> type[BaseModel]:
+        fields = {}
+        for name, field in model_cls.model_fields.items():
+            # Original type
+            annotation = field.annotation
+            origin = get_origin(annotation)
+
+            # Make it Optional if not already
+            if origin is not Optional and annotation is not Any:
+                annotation = Optional[annotation]
+
+            fields[name] = (
+                annotation,
+                Field(default=None, title=field.title, description=field.description),
+            )
+        return create_model(new_name, **fields)
+
+    return cached_model(("all_fields_optional", model_cls, new_name), build)
 
 
 def pretty_print_atype(atype, indent: int = 2):
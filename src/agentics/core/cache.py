@@ -0,0 +1,193 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Type
+
+from loguru import logger
+from pydantic import BaseModel
+
+from agentics.core.utils import get_json_schema
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "agentics", "transductions.sqlite"
+)
+
+CACHE_MODES = ("use", "bypass", "refresh")
+
+# process-wide in-memory caches are bounded, since they live as long as the process
+MEMORY_CACHE_MAX_ENTRIES = int(os.getenv("AGENTICS_MEMORY_CACHE_MAX_ENTRIES", 10000))
+
+
+class TransductionCache:
+    """
+    Persistent, content-addressed store of transduction outputs backed by SQLite.
+
+    Entries are keyed by a hash of (model id, rendered instructions, target atype
+    JSON schema, input prompt) and hold the JSON dump of the transduced state.
+    The store is bounded by any combination of:
+        •	max_entries: least recently used entries are evicted first
+        •	max_bytes: total size of the stored outputs
+        •	ttl: seconds after which an entry is considered stale
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.path = path or os.getenv("AGENTICS_CACHE_PATH", DEFAULT_CACHE_PATH)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS transductions (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS transductions_accessed ON transductions (accessed)"
+            )
+
+    @staticmethod
+    def make_key(
+        model: Optional[str],
+        instructions: Optional[str],
+        atype: Type[BaseModel],
+        prompt: str,
+    ) -> str:
+        """Content hash identifying a single transduction call"""
+        payload = json.dumps(
+            [model, instructions, get_json_schema(atype), prompt],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored output for key, or None on a miss (expired entries are dropped)"""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created FROM transductions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM transductions WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE transductions SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, value: str):
+        """Store an output and enforce the eviction policy"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transductions VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now, now),
+            )
+            self._evict(now)
+
+    def evict(self):
+        """Drop expired entries and shrink the store to its configured bounds"""
+        with self._lock, self._conn:
+            self._evict(time.time())
+
+    def _evict(self, now: float):
+        if self.ttl is not None:
+            self._conn.execute(
+                "DELETE FROM transductions WHERE created < ?", (now - self.ttl,)
+            )
+        if self.max_entries is not None:
+            self._conn.execute(
+                """DELETE FROM transductions WHERE key IN (
+                    SELECT key FROM transductions ORDER BY accessed DESC LIMIT -1 OFFSET ?
+                )""",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            total = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM transductions"
+            ).fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                freed = 0
+                keys = []
+                for key, size in self._conn.execute(
+                    "SELECT key, size FROM transductions ORDER BY accessed ASC"
+                ):
+                    keys.append((key,))
+                    freed += size
+                    if freed >= excess:
+                        break
+                self._conn.executemany("DELETE FROM transductions WHERE key = ?", keys)
+
+    def clear(self):
+        """Remove all entries and reset counters"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM transductions")
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM transductions"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def __len__(self):
+        return self.stats()["entries"]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_open_caches: Dict[str, TransductionCache] = {}
+
+
+def get_transduction_cache(
+    cache: Optional[TransductionCache | str],
+) -> Optional[TransductionCache]:
+    """
+    Resolve a cache instance from either an instance or a path, reusing open stores. The shared
+    ":memory:" store keeps at most MEMORY_CACHE_MAX_ENTRIES least recently used entries.
+    """
+    if cache is None or isinstance(cache, TransductionCache):
+        return cache
+    if isinstance(cache, (str, os.PathLike)):
+        path = os.fspath(cache)
+        if path not in _open_caches:
+            logger.debug(f"Opening transduction cache at {path}")
+            _open_caches[path] = TransductionCache(
+                path,
+                max_entries=MEMORY_CACHE_MAX_ENTRIES if path == ":memory:" else None,
+            )
+        return _open_caches[path]
+    raise TypeError(f"Unsupported transduction cache: {type(cache).__name__}")
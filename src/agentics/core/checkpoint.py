@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from loguru import logger
+from pydantic import BaseModel
+
+
+class CheckpointStore:
+    """
+    Append-only JSONL log of completed states, used to resume long amap and transduction jobs.
+
+    Each line holds the input position, a hash of the input content and the output state:
+        {"index": 12, "hash": "…", "state": {...}}
+    Lines are flushed as soon as each state completes, so an interrupted job loses at most the
+    states that were in flight. On resume, a stored output is reused only when both its position
+    and its input hash match, later lines overriding earlier ones. Delete the file to start over.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    @staticmethod
+    def hash_input(*parts: Any) -> str:
+        """Content hash of an input, built from strings or pydantic states"""
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, BaseModel):
+                part = part.model_dump_json()
+            elif not isinstance(part, str):
+                part = json.dumps(part, sort_keys=True, default=str)
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def load(self) -> Dict[Tuple[int, str], Dict[str, Any]]:
+        """Read all the stored entries, skipping truncated or corrupted lines"""
+        entries = {}
+        if not os.path.exists(self.path):
+            return entries
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    entries[(entry["index"], entry["hash"])] = entry["state"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    logger.debug(f"Skipping corrupted checkpoint line in {self.path}")
+        return entries
+
+    def completed(self, hashes: Sequence[str]) -> Dict[int, Dict[str, Any]]:
+        """Stored outputs for the inputs whose position and hash match, by position"""
+        entries = self.load()
+        return {i: entries[(i, h)] for i, h in enumerate(hashes) if (i, h) in entries}
+
+    def append(self, index: int, input_hash: str, state: BaseModel):
+        if self._file is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(
+            json.dumps(
+                {
+                    "index": index,
+                    "hash": input_hash,
+                    "state": state.model_dump(mode="json"),
+                }
+            )
+            + "\n"
+        )
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_checkpoint(
+    path: Optional[str], hashes: Sequence[str], resume: bool
+) -> Tuple[Optional[CheckpointStore], Dict[int, Dict[str, Any]]]:
+    """Return the store for path (or None) and, when resuming, the outputs already completed"""
+    if not path:
+        return None, {}
+    store = CheckpointStore(path)
+    completed = store.completed(hashes) if resume else {}
+    if completed:
+        logger.debug(
+            f"Resuming from checkpoint {path}: {len(completed)}/{len(hashes)} states already completed"
+        )
+    return store, completed
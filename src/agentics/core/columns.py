@@ -0,0 +1,419 @@
+import types
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type, Union, get_args, get_origin
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from pydantic import BaseModel, create_model
+from pydantic_core import PydanticUndefined, core_schema
+
+from agentics.core.errors import AmapError
+from agentics.core.utils import cached_model, get_type_adapter, infer_pydantic_type
+
+# nullable pandas dtypes of the scalar field types, other fields are stored as objects
+FIELD_DTYPES = {int: "Int64", float: "Float64", bool: "boolean", str: "string"}
+# number of rows converted at once when iterating over ColumnarStates
+ITER_CHUNK_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def warn_columnar_copies():
+    """Logged once, the first time a state is read from a columnar AG"""
+    logger.warning(
+        "States of a columnar AG are copies, changes made to ag[i] are lost unless it is "
+        "assigned back with ag[i] = state"
+    )
+
+
+def states_to_frame(states: Sequence[BaseModel], fields: Sequence[str]) -> pd.DataFrame:
+    """DataFrame of the given fields of states, reading attributes without dumping the models"""
+    if isinstance(states, ColumnarStates):
+        return pd.DataFrame(
+            {field: numpy_column(states.frame[field]) for field in fields}
+        )
+    return pd.DataFrame(
+        {field: [state.__dict__.get(field) for state in states] for field in fields}
+    )
+
+
+def numpy_column(series: pd.Series) -> np.ndarray:
+    """
+    NumPy array of a column of a ColumnarStates: missing values are NaN in numeric columns and None
+    in the others, as for the columns built from pydantic states.
+    """
+    if pd.api.types.is_bool_dtype(series.dtype) and not series.hasnans:
+        return series.to_numpy(dtype=bool)
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(
+        series.dtype
+    ):
+        if series.hasnans or pd.api.types.is_float_dtype(series.dtype):
+            return series.to_numpy(dtype=float, na_value=np.nan)
+        return series.to_numpy(dtype=np.int64)
+    return series.to_numpy(dtype=object, na_value=None)
+
+
+def column_values(column: Any, length: int, name: str) -> List[Any]:
+    """
+    Python values of a column returned by a vectorized function, with missing values (NaN, NaT)
+    as None. Scalars are broadcast to all the states.
+    """
+    if np.ndim(column) == 0 and not isinstance(column, (list, tuple)):
+        return [None if pd.isna(column) else column] * length
+    series = column if isinstance(column, pd.Series) else pd.Series(list(column))
+    if len(series) != length:
+        raise AmapError(
+            f"Column {name} has {len(series)} values, expected one per state ({length})"
+        )
+    missing = series.isna().to_numpy()
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        series = series.map(lambda t: t.isoformat() if not pd.isna(t) else None)
+    values = series.astype(object).tolist()
+    if missing.any():
+        values = [None if m else v for v, m in zip(values, missing)]
+    return values
+
+
+def output_columns(
+    result: Any, output_fields: Optional[Sequence[str]], fields: Sequence[str]
+) -> Dict[str, Any]:
+    """Named output columns of a vectorized function returning a mapping or a single column"""
+    if isinstance(result, pd.DataFrame):
+        result = {name: result[name] for name in result.columns}
+    if isinstance(result, Mapping):
+        return {
+            name: column
+            for name, column in result.items()
+            if not output_fields or name in output_fields
+        }
+    if output_fields:
+        return {output_fields[0]: result}
+    if len(fields) == 1:
+        return {fields[0]: result}
+    raise AmapError(
+        "A vectorized function of several fields returning a single column needs output_fields"
+    )
+
+
+def extend_atype(atype: Type[BaseModel], columns: Dict[str, Any]) -> Type[BaseModel]:
+    """atype with an optional field for each new column, typed after the column values"""
+    new_fields = {}
+    for name, column in columns.items():
+        if name in atype.model_fields:
+            continue
+        if not isinstance(column, pd.Series):
+            column = pd.Series(list(column) if np.ndim(column) else [column])
+        new_fields[name] = infer_pydantic_type(
+            column.dtype, sample_values=column.dropna()
+        )
+    if not new_fields:
+        return atype
+    return cached_model(
+        ("extend_atype", atype, tuple(new_fields.items())),
+        lambda: create_model(
+            f"{atype.__name__}_extended",
+            __base__=atype,
+            **{name: (tp, None) for name, tp in new_fields.items()},
+        ),
+    )
+
+
+def column_lists(
+    frame: pd.DataFrame, columns: Optional[Iterable[str]] = None
+) -> Dict[str, List[Any]]:
+    """Python values of the columns of a frame, with None for missing values"""
+    lists = {}
+    for column in frame.columns if columns is None else columns:
+        values = frame[column].to_numpy(dtype=object, na_value=None).tolist()
+        if frame[column].dtype == object:
+            values = [python_value(v) for v in values]
+        lists[column] = values
+    return lists
+
+
+def field_dtype(annotation: Any) -> Optional[str]:
+    """Nullable pandas dtype of a field annotation, None when values are stored as objects"""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+    return FIELD_DTYPES.get(annotation)
+
+
+def python_value(value: Any) -> Any:
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class ColumnarStates(Sequence):
+    """
+    Columnar store of the states of an AG, used in place of the list of pydantic objects.
+
+    Each field of `atype` is a column of `frame`, with nullable pandas dtypes for int, float,
+    bool and str fields and object columns for the other ones. States are built lazily, with
+    model_construct, when they are indexed or iterated, so memory is that of the columns rather
+    than of one pydantic object per state. Built states are copies: changes are written back with
+    `states[i] = state`. Slicing, take, project, merge and product work on the columns directly.
+    """
+
+    def __init__(self, atype: Type[BaseModel], frame: pd.DataFrame):
+        self.atype = atype
+        self._frame = frame.reset_index(drop=True)
+        # appended states and frames, concatenated at once the next time frame is read
+        self._pending: List[Union[pd.DataFrame, List[BaseModel]]] = []
+        self._pending_rows = 0
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        if self._pending:
+            frames, states = [self._frame], []
+            for chunk in self._pending + [None]:
+                if isinstance(chunk, list):
+                    states.extend(chunk)
+                    continue
+                if states:
+                    frames.append(ColumnarStates.from_states(states, self.atype).frame)
+                    states = []
+                if chunk is not None:
+                    frames.append(chunk)
+            self._frame = pd.concat(frames, ignore_index=True)
+            self._pending, self._pending_rows = [], 0
+        return self._frame
+
+    @frame.setter
+    def frame(self, frame: pd.DataFrame):
+        self._frame = frame
+        self._pending, self._pending_rows = [], 0
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any):
+        # kept as is by AG validation, dumped as the list of states
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda states: [state.model_dump() for state in states]
+            ),
+        )
+
+    @staticmethod
+    def column(atype: Type[BaseModel], field: str, values: Any) -> Any:
+        dtype = field_dtype(atype.model_fields[field].annotation)
+        if dtype is not None:
+            try:
+                return pd.array(values, dtype=dtype)
+            except (TypeError, ValueError):
+                pass
+        if isinstance(values, pd.Series):
+            values = values.to_numpy(dtype=object, na_value=None)
+        return pd.array(list(values), dtype=object)
+
+    @staticmethod
+    def defaults(atype: Type[BaseModel], field: str, length: int) -> List[Any]:
+        """
+        length default values of a field, from its default or default_factory as pydantic would
+        set them, None for required fields. Mutable defaults are copied for each state.
+        """
+        info = atype.model_fields[field]
+        default = info.get_default(call_default_factory=True)
+        if default is PydanticUndefined:
+            return [None] * length
+        if info.default_factory is None and isinstance(
+            default, (str, int, float, bool, type(None))
+        ):
+            return [default] * length
+        return [default] + [
+            info.get_default(call_default_factory=True) for _ in range(length - 1)
+        ]
+
+    @classmethod
+    def from_columns(
+        cls, atype: Type[BaseModel], columns: Mapping[str, Any], length: int
+    ) -> "ColumnarStates":
+        """States from a mapping of field columns, missing fields get their default value"""
+        data = {}
+        for field in atype.model_fields:
+            if field in columns:
+                data[field] = cls.column(atype, field, columns[field])
+            else:
+                data[field] = cls.column(
+                    atype, field, cls.defaults(atype, field, length)
+                )
+        return cls(atype, pd.DataFrame(data, index=pd.RangeIndex(length)))
+
+    @classmethod
+    def from_states(
+        cls, states: Iterable[BaseModel], atype: Optional[Type[BaseModel]] = None
+    ) -> "ColumnarStates":
+        if isinstance(states, ColumnarStates) and atype in (None, states.atype):
+            return states
+        states = list(states)
+        atype = atype or type(states[0])
+        return cls.from_columns(
+            atype,
+            {
+                field: [state.__dict__.get(field) for state in states]
+                for field in atype.model_fields
+            },
+            len(states),
+        )
+
+    @classmethod
+    def from_frame(
+        cls,
+        atype: Type[BaseModel],
+        frame: pd.DataFrame,
+        validate: bool = True,
+        chunk_size: int = 10000,
+    ) -> "ColumnarStates":
+        """
+        States from the columns of a DataFrame. With validate, rows are validated against atype
+        chunk by chunk, so that only one chunk of pydantic objects is alive at a time.
+        """
+        if not validate:
+            return cls.from_columns(
+                atype,
+                {c: frame[c] for c in frame.columns if c in atype.model_fields},
+                len(frame),
+            )
+        adapter = get_type_adapter(List[atype])
+        chunks = []
+        for start in range(0, len(frame), chunk_size):
+            records = column_lists(frame.iloc[start : start + chunk_size])
+            states = adapter.validate_python(
+                [dict(zip(records, row)) for row in zip(*records.values())]
+            )
+            chunks.append(cls.from_states(states, atype).frame)
+        if not chunks:
+            return cls.from_columns(atype, {}, 0)
+        return cls(atype, pd.concat(chunks, ignore_index=True))
+
+    def _states(self, start: int, end: int) -> List[BaseModel]:
+        """States of rows [start, end), converting each column slice to Python values at once"""
+        columns = column_lists(self.frame.iloc[start:end], self.atype.model_fields)
+        fields = list(columns)
+        return [
+            self.atype.model_construct(**dict(zip(fields, row)))
+            for row in zip(*columns.values())
+        ]
+
+    def __len__(self) -> int:
+        return len(self._frame) + self._pending_rows
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return ColumnarStates(self.atype, self.frame.iloc[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ColumnarStates index out of range")
+        return self._states(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        for start in range(0, len(self), ITER_CHUNK_SIZE):
+            yield from self._states(start, start + ITER_CHUNK_SIZE)
+
+    def __setitem__(self, index: int, state: BaseModel):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ColumnarStates assignment index out of range")
+        for field in self.atype.model_fields:
+            self.frame.at[index, field] = state.__dict__.get(field)
+
+    def extend(self, states: Iterable[BaseModel]):
+        """Appended states are buffered, so that appending in a loop stays linear"""
+        if isinstance(states, ColumnarStates) and states.atype is self.atype:
+            chunk = states.frame
+        else:
+            chunk = list(states)
+        if len(chunk):
+            self._pending.append(chunk)
+            self._pending_rows += len(chunk)
+
+    def append(self, state: BaseModel):
+        self.extend([state])
+
+    def __add__(self, other: Iterable[BaseModel]) -> "ColumnarStates":
+        other = ColumnarStates.from_states(other, self.atype)
+        return ColumnarStates(
+            self.atype, pd.concat([self.frame, other.frame], ignore_index=True)
+        )
+
+    def __radd__(self, other: List[BaseModel]) -> List[BaseModel]:
+        return list(other) + list(self)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and list(self) == list(other)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ColumnarStates":
+        return ColumnarStates(self.atype, self.frame.copy(deep=True))
+
+    def __repr__(self) -> str:
+        return f"ColumnarStates({self.atype.__name__}, {len(self)} states)"
+
+    def to_list(self) -> List[BaseModel]:
+        return list(self)
+
+    def take(self, indices: Sequence[int]) -> "ColumnarStates":
+        return ColumnarStates(self.atype, self.frame.take(list(indices)))
+
+    def with_columns(
+        self, atype: Type[BaseModel], columns: Mapping[str, Any]
+    ) -> "ColumnarStates":
+        """States of atype with the given columns replaced or added"""
+        return ColumnarStates.from_columns(
+            atype,
+            {field: self.frame[field] for field in self.frame.columns} | dict(columns),
+            len(self),
+        )
+
+    def project(
+        self, atype: Type[BaseModel], mapping: Optional[Dict[str, str]] = None
+    ) -> "ColumnarStates":
+        """States of atype from the columns with the same name, or renamed by {old: new} mapping"""
+        if mapping:
+            columns = {new: self.frame[old] for old, new in mapping.items()}
+        else:
+            columns = {field: self.frame[field] for field in self.frame.columns}
+        return ColumnarStates.from_columns(
+            atype,
+            {k: v for k, v in columns.items() if k in atype.model_fields},
+            len(self),
+        )
+
+    def merge(
+        self, other: "ColumnarStates", atype: Type[BaseModel]
+    ) -> "ColumnarStates":
+        """Positional merge where other wins, padding the shorter side as zip_longest"""
+        n = max(len(self), len(other))
+        left, right = column_lists(self.frame), column_lists(other.frame)
+        columns = {}
+        for field in atype.model_fields:
+            if field in right:
+                values = right[field] + left.get(field, [])[len(other) :]
+            else:
+                values = left.get(field, [])
+            columns[field] = values + ColumnarStates.defaults(
+                atype, field, n - len(values)
+            )
+        return ColumnarStates.from_columns(atype, columns, n)
+
+    def product(
+        self, other: "ColumnarStates", atype: Type[BaseModel]
+    ) -> "ColumnarStates":
+        """Each state of self combined with each state of other, fields of self winning"""
+        n, m = len(self), len(other)
+        left = self.frame.take(np.repeat(np.arange(n), m)).reset_index(drop=True)
+        right = other.frame.take(np.tile(np.arange(m), n)).reset_index(drop=True)
+        columns = {field: right[field] for field in right.columns}
+        columns.update({field: left[field] for field in left.columns})
+        return ColumnarStates.from_columns(
+            atype, {k: v for k, v in columns.items() if k in atype.model_fields}, n * m
+        )
@@ -0,0 +1,195 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from agentics.core.errors import is_transient_error
+from agentics.core.llm_connections import available_llms
+
+LATENCY_FLOOR = 0.05
+
+
+class AdaptiveLimiter:
+    """
+    Additive-increase / multiplicative-decrease (AIMD) concurrency limiter for LLM calls.
+
+    The limit grows by `increase` once a full window of calls (as many as the current limit) has
+    completed while latency stays healthy, i.e. below `latency_tolerance` times the best observed
+    latency. It is multiplied by `decrease_factor` when a call fails with a transient error such as
+    a 429 or a timeout. Only calls started after the last decrease can trigger a new one, so a burst
+    of failures from the same wave cuts the limit once.
+    The current limit is exposed as `limit` and every adjustment is recorded in `history`.
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        history_size: int = 1000,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.in_flight = 0
+        self.latency: Optional[float] = None  # exponentially weighted moving average
+        self.best_latency: Optional[float] = None
+        self.history: deque = deque(maxlen=history_size)
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._waiters: deque = deque()
+        self._record("init")
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def set_max_limit(self, max_limit: int):
+        self.max_limit = max_limit
+        if self._limit > max_limit:
+            self._limit = float(max(max_limit, self.min_limit))
+            self._record("max_limit")
+
+    async def acquire(self):
+        while self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # hand a slot that may have been granted meanwhile to the next waiter
+                self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def release(self, started: float, error: Optional[BaseException] = None):
+        self.in_flight -= 1
+        if error is None:
+            self._on_success(time.monotonic() - started)
+        elif isinstance(error, Exception) and is_transient_error(error):
+            self._on_overload(started)
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one slot of the limit for the duration of a call, reporting its outcome"""
+        await self.acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except asyncio.CancelledError:
+            self.in_flight -= 1
+            self._wake()
+            raise
+        except Exception as e:
+            self.release(started, e)
+            raise
+        else:
+            self.release(started)
+
+    def _on_success(self, latency: float):
+        self.latency = (
+            latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+        )
+        self.best_latency = (
+            self.latency
+            if self.best_latency is None
+            else min(self.best_latency, self.latency)
+        )
+        # variations below LATENCY_FLOOR are noise for LLM calls
+        if self.latency > self.latency_tolerance * max(
+            self.best_latency, LATENCY_FLOOR
+        ):
+            self._successes = 0
+            return
+        self._successes += 1
+        if self._successes >= self.limit and self._limit < self.max_limit:
+            self._successes = 0
+            self._limit = min(self.max_limit, self._limit + self.increase)
+            self._record("increase")
+
+    def _on_overload(self, started: float):
+        if started < self._last_decrease:
+            return
+        self._successes = 0
+        self._last_decrease = time.monotonic()
+        new_limit = max(self.min_limit, self._limit * self.decrease_factor)
+        if new_limit < self._limit:
+            self._limit = new_limit
+            self._record("decrease")
+            logger.debug(f"Concurrency limit for {self.name} decreased to {self.limit}")
+
+    def _wake(self):
+        free = self.limit - self.in_flight
+        for waiter in list(self._waiters):
+            if free <= 0:
+                break
+            self._waiters.remove(waiter)
+            # waiters left behind by a closed event loop can't be resumed
+            if not waiter.done() and not waiter.get_loop().is_closed():
+                waiter.set_result(None)
+                free -= 1
+
+    def _record(self, reason: str):
+        self.history.append(
+            {
+                "time": time.time(),
+                "limit": self.limit,
+                "reason": reason,
+                "in_flight": self.in_flight,
+                "latency": self.latency,
+            }
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "latency": self.latency,
+            "adjustments": len(self.history) - 1,
+        }
+
+
+limiters: Dict[str, AdaptiveLimiter] = {}
+
+
+def limiter_key(llm: Any) -> str:
+    """Name of the provider entry in available_llms for llm, or a name derived from its config"""
+    for name, provider in available_llms.items():
+        if provider is llm:
+            return name
+    return str(
+        getattr(llm, "model", None)
+        or getattr(llm, "base_url", None)
+        or type(llm).__name__
+    )
+
+
+def get_limiter(llm: Any = None, **kwargs) -> AdaptiveLimiter:
+    """
+    Return the process-wide adaptive limiter of a provider, creating it on first use.
+    `llm` can be a provider name from available_llms or an llm instance.
+    """
+    key = llm if isinstance(llm, str) else limiter_key(llm)
+    if key not in limiters:
+        limiters[key] = AdaptiveLimiter(name=key, **kwargs)
+    return limiters[key]
+
+
+def limiters_history() -> Dict[str, List[Dict[str, Any]]]:
+    return {name: list(limiter.history) for name, limiter in limiters.items()}
@@ -0,0 +1,144 @@
+import csv
+import io
+import os
+from itertools import islice
+from typing import IO, Any, Dict, Iterator, List, Optional, Type, Union
+
+import pandas as pd
+from pydantic import BaseModel
+
+from agentics.core.columns import field_dtype
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # optional, only needed for engine="pyarrow"
+    pa = pa_csv = None
+
+CsvSource = Union[str, os.PathLike, IO[str], IO[bytes]]
+
+# bytes parsed at a time by the pyarrow streaming reader
+ARROW_CSV_BLOCK_SIZE = 1 << 24
+
+ARROW_FIELD_TYPES = {"Int64": "int64", "Float64": "float64", "boolean": "bool_"}
+
+
+def pyarrow_csv_available() -> bool:
+    return pa_csv is not None
+
+
+class ShortRowError(ValueError):
+    """A row has fewer cells than the header"""
+
+
+def _open_text(source: CsvSource) -> tuple[IO[str], bool]:
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, encoding="utf-8-sig", newline=""), True
+    if not isinstance(source, io.TextIOBase):
+        return io.TextIOWrapper(source, encoding="utf-8-sig", newline=""), False
+    return source, False
+
+
+def iter_csv_frames(
+    source: CsvSource,
+    usecols: Optional[List[str]] = None,
+    max_rows: Optional[int] = None,
+    chunk_size: int = 100_000,
+) -> Iterator[pd.DataFrame]:
+    """
+    Frames of the string cells of chunk_size rows, read with the csv module. Blank lines are
+    skipped and the cells missing from short rows are None, as with csv.DictReader. A frame with
+    the header only is yielded for a file without rows.
+    """
+    f, close = _open_text(source)
+    try:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+        keep = [
+            i for i, name in enumerate(header) if usecols is None or name in usecols
+        ]
+        columns = [header[i] for i in keep]
+        rows = islice((row for row in reader if row), max_rows)
+        empty = True
+        while chunk := list(islice(rows, chunk_size)):
+            empty = False
+            yield pd.DataFrame(
+                [[row[i] if i < len(row) else None for i in keep] for row in chunk],
+                columns=columns,
+                dtype=object,
+            )
+        if empty:
+            yield pd.DataFrame(columns=columns, dtype=object)
+    finally:
+        if close:
+            f.close()
+
+
+def read_csv_header(source: Union[str, os.PathLike, IO[bytes]]) -> List[str]:
+    f, close = _open_text(source)
+    try:
+        header = next(csv.reader(f), None)
+    finally:
+        if close:
+            f.close()
+        else:
+            f.detach()
+            source.seek(0)
+    if header is None:
+        raise pd.errors.EmptyDataError("No columns to parse from file")
+    return header
+
+
+def iter_arrow_csv_frames(
+    source: Union[str, os.PathLike, IO[bytes]],
+    usecols: Optional[List[str]] = None,
+    max_rows: Optional[int] = None,
+    atype: Optional[Type[BaseModel]] = None,
+    block_size: int = ARROW_CSV_BLOCK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Frames of a CSV file parsed by the pyarrow streaming reader, one block at a time, so that
+    only one block of rows is in memory. Cells are read as strings, empty cells included.
+    With atype, int, float and bool fields are parsed by pyarrow, empty cells as None. Raises
+    ShortRowError when a row has fewer cells than the header.
+    """
+    if pa is None:
+        raise ImportError(
+            "engine='pyarrow' requires pyarrow, install it with `pip install pyarrow`"
+        )
+    column_types: Dict[str, Any] = {}
+    for name in read_csv_header(source):
+        dtype = None
+        if atype is not None and name in atype.model_fields:
+            dtype = field_dtype(atype.model_fields[name].annotation)
+        column_types[name] = getattr(pa, ARROW_FIELD_TYPES.get(dtype, "string"))()
+    try:
+        reader = pa_csv.open_csv(
+            source,
+            read_options=pa_csv.ReadOptions(block_size=block_size),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                include_columns=usecols,
+                null_values=[""],
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+        remaining = max_rows
+        empty = True
+        for batch in reader:
+            if remaining is not None:
+                if remaining <= 0:
+                    break
+                batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+            empty = False
+            yield batch.to_pandas()
+        if empty:
+            yield reader.schema.empty_table().to_pandas()
+    except pa.ArrowInvalid as e:
+        if "Expected" in str(e) and "columns, got" in str(e):
+            raise ShortRowError(str(e)) from e
+        raise
@@ -1,3 +1,9 @@
+import asyncio
+import json
+
+from pydantic import ValidationError
+
+
 class AgenticsError(Exception):
     """Base class for all custom exceptions in Agentics."""
 
@@ -14,3 +20,39 @@ class InvalidStateError(AgenticsError):
 
 class TransductionError(AgenticsError):
     pass
+
+
+TRANSIENT_STATUS_CODES = {408, 409, 425, 429}
+
+TRANSIENT_ERROR_NAMES = (
+    "RateLimit",
+    "Timeout",
+    "ServiceUnavailable",
+    "InternalServer",
+    "APIConnection",
+    "Overloaded",
+    "TransportError",
+)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Classify an error raised while executing a state.
+    Transient errors (timeouts, connection problems, 429 and 5xx responses) are worth retrying
+    with backoff, everything else (e.g. validation errors) is considered permanent.
+    """
+    if isinstance(error, (ValidationError, json.JSONDecodeError)):
+        return False
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return status_code in TRANSIENT_STATUS_CODES or status_code >= 500
+    # provider SDKs (openai, litellm, httpx) name their transient errors consistently
+    return any(
+        name in cls.__name__
+        for cls in type(error).__mro__
+        for name in TRANSIENT_ERROR_NAMES
+    )
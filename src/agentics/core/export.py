@@ -0,0 +1,182 @@
+import csv
+import gzip
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Dict, List, Literal, Optional, Sequence, Type
+
+from loguru import logger
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
+
+from agentics.core.columns import field_dtype
+from agentics.core.jsonio import json_dumps
+from agentics.core.shards import shard_pool, shard_ranges
+from agentics.core.utils import clean_for_json, get_type_adapter
+
+try:
+    import zstandard
+except ImportError:  # optional, only needed for zstd compression
+    zstandard = None
+
+Compression = Literal["gzip", "zstd"]
+ExportFormat = Literal["jsonl", "csv"]
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+WRITE_BUFFER_SIZE = 1 << 20
+EXPORT_CHUNK_SIZE = 10_000
+
+# states being exported by the shard writer processes, set once when each one starts
+_export: Dict[str, Any] = {}
+
+
+def infer_compression(path: str) -> Optional[Compression]:
+    return COMPRESSION_SUFFIXES.get(os.path.splitext(path)[1])
+
+
+def open_output(path: str, compression: Optional[Compression] = None) -> IO[bytes]:
+    """Buffered binary stream writing to path, compressed with gzip or zstd"""
+    if compression is None:
+        return open(path, "wb", buffering=WRITE_BUFFER_SIZE)
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        if zstandard is None:
+            raise ImportError(
+                "zstd compression requires zstandard, install it with `pip install zstandard`"
+            )
+        return zstandard.ZstdCompressor().stream_writer(
+            open(path, "wb", buffering=WRITE_BUFFER_SIZE), closefd=True
+        )
+    raise ValueError(f"Unknown compression {compression}")
+
+
+def shard_path(path: str, index: int, shards: int) -> str:
+    """out.jsonl.gz -> out-00001-of-00004.jsonl.gz"""
+    base, ext = os.path.splitext(path)
+    if ext in COMPRESSION_SUFFIXES:
+        base, inner = os.path.splitext(base)
+        ext = inner + ext
+    return f"{base}-{index:05d}-of-{shards:05d}{ext}"
+
+
+def _jsonl_line(state: BaseModel, atype: Type[BaseModel]) -> str:
+    try:
+        return state.model_dump_json()
+    except PydanticSerializationError as e:
+        # values pydantic can't serialize are written as strings, as clean_for_json does
+        try:
+            return json.dumps(clean_for_json(state))
+        except Exception:
+            logger.debug(f"⚠️ Failed to serialize state: {e}")
+            return atype().model_dump_json()
+
+
+def jsonl_chunk(states: Sequence[BaseModel], atype: Type[BaseModel]) -> bytes:
+    return "".join(_jsonl_line(state, atype) + "\n" for state in states).encode()
+
+
+def dump_rows(
+    states: Sequence[BaseModel],
+    atype: Type[BaseModel],
+    mode: Literal["json", "python"] = "json",
+) -> List[Dict]:
+    """Dicts of states, dumped with a single pydantic-core call when they are all of atype"""
+    if all(type(state) is atype for state in states):
+        try:
+            return get_type_adapter(List[atype]).dump_python(list(states), mode=mode)
+        except PydanticSerializationError:
+            pass
+    rows = []
+    for state in states:
+        try:
+            rows.append(state.model_dump(mode=mode))
+        except PydanticSerializationError:
+            rows.append(clean_for_json(state))
+    return rows
+
+
+def csv_chunk(
+    states: Sequence[BaseModel], atype: Type[BaseModel], header: bool = False
+) -> bytes:
+    fields = list(atype.model_fields)
+    rows = dump_rows(states, atype)
+    columns = [[row.get(field) for row in rows] for field in fields]
+    for i, field in enumerate(atype.model_fields.values()):
+        if not field_dtype(field.annotation):
+            # nested values are written as JSON, so that they can be parsed back
+            columns[i] = [
+                json_dumps(value) if isinstance(value, (dict, list)) else value
+                for value in columns[i]
+            ]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(fields)
+    writer.writerows(zip(*columns))
+    return buffer.getvalue().encode("utf-8")
+
+
+def write_states(
+    path: str,
+    states: Sequence[BaseModel],
+    atype: Type[BaseModel],
+    format: ExportFormat,
+    compression: Optional[Compression] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> int:
+    """
+    Serialize states chunk_size at a time straight from pydantic-core and write each chunk with a
+    single buffered write. Returns the number of states written.
+    """
+    with open_output(path, compression) as f:
+        if format == "csv":
+            f.write(csv_chunk([], atype, header=True))
+        for start in range(0, len(states), chunk_size):
+            chunk = states[start : start + chunk_size]
+            f.write(
+                csv_chunk(chunk, atype)
+                if format == "csv"
+                else jsonl_chunk(chunk, atype)
+            )
+    return len(states)
+
+
+def _init_export(states: Sequence[BaseModel], atype: Type[BaseModel]):
+    _export.update(states=states, atype=atype)
+
+
+def _write_shard(path: str, start: int, end: int, options: Dict[str, Any]) -> int:
+    return write_states(path, _export["states"][start:end], _export["atype"], **options)
+
+
+def write_sharded(
+    path: str,
+    states: Sequence[BaseModel],
+    atype: Type[BaseModel],
+    shards: int,
+    **options,
+) -> List[str]:
+    """
+    Write states to `shards` files named after path, in parallel. Shard writers are processes
+    (see shard_pool), or threads when the states can't be sent to them.
+    """
+    ranges = shard_ranges(len(states), shards)
+    paths = [shard_path(path, i, len(ranges)) for i in range(len(ranges))]
+    pool = shard_pool(len(ranges), _init_export, states, atype)
+    if pool is not None:
+        jobs = [(p, start, end, options) for p, (start, end) in zip(paths, ranges)]
+        with pool:
+            list(pool.map(_write_shard, *zip(*jobs)))
+    else:
+        with ThreadPoolExecutor(len(ranges)) as pool:
+            list(
+                pool.map(
+                    lambda job: write_states(
+                        job[0], states[job[1] : job[2]], atype, **options
+                    ),
+                    [(p, start, end) for p, (start, end) in zip(paths, ranges)],
+                )
+            )
+    return paths
@@ -0,0 +1,143 @@
+import random
+import re
+import zlib
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"\w+")
+CHARS_PER_TOKEN = 4
+
+FEW_SHOTS_HEADER = "Here is a list of few shots examples for your task:\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of a prompt fragment, without calling a tokenizer"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def format_few_shot(source: str, target: str) -> str:
+    return "Example\nSOURCE:\n" + source + "\nTARGET:\n" + target + "\n"
+
+
+class FewShotIndex:
+    """
+    In-memory TF-IDF index of labelled (source, target) examples, built once per transduction to
+    pick the few shots of each input state.
+
+    Terms are hashed into `n_features` buckets and stored as a sparse inverted index in NumPy
+    arrays, so scoring a query only touches the examples sharing at least one term with it.
+    `select` returns up to k examples under a token budget, with one of the strategies:
+        •	similar: highest cosine similarity with the query first
+        •	random: a sample seeded by the query, so the same input always gets the same examples
+        •	first: in the order the examples were given
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[str],
+        targets: Sequence[str],
+        ids: Optional[Sequence[int]] = None,
+        n_features: int = 2**20,
+    ):
+        self.sources = list(sources)
+        self.targets = list(targets)
+        self.ids = list(ids) if ids is not None else list(range(len(self.sources)))
+        self.n_features = n_features
+
+        rows, features, counts = [], [], []
+        for row, source in enumerate(self.sources):
+            hashed, tf = self._terms(source)
+            rows.append(np.full(len(hashed), row, dtype=np.int64))
+            features.append(hashed)
+            counts.append(tf)
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        features = np.concatenate(features) if features else np.empty(0, np.int64)
+        counts = np.concatenate(counts) if counts else np.empty(0, dtype=np.int64)
+
+        # inverted index: entries sorted by feature, with the slice of each feature in vocab
+        order = np.argsort(features, kind="stable")
+        self._rows = rows[order]
+        features = features[order]
+        self._vocab, self._starts, df = np.unique(
+            features, return_index=True, return_counts=True
+        )
+        self._df = df
+        self._idf = np.log((1 + len(self.sources)) / (1 + df)) + 1
+        weights = (1 + np.log(counts[order])) * np.repeat(self._idf, df)
+        norms = np.sqrt(
+            np.bincount(self._rows, weights=weights**2, minlength=len(self.sources))
+        )
+        self._weights = weights / np.maximum(norms, 1e-12)[self._rows]
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def _terms(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        hashed = [
+            zlib.crc32(token.encode("utf-8")) % self.n_features
+            for token in TOKEN_PATTERN.findall(text.lower())
+        ]
+        return np.unique(np.asarray(hashed, dtype=np.int64), return_counts=True)
+
+    def scores(self, query: str) -> np.ndarray:
+        """Cosine similarity of the query with every example"""
+        scores = np.zeros(len(self.sources))
+        hashed, tf = self._terms(query)
+        positions = np.searchsorted(self._vocab, hashed)
+        found = positions < len(self._vocab)
+        found[found] = self._vocab[positions[found]] == hashed[found]
+        for position, count in zip(positions[found], tf[found]):
+            start, end = (
+                self._starts[position],
+                self._starts[position] + self._df[position],
+            )
+            query_weight = (1 + np.log(count)) * self._idf[position]
+            np.add.at(
+                scores, self._rows[start:end], self._weights[start:end] * query_weight
+            )
+        return scores
+
+    def _candidates(self, query: str, k: int, strategy: str) -> Iterable[int]:
+        if strategy == "first":
+            return range(len(self.sources))
+        if strategy == "random":
+            rows = list(range(len(self.sources)))
+            random.Random(zlib.crc32(query.encode("utf-8"))).shuffle(rows)
+            return rows
+        if strategy == "similar":
+            scores = self.scores(query)
+            # a few spare candidates for the excluded and over budget examples
+            top = min(len(scores), 4 * k + 1)
+            best = np.argpartition(-scores, top - 1)[:top]
+            return best[np.argsort(-scores[best], kind="stable")].tolist()
+        raise ValueError(f"Unknown few shot strategy {strategy}")
+
+    def select(
+        self,
+        query: str,
+        k: int,
+        strategy: str = "similar",
+        max_tokens: Optional[int] = None,
+        exclude: Optional[int] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        Up to k (source, target) examples for the query, skipping the example whose id is
+        `exclude` (the state being transduced) and the ones that would exceed max_tokens.
+        """
+        if k <= 0 or not self.sources:
+            return []
+        selected, budget = [], max_tokens
+        for row in self._candidates(query, k, strategy):
+            if self.ids[row] == exclude:
+                continue
+            example = (self.sources[row], self.targets[row])
+            if budget is not None:
+                tokens = estimate_tokens(format_few_shot(*example))
+                if tokens > budget:
+                    continue
+                budget -= tokens
+            selected.append(example)
+            if len(selected) == k:
+                break
+        return selected
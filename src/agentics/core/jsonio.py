@@ -0,0 +1,136 @@
+import io
+import json
+import os
+from functools import lru_cache
+from itertools import islice
+from typing import IO, Any, Iterator, Optional, Tuple, Union
+
+from agentics.core.utils import sanitize_field_name
+
+try:
+    import orjson
+except ImportError:  # optional, the standard library parser is used without it
+    orjson = None
+
+JsonSource = Union[str, os.PathLike, IO[str], IO[bytes]]
+
+# bytes read at a time when parsing a JSON array incrementally
+READ_SIZE = 1 << 20
+
+_decoder = json.JSONDecoder()
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Compact JSON of plain python values"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+@lru_cache(maxsize=65536)
+def sanitized_keys(keys: Tuple[str, ...]) -> Optional[Tuple[str, ...]]:
+    """Sanitized field names of a set of keys, None when they are already valid"""
+    sanitized = tuple(sanitize_field_name(key) for key in keys)
+    return None if sanitized == keys else sanitized
+
+
+def sanitize_record(obj: Any) -> Any:
+    """
+    Same as sanitize_dict_keys, with the key mapping computed once per distinct set of keys
+    rather than once per record.
+    """
+    if isinstance(obj, dict):
+        keys = sanitized_keys(tuple(obj))
+        values = [sanitize_record(value) for value in obj.values()]
+        return dict(zip(keys or obj.keys(), values))
+    if isinstance(obj, list):
+        return [sanitize_record(item) for item in obj]
+    return obj
+
+
+def _open(source: JsonSource) -> Tuple[IO, bool]:
+    """Stream of a path or an open file, and whether it must be closed after reading"""
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, "rb"), True
+    return source, False
+
+
+def iter_jsonl_records(source: JsonSource) -> Iterator[Any]:
+    """Records of a JSON Lines file, one line at a time, skipping blank lines"""
+    f, close = _open(source)
+    try:
+        for line in f:
+            if line.strip():
+                yield json_loads(line)
+    finally:
+        if close:
+            f.close()
+
+
+def iter_json_array(source: JsonSource, read_size: int = READ_SIZE) -> Iterator[Any]:
+    """
+    Items of a JSON array, parsed incrementally: only the items being decoded and one read
+    buffer are in memory, whatever the size of the file.
+    """
+    f, close = _open(source)
+    if not isinstance(f, io.TextIOBase):
+        f = io.TextIOWrapper(f, encoding="utf-8")
+    try:
+        buffer, position, eof = "", 0, False
+        started = False
+
+        def fill() -> bool:
+            nonlocal buffer, position, eof
+            chunk = f.read(read_size)
+            buffer, position = buffer[position:] + chunk, 0
+            eof = not chunk
+            return not eof
+
+        while True:
+            # skip whitespace, the opening bracket and separators
+            while position < len(buffer) and buffer[position] in " \t\r\n,[":
+                if buffer[position] == "[":
+                    if started:
+                        break
+                    started = True
+                position += 1
+            if position >= len(buffer):
+                if not fill():
+                    if started:
+                        raise ValueError("Unterminated JSON array")
+                    return
+                continue
+            if not started:
+                raise ValueError("Expected a JSON array")
+            if buffer[position] == "]":
+                return
+            try:
+                item, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # the item continues in the next read
+                if not fill():
+                    raise
+                continue
+            if end == len(buffer) and not eof:
+                # a number may continue in the next read
+                if fill():
+                    continue
+                item, end = _decoder.raw_decode(buffer, position)
+            position = end
+            yield item
+    finally:
+        if close:
+            f.close()
+
+
+def iter_json_records(
+    source: JsonSource, jsonl: bool = True, max_rows: Optional[int] = None
+) -> Iterator[Any]:
+    """Records with sanitized keys of a JSON Lines file or a JSON array, up to max_rows"""
+    records = iter_jsonl_records(source) if jsonl else iter_json_array(source)
+    for record in islice(records, max_rows):
+        yield sanitize_record(record)
@@ -1,5 +1,11 @@
+import asyncio
+import atexit
+import importlib.util
 import os
+import weakref
+from typing import Dict, Optional, Tuple
 
+import httpx
 from crewai import LLM
 from dotenv import load_dotenv
 from loguru import logger
@@ -50,6 +56,131 @@ def get_llm_provider(provider_name: str = None) -> LLM:
             )
 
 
+############################################
+##### Shared OpenAI-compatible clients #####
+############################################
+
+HTTP_MAX_CONNECTIONS = int(os.getenv("AGENTICS_HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("AGENTICS_HTTP_MAX_KEEPALIVE_CONNECTIONS", 20)
+)
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("AGENTICS_HTTP_KEEPALIVE_EXPIRY", 30))
+
+openai_clients: Dict[
+    Tuple[Optional[str], str, Optional[asyncio.AbstractEventLoop]], AsyncOpenAI
+] = {}
+
+# clients standing for the shared pools, resolved to the pool of the running loop when used
+_pooled_clients: "weakref.WeakSet[AsyncOpenAI]" = weakref.WeakSet()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_openai_client(
+    base_url: Optional[str] = None,
+    api_key: str = "EMPTY",
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    http2: Optional[bool] = None,
+) -> AsyncOpenAI:
+    """
+    Return the shared AsyncOpenAI client for (base_url, api_key) in the running event loop,
+    creating it on first use. All calls to the same server share one httpx connection pool, so
+    TCP/TLS connections are kept alive and reused instead of being opened for every request.
+    Connections are bound to the loop that opened them, so each loop (e.g. each asyncio.run)
+    gets its own pool, and the pools of closed loops are dropped. HTTP/2 is used when the `h2`
+    package is installed. Pool settings only apply when the client is created, their defaults can be
+    set with AGENTICS_HTTP_MAX_CONNECTIONS, AGENTICS_HTTP_MAX_KEEPALIVE_CONNECTIONS and
+    AGENTICS_HTTP_KEEPALIVE_EXPIRY.
+    """
+    for stale in [k for k in openai_clients if k[2] is not None and k[2].is_closed()]:
+        # the connections of a closed loop can't be used nor closed anymore
+        del openai_clients[stale]
+    key = (base_url.rstrip("/") if base_url else base_url, api_key, _running_loop())
+    client = openai_clients.get(key)
+    if client is None or client.is_closed():
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+        http_client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections or HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=max_keepalive_connections
+                or HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=keepalive_expiry or HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            default_headers={
+                "Content-Type": "application/json",
+            },
+            http_client=http_client,
+        )
+        openai_clients[key] = client
+        _pooled_clients.add(client)
+    return client
+
+
+def openai_client_handle(
+    base_url: Optional[str], api_key: str = "EMPTY"
+) -> AsyncOpenAI:
+    """
+    AsyncOpenAI client standing for the shared clients of a server, e.g. as an llm configured at
+    import time outside any event loop: calls made through it use get_openai_client in the
+    running loop, see resolve_openai_client.
+    """
+    client = AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        default_headers={
+            "Content-Type": "application/json",
+        },
+    )
+    _pooled_clients.add(client)
+    return client
+
+
+def resolve_openai_client(client: AsyncOpenAI) -> AsyncOpenAI:
+    """The shared client of the running loop for clients created here, other clients unchanged"""
+    if client in _pooled_clients:
+        return get_openai_client(str(client.base_url), client.api_key)
+    return client
+
+
+async def aclose_openai_clients():
+    """Close the connection pools of the shared clients of the running loop, drop the others"""
+    loop = _running_loop()
+    clients = [
+        client
+        for (_, _, client_loop), client in openai_clients.items()
+        if client_loop is None or client_loop is loop
+    ]
+    openai_clients.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.debug(f"Failed to close OpenAI client {client.base_url}: {e}")
+
+
+@atexit.register
+def close_openai_clients():
+    if not openai_clients:
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(aclose_openai_clients())
+
+
 available_llms = {}
 
 gemini_llm = (
@@ -98,15 +229,7 @@ watsonx_llm = (
 )
 
 vllm_llm = (
-    AsyncOpenAI(
-        api_key="EMPTY",
-        base_url=os.getenv("VLLM_URL"),
-        default_headers={
-            "Content-Type": "application/json",
-        },
-    )
-    if os.getenv("VLLM_URL")
-    else None
+    openai_client_handle(os.getenv("VLLM_URL")) if os.getenv("VLLM_URL") else None
 )
 
 vllm_crewai = (
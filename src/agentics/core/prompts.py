@@ -0,0 +1,141 @@
+import json
+import threading
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from crewai.events import crewai_event_bus
+from crewai.events.types.llm_events import LLMCallCompletedEvent
+
+
+def canonical_json(obj: Any) -> str:
+    """JSON dump with sorted keys, so the same content always renders to the same bytes"""
+    return json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def supports_cache_control(llm: Any) -> bool:
+    """
+    Whether the shared prefix must be explicitly marked as cacheable. Anthropic models only cache
+    segments flagged with cache_control, and only LiteLLM passes the flag through. OpenAI, vLLM
+    and Gemini reuse byte-identical prefixes automatically.
+    """
+    model = str(getattr(llm, "model", "") or "").lower()
+    return bool(getattr(llm, "is_litellm", False)) and (
+        "anthropic" in model or "claude" in model
+    )
+
+
+def build_messages(
+    prefix: str, content: str, cache_control: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Chat messages with the prefix shared by all the prompts of a transduction as the system
+    segment, and the per-state content as the user message.
+    """
+    system: Dict[str, Any] = {"role": "system", "content": prefix}
+    if cache_control:
+        system["content"] = [
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}
+        ]
+    return [system, {"role": "user", "content": content}]
+
+
+# completions are counted from crewai event handler threads
+_usage_lock = threading.Lock()
+
+
+class PromptUsage:
+    """
+    Token counters of a transduction run, splitting the prompt tokens that the provider served
+    from its prompt cache from the uncached ones.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+
+    @property
+    def uncached_tokens(self) -> int:
+        return self.prompt_tokens - self.cached_tokens
+
+    @property
+    def cached_ratio(self) -> float:
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def add(
+        self,
+        prompt_tokens: int = 0,
+        cached_tokens: int = 0,
+        completion_tokens: int = 0,
+        requests: int = 1,
+    ):
+        with _usage_lock:
+            self.requests += requests
+            self.prompt_tokens += prompt_tokens or 0
+            self.cached_tokens += cached_tokens or 0
+            self.completion_tokens += completion_tokens or 0
+
+    def add_completion_usage(self, usage: Any):
+        """Count the usage block of an OpenAI-compatible chat completion"""
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.add(
+            prompt_tokens=getattr(usage, "prompt_tokens", 0),
+            cached_tokens=getattr(details, "cached_tokens", 0) if details else 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0),
+        )
+
+    def add_usage_data(self, usage: Any):
+        """Count a completion usage reported to a crewai LLM, a dict or a usage object"""
+        if isinstance(usage, dict):
+            details = usage.get("prompt_tokens_details") or {}
+            self.add(
+                prompt_tokens=usage.get("prompt_tokens", 0),
+                cached_tokens=usage.get("cached_tokens")
+                or usage.get("cached_prompt_tokens")
+                or details.get("cached_tokens", 0),
+                completion_tokens=usage.get("completion_tokens", 0),
+            )
+        else:
+            self.add_completion_usage(usage)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "uncached_tokens": self.uncached_tokens,
+            "completion_tokens": self.completion_tokens,
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"{self.prompt_tokens} prompt tokens over {self.requests} requests, "
+            f"{self.cached_tokens} cached ({self.cached_ratio:.0%}), "
+            f"{self.uncached_tokens} uncached"
+        )
+
+
+# PromptUsage of the transduction whose completion is running in the current context
+completion_usage: ContextVar[Optional[PromptUsage]] = ContextVar(
+    "completion_usage", default=None
+)
+
+
+@lru_cache(maxsize=None)
+def track_completion_usage():
+    """
+    Add the usage of each crewai LLM completion to the completion_usage of the context it ran in.
+    crewai runs sync event handlers in a copy of the emitting context, so concurrent
+    transductions sharing an LLM each count their own completions. The handlers run in a thread
+    pool, call crewai_event_bus.flush() before reading the counters.
+    """
+
+    @crewai_event_bus.on(LLMCallCompletedEvent)
+    def count_completion(source: Any, event: LLMCallCompletedEvent):
+        usage = completion_usage.get()
+        if usage is not None and event.usage:
+            usage.add_usage_data(event.usage)
@@ -0,0 +1,375 @@
+import asyncio
+import json
+from collections.abc import AsyncIterable
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from loguru import logger
+from pydantic import BaseModel
+
+from agentics.core.cache import TransductionCache
+from agentics.core.checkpoint import CheckpointStore
+from agentics.core.utils import DEFAULT_MAX_WORKERS
+
+
+class ReductionNode:
+    """
+    A node of a reduction tree. Leaves (level 0) hold the input items, each internal node holds
+    the reduction of its children, which cover the input items in [start, end).
+    `error` is set when the reduction of the node failed.
+    """
+
+    def __init__(
+        self,
+        level: int,
+        start: int,
+        end: int,
+        value: Any = None,
+        children: Optional[List["ReductionNode"]] = None,
+    ):
+        self.level = level
+        self.start = start
+        self.end = end
+        self.value = value
+        self.children = children or []
+        self.error: Optional[BaseException] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.level == 0
+
+    def walk(self) -> Iterator["ReductionNode"]:
+        """All the nodes below and including this one, level by level from the root"""
+        nodes = [self]
+        while nodes:
+            yield from nodes
+            nodes = [child for node in nodes for child in node.children]
+
+    def __repr__(self) -> str:
+        return f"ReductionNode(level={self.level}, start={self.start}, end={self.end}, children={len(self.children)})"
+
+
+class TreeReducer:
+    """
+    Parallel tree reduction: items are grouped by `fan_in` into nodes reduced with `reduce`,
+    and so on level by level up to a single root.
+
+    A node is reduced as soon as all its children are, without waiting for the rest of its level,
+    with at most `max_workers` reductions running at the same time. Inputs, which can be any
+    iterable or async iterable, are consumed lazily: reading pauses while `max_workers` groups of
+    leaves are waiting to be reduced. With keep_tree=False, nodes release their children once
+    reduced, so memory stays bounded for very long inputs and only the root is returned.
+    Children that fail are left out of the reduction of their parent, with a warning. A node left
+    alone at the end of a level is moved up to the next one as it is, without a reduction.
+    """
+
+    def __init__(
+        self,
+        reduce: Callable[[List[Any]], Awaitable[Any]],
+        fan_in: int = 10,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        keep_tree: bool = True,
+    ):
+        if fan_in < 2:
+            raise ValueError("fan_in must be at least 2")
+        self.reduce = reduce
+        self.fan_in = fan_in
+        self.max_workers = max_workers
+        self.keep_tree = keep_tree
+
+    async def __call__(
+        self, items: Union[Iterable[Any], AsyncIterable[Any]]
+    ) -> Optional[ReductionNode]:
+        """Reduce items, returning the root of the reduction tree (None for no items)"""
+        workers = asyncio.Semaphore(self.max_workers)
+        window = asyncio.Semaphore(self.max_workers)
+        levels: List[List[ReductionNode]] = [[]]
+        tasks: List[asyncio.Task] = []
+
+        async def run(node: ReductionNode, leaves: bool):
+            try:
+                await asyncio.gather(
+                    *(child._task for child in node.children if child._task)
+                )
+                values = [c.value for c in node.children if c.error is None]
+                failed = [c for c in node.children if c.error is not None]
+                if failed:
+                    logger.warning(
+                        f"Reducing items [{node.start}, {node.end}) without "
+                        f"{len(failed)} failed children: {failed[0].error!r}"
+                    )
+                if not values:
+                    node.error = ValueError("All the children of the node failed")
+                    return
+                async with workers:
+                    node.value = await self.reduce(values)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                node.error = e
+            finally:
+                if leaves:
+                    window.release()
+                if not self.keep_tree:
+                    node.children = []
+
+        async def add(level: int, children: List[ReductionNode]):
+            if level == 0:
+                await window.acquire()
+            node = ReductionNode(
+                level + 1, children[0].start, children[-1].end, children=children
+            )
+            node._task = asyncio.create_task(run(node, level == 0))
+            tasks.append(node._task)
+            await promote(level + 1, node)
+
+        async def promote(level: int, node: ReductionNode):
+            """Add node to a level, reducing the level once it holds fan_in nodes"""
+            if len(levels) == level:
+                levels.append([])
+            levels[level].append(node)
+            if len(levels[level]) == self.fan_in:
+                group, levels[level] = levels[level], []
+                await add(level, group)
+
+        async def push(index: int, item: Any):
+            levels[0].append(ReductionNode(0, index, index + 1, value=item))
+            if len(levels[0]) == self.fan_in:
+                group, levels[0] = levels[0], []
+                await add(0, group)
+
+        try:
+            count = 0
+            if isinstance(items, AsyncIterable):
+                async for item in items:
+                    await push(count, item)
+                    count += 1
+            else:
+                for item in items:
+                    await push(count, item)
+                    count += 1
+            if count == 0:
+                return None
+
+            # group what is left of each level, up to a single root
+            level = 0
+            while True:
+                pending = levels[level]
+                higher = any(levels[level + 1 :])
+                if level > 0 and len(pending) == 1 and not higher:
+                    root = pending[0]
+                    break
+                if pending:
+                    levels[level] = []
+                    if level > 0 and len(pending) == 1:
+                        # a lone reduction doesn't need to be reduced again
+                        await promote(level + 1, pending[0])
+                    else:
+                        await add(level, pending)
+                level += 1
+            await root._task
+            return root
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+
+class ReductionIndex:
+    """
+    Memoized segment tree of reductions over a sequence of items, to reduce arbitrary ranges.
+
+    Items are split in leaf batches of `batch_size`; a node at level L reduces `fan_in` aligned
+    nodes of level L-1, i.e. `batch_size * fan_in**L` items. Each node value is stored in `cache`
+    under a key built from `key_parts` (e.g. model, instructions), the output type and the content
+    hash of the items it covers, so ranges sharing content reuse it, across indexes and runs with
+    a persistent cache. `query(start, end)` reduces only the O(fan_in * log n) aligned nodes covering
+    the range, plus the partial batches at its edges, and combines them with a TreeReducer.
+    """
+
+    def __init__(
+        self,
+        items: List[BaseModel],
+        reduce: Callable[[List[Any]], Awaitable[BaseModel]],
+        output_type: Type[BaseModel],
+        batch_size: int = 10,
+        fan_in: int = 10,
+        cache: Optional[TransductionCache] = None,
+        key_parts: Tuple[Any, ...] = (),
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        self.items = items
+        self.reduce = reduce
+        self.output_type = output_type
+        self.batch_size = batch_size
+        self.fan_in = max(fan_in, 2)
+        self.cache = cache if cache is not None else TransductionCache(":memory:")
+        self.key_parts = key_parts
+        self.workers = asyncio.Semaphore(max_workers)
+        self.max_workers = max_workers
+        # content hashes are computed lazily, only for the items of the nodes a query touches
+        self._item_hashes: Dict[int, str] = {}
+        self._hashes: Dict[Tuple[int, int], str] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    def _span(self, level: int, k: int) -> Tuple[int, int]:
+        width = self.batch_size * self.fan_in**level
+        return k * width, (k + 1) * width
+
+    def _item_hash(self, i: int) -> str:
+        if i not in self._item_hashes:
+            self._item_hashes[i] = CheckpointStore.hash_input(self.items[i])
+        return self._item_hashes[i]
+
+    def _batch_hash(self, start: int, end: int) -> str:
+        end = min(end, len(self.items))
+        return CheckpointStore.hash_input(
+            0, *(self._item_hash(i) for i in range(start, end))
+        )
+
+    def _node_hash(self, level: int, k: int) -> str:
+        if (level, k) not in self._hashes:
+            if level == 0:
+                node_hash = self._batch_hash(*self._span(0, k))
+            else:
+                node_hash = CheckpointStore.hash_input(
+                    level,
+                    *(
+                        self._node_hash(level - 1, k * self.fan_in + j)
+                        for j in range(self.fan_in)
+                    ),
+                )
+            self._hashes[(level, k)] = node_hash
+        return self._hashes[(level, k)]
+
+    async def _memoized(
+        self, content_hash: str, compute: Callable[[], Awaitable[BaseModel]]
+    ) -> BaseModel:
+        """Value stored for content_hash, computed once even by concurrent queries"""
+        key = TransductionCache.make_key(
+            json.dumps(self.key_parts, default=str),
+            None,
+            self.output_type,
+            content_hash,
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self.output_type.model_validate_json(cached)
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.ensure_future(compute())
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        value = await asyncio.shield(task)
+        self.cache.set(key, value.model_dump_json())
+        return value
+
+    async def _reduce(self, values: List[Any]) -> BaseModel:
+        async with self.workers:
+            return await self.reduce(values)
+
+    async def node(self, level: int, k: int) -> BaseModel:
+        """Reduction of the k-th aligned node of a level"""
+
+        async def compute() -> BaseModel:
+            if level == 0:
+                start, end = self._span(0, k)
+                return await self._reduce(self.items[start:end])
+            children = await asyncio.gather(
+                *(self.node(level - 1, k * self.fan_in + j) for j in range(self.fan_in))
+            )
+            return await self._reduce(list(children))
+
+        return await self._memoized(self._node_hash(level, k), compute)
+
+    async def _part(self, level: int, start: int, end: int) -> BaseModel:
+        """Reduction of an aligned node above the leaves, or of items[start:end] as one batch"""
+        if level > 0:
+            return await self.node(level, start // (end - start))
+        return await self._memoized(
+            self._batch_hash(start, end),
+            lambda: self._reduce(self.items[start:end]),
+        )
+
+    def cover(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """Aligned (level, k) nodes covering items[start:end], start and end being batch aligned"""
+        first = -(-start // self.batch_size)
+        last = end // self.batch_size
+        nodes = []
+        b = first
+        while b < last:
+            level = 0
+            while (
+                b % self.fan_in ** (level + 1) == 0
+                and b + self.fan_in ** (level + 1) <= last
+            ):
+                level += 1
+            nodes.append((level, b // self.fan_in**level))
+            b += self.fan_in**level
+        return nodes
+
+    async def query(self, start: int, end: int) -> ReductionNode:
+        """
+        Reduce items[start : end + 1] (end inclusive). Returns a ReductionNode whose children are
+        the cached parts that were combined, in order.
+        """
+        end = min(end + 1, len(self.items))
+        if start >= end:
+            raise ValueError(f"Empty range [{start}, {end})")
+        # items in [first, last) are covered by full batches
+        first = -(-start // self.batch_size) * self.batch_size
+        last = end // self.batch_size * self.batch_size
+        parts: List[Tuple[int, int, int, str]] = []  # level, start, end, content hash
+        if first >= last:
+            parts.append((1, start, end, self._batch_hash(start, end)))
+        else:
+            if start < first:
+                parts.append((1, start, first, self._batch_hash(start, first)))
+            for level, k in self.cover(first, last):
+                parts.append(
+                    (level + 1, *self._span(level, k), self._node_hash(level, k))
+                )
+            if last < end:
+                parts.append((1, last, end, self._batch_hash(last, end)))
+        values = await asyncio.gather(
+            *(
+                self._part(level - 1, part_start, part_end)
+                for level, part_start, part_end, _ in parts
+            )
+        )
+        children = [
+            ReductionNode(level, part_start, part_end, value=value)
+            for (level, part_start, part_end, _), value in zip(parts, values)
+        ]
+        if len(children) == 1:
+            return children[0]
+
+        async def combine() -> BaseModel:
+            combined = await TreeReducer(
+                self._reduce, fan_in=self.fan_in, max_workers=self.max_workers
+            )(values)
+            if combined.error is not None:
+                raise combined.error
+            return combined.value
+
+        value = await self._memoized(
+            CheckpointStore.hash_input("range", *(h for *_, h in parts)), combine
+        )
+        return ReductionNode(
+            max(c.level for c in children) + 1,
+            start,
+            end,
+            value=value,
+            children=children,
+        )
@@ -0,0 +1,191 @@
+import asyncio
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from multiprocessing.context import BaseContext
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from crewai.llms.base_llm import BaseLLM
+from loguru import logger
+from openai import AsyncOpenAI
+
+from agentics.core.cache import TransductionCache, _open_caches
+from agentics.core.concurrency import limiters
+from agentics.core.llm_connections import openai_client_handle, openai_clients
+
+# state of the current shard worker, set once when the worker starts
+_shard: Dict[str, Any] = {}
+
+
+class ClientConfig(NamedTuple):
+    """Picklable stand-in for an AsyncOpenAI llm, rebuilt in each shard worker"""
+
+    base_url: str
+    api_key: str
+
+
+class CrewLLMConfig(NamedTuple):
+    """
+    Picklable stand-in for a crewai LLM, whose clients and locks can't be pickled: its class and
+    the fields it was created with, rebuilt in each shard worker
+    """
+
+    llm_type: type
+    fields: Dict[str, Any]
+
+
+def _start_method() -> Optional[str]:
+    """
+    fork while the process has a single thread, so that inputs don't need to be picklable, None
+    otherwise: forking a process with live threads (e.g. crewai telemetry) can deadlock the
+    child, so workers are started by a forkserver (or spawn) and their inputs are pickled.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        return "fork"
+    return None
+
+
+def process_context() -> BaseContext:
+    """Multiprocessing context of worker processes, forkserver (or spawn) when fork isn't safe"""
+    method = _start_method()
+    if method is None:
+        methods = multiprocessing.get_all_start_methods()
+        method = "forkserver" if "forkserver" in methods else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def _init_worker(initializer: Callable, data: Any):
+    initializer(*(pickle.loads(data) if isinstance(data, bytes) else data))
+
+
+def shard_pool(
+    workers: int, initializer: Callable, *initargs
+) -> Optional[ProcessPoolExecutor]:
+    """
+    Process pool whose workers run initializer(*initargs) once. Forked workers inherit initargs,
+    otherwise they are pickled once for all the workers. None when they can't be pickled.
+    """
+    context = process_context()
+    data: Any = initargs
+    if context.get_start_method() != "fork":
+        try:
+            data = pickle.dumps(initargs)
+        except Exception as e:
+            logger.warning(
+                f"Running unsharded, the inputs can't be sent to worker processes: {e}"
+            )
+            return None
+    return ProcessPoolExecutor(
+        workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(initializer, data),
+    )
+
+
+def shard_ranges(n: int, shards: int) -> List[Tuple[int, int]]:
+    """Contiguous [start, end) ranges splitting n states in at most `shards` balanced parts"""
+    shards = max(1, min(shards, n))
+    size, extra = divmod(n, shards)
+    ranges, start = [], 0
+    for i in range(shards):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _shard_target(target: Any) -> Any:
+    """
+    Copy of target for the shard workers. Connection pools and SQLite connections are bound to
+    the parent event loop and sockets, so they are replaced by what each worker needs to open
+    its own.
+    """
+    target = copy(target)
+    if isinstance(target.llm, AsyncOpenAI):
+        target.llm = ClientConfig(str(target.llm.base_url), target.llm.api_key)
+    elif isinstance(target.llm, BaseLLM):
+        target.llm = CrewLLMConfig(
+            type(target.llm),
+            {name: getattr(target.llm, name) for name in target.llm.model_fields_set},
+        )
+    if isinstance(target.transduction_cache, TransductionCache):
+        target.transduction_cache = target.transduction_cache.path
+    target.checkpoint_path = None
+    target.shards = 1
+    return target
+
+
+def _init_shard(target: Any, payload: Any):
+    """Shard worker initializer, forked workers drop the registries inherited from the parent"""
+    openai_clients.clear()
+    _open_caches.clear()
+    limiters.clear()
+    if isinstance(target.llm, ClientConfig):
+        target.llm = openai_client_handle(*target.llm)
+    elif isinstance(target.llm, CrewLLMConfig):
+        target.llm = target.llm.llm_type(**target.llm.fields)
+    _shard.update(target=target, payload=payload)
+
+
+async def _amap_shard(start: int, end: int, kwargs: Dict[str, Any]):
+    target = copy(_shard["target"])
+    target.states = target.states[start:end]
+    await target.amap(_shard["payload"], **kwargs)
+    return [
+        (isinstance(state, target.atype), state.model_dump_json())
+        for state in target.states
+    ]
+
+
+async def _transduce_shard(start: int, end: int, kwargs: Dict[str, Any]):
+    # the whole target and source are kept, so that few shots are drawn from all the states
+    target = copy(_shard["target"])
+    target.max_workers = kwargs["max_workers"]
+    output = await target._transduce(_shard["payload"], span=(start, end))
+    usage = output.prompt_usage.as_dict() if output.prompt_usage else {}
+    return (
+        [state.model_dump_json() for state in output.states],
+        usage,
+        output.deduplicated_calls,
+    )
+
+
+_runners = {"amap": _amap_shard, "transduce": _transduce_shard}
+
+
+def _run_shard(kind: str, start: int, end: int, kwargs: Dict[str, Any]):
+    return asyncio.run(_runners[kind](start, end, kwargs))
+
+
+async def run_sharded(
+    target: Any,
+    kind: str,
+    payload: Any,
+    n: int,
+    shards: int,
+    **kwargs,
+) -> Optional[List[Any]]:
+    """
+    Run an amap (payload is the function) or a transduction (payload is the source) of `target`
+    over n states split in contiguous shards, each in a worker process (see shard_pool) with its
+    own event loop and max_workers // shards concurrent states. Outputs come back as JSON.
+    Returns the outputs of each shard, in order, or None when the inputs can't be sent to the
+    workers and the caller should run unsharded.
+    """
+    ranges = shard_ranges(n, shards)
+    kwargs["max_workers"] = max(1, target.max_workers // len(ranges))
+    pool = shard_pool(len(ranges), _init_shard, _shard_target(target), payload)
+    if pool is None:
+        return None
+    loop = asyncio.get_running_loop()
+    with pool:
+        return await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, _run_shard, kind, start, end, kwargs)
+                for start, end in ranges
+            )
+        )
@@ -2,15 +2,19 @@ import asyncio
 import inspect
 import os
 import re
-from collections.abc import Iterable
+from collections import OrderedDict
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Sized
+from functools import lru_cache
 from typing import (
     Any,
     Awaitable,
     Callable,
     Dict,
+    Hashable,
     List,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -23,7 +27,7 @@ from dotenv import load_dotenv
 from loguru import logger
 from numerize.numerize import numerize
 from openai import APIStatusError, AsyncOpenAI
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, Field, TypeAdapter, create_model
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
@@ -37,8 +41,13 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 
+from agentics.core.llm_connections import get_openai_client, resolve_openai_client
+from agentics.core.prompts import PromptUsage
+
 A = TypeVar("A", bound=BaseModel)
 
+DEFAULT_MAX_WORKERS = 32
+
 load_dotenv()
 
 
@@ -170,28 +179,36 @@ def process_raw_completion_one(raw_completion):
 
 
 async def openai_response(
-    model, base_url, user_prompt, system_prompt=None, history_messages=[], **kwargs
+    model,
+    base_url,
+    user_prompt,
+    system_prompt=None,
+    history_messages=[],
+    client: Optional[AsyncOpenAI] = None,
+    usage: Optional[PromptUsage] = None,
+    **kwargs,
 ):
+    """Chat completion against an OpenAI-compatible server, using the shared pooled client
+    for base_url unless a client is provided. Token usage is added to `usage` when given
+    """
     messages = []
     if system_prompt:
         messages.append({"role": "system", "content": system_prompt})
     messages.extend(history_messages)
     messages.append({"role": "user", "content": user_prompt})
 
+    client = resolve_openai_client(client) if client else get_openai_client(base_url)
     try:
-        client = AsyncOpenAI(
-            api_key="EMPTY",
-            base_url=base_url,
-            default_headers={
-                "Content-Type": "application/json",
-            },
-        )
-
+        kwargs.setdefault("timeout", 100)
         completion = await client.chat.completions.create(
-            model=model, messages=messages, timeout=100, **kwargs
+            model=model, messages=messages, **kwargs
         )
-        if kwargs["logprobs"]:
-            return process_raw_completion_all(completion, **kwargs)
+        if usage is not None:
+            usage.add_completion_usage(completion.usage)
+        if kwargs.get("logprobs"):
+            return process_raw_completion_all(completion)
+        elif kwargs.get("n", 1) > 1:
+            return [choice.message.content for choice in completion.choices]
         else:
             return process_raw_completion_one(completion)
     except APIStatusError as e:
@@ -207,6 +224,28 @@ async def openai_response(
         raise
 
 
+async def llm_acall(llm: Any, messages: Union[str, List[dict]], **kwargs) -> Any:
+    """
+    Completion without blocking the event loop: native acall for crewai LLMs, the pooled async
+    client for OpenAI-compatible clients, otherwise `call` offloaded to the default thread pool.
+    """
+    if isinstance(llm, AsyncOpenAI):
+        llm = resolve_openai_client(llm)
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        completion = await llm.chat.completions.create(
+            model=os.getenv("VLLM_MODEL_ID"), messages=messages, **kwargs
+        )
+        return process_raw_completion_one(completion)
+    if hasattr(llm, "acall"):
+        try:
+            return await llm.acall(messages, **kwargs)
+        except NotImplementedError:
+            # LLMs without native async support
+            pass
+    return await asyncio.to_thread(llm.call, messages, **kwargs)
+
+
 def make_all_fields_optional(
     model_cls: type[BaseModel], rename_type: str = None
 ) -> type[BaseModel]:
@@ -220,23 +259,26 @@ def make_all_fields_optional(
     Returns:
         New Pydantic model class with all fields optional.
     """
-    fields = {}
-    for name, field in model_cls.model_fields.items():
-        # Original type
-        annotation = field.annotation
-        origin = get_origin(annotation)
-
-        # Make it Optional if not already
-        if origin is not Optional and annotation is not Any:
-            annotation = Optional[annotation]
-
-        fields[name] = (
-            annotation,
-            Field(default=None, title=field.title, description=field.description),
-        )
-
     new_name = rename_type or f"{model_cls.__name__} (optional)"
-    return create_model(new_name, **fields)
+
+    def build() -> type[BaseModel]:
+        fields = {}
+        for name, field in model_cls.model_fields.items():
+            # Original type
+            annotation = field.annotation
+            origin = get_origin(annotation)
+
+            # Make it Optional if not already
+            if origin is not Optional and annotation is not Any:
+                annotation = Optional[annotation]
+
+            fields[name] = (
+                annotation,
+                Field(default=None, title=field.title, description=field.description),
+            )
+        return create_model(new_name, **fields)
+
+    return cached_model(("all_fields_optional", model_cls, new_name), build)
 
 
 def is_str_or_list_of_str(input):
@@ -245,14 +287,90 @@ def is_str_or_list_of_str(input):
     )
 
 
+_EXHAUSTED = object()
+
+
+async def bounded_as_completed(
+    inputs: Union[Iterable[Any], AsyncIterable[Any]],
+    work: Callable[[Any], Awaitable[Any]],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[tuple[int, Any]]:
+    """
+    Run `work` over `inputs` with at most `max_workers` calls in flight and yield
+    `(index, result)` pairs in completion order.
+
+    Inputs are consumed lazily from any iterable or async iterable: a new input is
+    only pulled when a worker slot frees up and the consumer has taken the previous
+    result, so memory stays bounded regardless of the number of inputs.
+    Exceptions (including per-call timeouts) are yielded in place of the result.
+    """
+    max_workers = max(1, max_workers or DEFAULT_MAX_WORKERS)
+
+    async def run(index: int, item: Any) -> tuple[int, Any]:
+        try:
+            return index, await asyncio.wait_for(work(item), timeout=timeout)
+        except Exception as e:
+            return index, e
+
+    is_async = isinstance(inputs, AsyncIterable)
+    source = aiter(inputs) if is_async else iter(inputs)
+    running: set[asyncio.Task] = set()
+    feeder: Optional[asyncio.Future] = None
+    exhausted = False
+    index = 0
+    try:
+        while True:
+            # refill free worker slots
+            while not exhausted and len(running) < max_workers:
+                if is_async:
+                    if feeder is None:
+                        feeder = asyncio.ensure_future(anext(source, _EXHAUSTED))
+                    break
+                item = next(source, _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    exhausted = True
+                else:
+                    running.add(asyncio.create_task(run(index, item)))
+                    index += 1
+
+            waiting = running | ({feeder} if feeder is not None else set())
+            if not waiting:
+                return
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            if feeder is not None and feeder in done:
+                item = feeder.result()
+                feeder = None
+                if item is _EXHAUSTED:
+                    exhausted = True
+                else:
+                    running.add(asyncio.create_task(run(index, item)))
+                    index += 1
+
+            for task in done & running:
+                running.discard(task)
+                yield task.result()
+    finally:
+        for task in running | ({feeder} if feeder is not None else set()):
+            task.cancel()
+
+
 async def async_odered_progress(
-    inputs: Sequence[Any],
+    inputs: Union[Iterable[Any], AsyncIterable[Any]],
     work: Callable[[Any], Awaitable[Any]],
     description: str = "Working",
     timeout: Optional[float] = None,
     transient_pbar: bool = False,
+    max_workers: Optional[int] = None,
+    on_result: Optional[Callable[[int, Any], None]] = None,
 ) -> list[Any]:
-    """Show a Rich progress bar while awaiting async execution."""
+    """Show a Rich progress bar while awaiting async execution.
+
+    Work is dispatched through a bounded worker pool (see `bounded_as_completed`),
+    `timeout` applies to each call and results are returned in input order.
+    `on_result(index, result)` is called as soon as each call succeeds.
+    """
     if transient_pbar:
         columns = (
             SpinnerColumn(style="grey50"),
@@ -279,25 +397,20 @@ async def async_odered_progress(
             TransductionSpeed(),
             TimeRemainingColumn(),
         )
+    total = len(inputs) if isinstance(inputs, Sized) else None
+    results: dict[int, Any] = {}
     with Progress(*columns, transient=transient_pbar) as progress:
-
-        async def track(index: int, coro: Awaitable[Any]) -> Any:
-            try:
-                return index, await coro
-            except Exception as e:
-                return index, e  # TODO: we can put the retry here
-            finally:
-                progress.advance(task_id)
-
-        task_id = progress.add_task(description, total=len(inputs))
-        tasks = [asyncio.create_task(track(i, work(x))) for i, x in enumerate(inputs)]
-        results: list[Any] = [None] * len(tasks)
-
-        # complete and replace in original order
-        for fut in asyncio.as_completed(tasks, timeout=timeout):
-            i, val = await fut
+        task_id = progress.add_task(description, total=total)
+        async for i, val in bounded_as_completed(
+            inputs, work, max_workers=max_workers, timeout=timeout
+        ):
             results[i] = val
-        return results
+            if on_result and not isinstance(val, Exception):
+                on_result(i, val)
+            progress.advance(task_id)
+
+    # replace in original order
+    return [results[i] for i in range(len(results))]
 
 
 class StyledColumn(ProgressColumn):
@@ -336,7 +449,70 @@ def make_states_list_model(item_type: Type[A]) -> Type[BaseModel]:
 
     but with proper validation and default_factory.
     """
-    # Name is optional; Pydantic will auto-unique if reused.
-    return create_model(
-        "ATypeList", states=(List[item_type], Field(default_factory=list))
+    return cached_model(
+        ("states_list", item_type),
+        lambda: create_model(
+            "ATypeList", states=(List[item_type], Field(default_factory=list))
+        ),
+    )
+
+
+#########################
+##### Model factory #####
+#########################
+
+MODEL_CACHE_SIZE = int(os.getenv("AGENTICS_MODEL_CACHE_SIZE", "1024"))
+
+_model_cache: "OrderedDict[Hashable, Type[BaseModel]]" = OrderedDict()
+
+
+def _hashable(value: Any) -> Hashable:
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def model_cache_key(*parts: Any) -> Tuple[Hashable, ...]:
+    """Cache key of a dynamically created model, unhashable parts (e.g. list defaults) by repr"""
+    return tuple(
+        (
+            tuple(_hashable(p) for p in part)
+            if isinstance(part, tuple)
+            else _hashable(part)
+        )
+        for part in parts
     )
+
+
+def cached_model(
+    key: Tuple[Any, ...], factory: Callable[[], Type[BaseModel]]
+) -> Type[BaseModel]:
+    """
+    Return the model built by factory for key, building it only the first time.
+    Models derived from the same base models, fields and options are then the same class, sharing
+    their compiled validator and JSON schema. The least recently used models are dropped beyond
+    MODEL_CACHE_SIZE, so long-lived services don't accumulate classes.
+    """
+    key = model_cache_key(*key)
+    model = _model_cache.get(key)
+    if model is None:
+        model = _model_cache[key] = factory()
+        if len(_model_cache) > MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+    else:
+        _model_cache.move_to_end(key)
+    return model
+
+
+@lru_cache(maxsize=MODEL_CACHE_SIZE)
+def get_type_adapter(tp: Any) -> TypeAdapter:
+    """Shared TypeAdapter of a type, e.g. List[atype] to validate or dump many states at once"""
+    return TypeAdapter(tp)
+
+
+@lru_cache(maxsize=MODEL_CACHE_SIZE)
+def get_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """JSON schema of a model, computed once. The returned dict is shared: do not modify it"""
+    return model.model_json_schema()
@@ -0,0 +1,144 @@
+import asyncio
+import inspect
+import os
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Literal, Optional, Type
+
+from pydantic import BaseModel, create_model
+
+from agentics.core.shards import process_context
+from agentics.core.utils import DEFAULT_MAX_WORKERS, cached_model, model_cache_key
+
+ExecutorKind = Literal["thread", "process"]
+
+
+def is_async_callable(func: Callable) -> bool:
+    """Whether func, a partial of it or its __call__ method is a coroutine function"""
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    )
+
+
+def atype_spec(atype: Type[BaseModel]) -> Any:
+    """
+    Picklable description of an atype: the class itself when workers can import it, otherwise its
+    name and field definitions, so that dynamically created models can be rebuilt in the worker.
+    """
+    try:
+        pickle.dumps(atype)
+        return atype
+    except Exception:
+        return (
+            atype.__name__,
+            tuple(
+                (name, field.annotation, field)
+                for name, field in atype.model_fields.items()
+            ),
+        )
+
+
+def rebuild_atype(spec: Any) -> Type[BaseModel]:
+    if isinstance(spec, type):
+        return spec
+    name, fields = spec
+    return cached_model(
+        model_cache_key("worker_atype", name, fields),
+        lambda: create_model(
+            name, **{field: (annotation, info) for field, annotation, info in fields}
+        ),
+    )
+
+
+def run_state_function(func: Callable, spec: Any, data: Dict[str, Any]) -> Any:
+    """Process worker entry point: rebuild the state, apply func and send back a dict"""
+    output = func(rebuild_atype(spec).model_validate(data))
+    if isinstance(output, BaseModel):
+        return atype_spec(type(output)), output.model_dump()
+    return None, output
+
+
+class StateWorkers:
+    """
+    Runs a synchronous state function in a pool of threads or processes, as an async callable
+    that can be used with aMap.
+
+    Process workers receive states as dicts together with the spec of their atype, since the
+    dynamically created atypes used by AG can't be pickled, and send the outputs back the same
+    way. `func` itself must be picklable, i.e. defined at module level. Outputs are rebuilt as
+    `output_type` when given, otherwise as the type returned by func. Pools have max_workers
+    workers, by default DEFAULT_MAX_WORKERS threads or one process per CPU; processes are forked
+    only while the calling process has a single thread (see shards.process_context).
+    """
+
+    def __init__(
+        self,
+        func: Callable[[BaseModel], Any],
+        executor: ExecutorKind = "thread",
+        max_workers: Optional[int] = None,
+        output_type: Optional[Type[BaseModel]] = None,
+    ):
+        if is_async_callable(func):
+            raise ValueError(
+                f"{getattr(func, '__name__', func)} is a coroutine function, run it on the event loop"
+            )
+        if executor == "thread":
+            self.pool: Executor = ThreadPoolExecutor(max_workers or DEFAULT_MAX_WORKERS)
+        elif executor == "process":
+            try:
+                pickle.dumps(func)
+            except Exception as e:
+                raise ValueError(
+                    f"{getattr(func, '__name__', func)} can't be sent to process workers, "
+                    "define it at module level"
+                ) from e
+            self.pool = ProcessPoolExecutor(
+                max_workers or os.cpu_count(), mp_context=process_context()
+            )
+        else:
+            raise ValueError(f"Unknown executor {executor}")
+        self.func = func
+        self.executor = executor
+        self.output_type = output_type
+        self.__name__ = getattr(func, "__name__", type(func).__name__)
+        self._specs: Dict[Type[BaseModel], Any] = {}
+
+    def _spec(self, atype: Type[BaseModel]) -> Any:
+        if atype not in self._specs:
+            self._specs[atype] = atype_spec(atype)
+        return self._specs[atype]
+
+    def _output(self, state: BaseModel, spec: Any, data: Any) -> Any:
+        if spec is None:
+            return data
+        output_type = self.output_type
+        if output_type is None:
+            # outputs of the same dynamic atype as the input are rebuilt as the original class
+            same_type = not isinstance(spec, type) and spec[0] == type(state).__name__
+            same_type = same_type and [f[0] for f in spec[1]] == list(
+                type(state).model_fields
+            )
+            output_type = type(state) if same_type else rebuild_atype(spec)
+        return output_type.model_validate(data)
+
+    async def __call__(self, state: BaseModel) -> Any:
+        loop = asyncio.get_running_loop()
+        if self.executor == "thread":
+            return await loop.run_in_executor(self.pool, self.func, state)
+        spec, data = await loop.run_in_executor(
+            self.pool,
+            run_state_function,
+            self.func,
+            self._spec(type(state)),
+            state.model_dump(),
+        )
+        return self._output(state, spec, data)
+
+    def close(self):
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "StateWorkers":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
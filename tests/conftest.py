@@ -1,7 +1,10 @@
+import asyncio
+import re
 from pathlib import Path
 
 import pytest
 from invoke.context import Context
+from pydantic import BaseModel
 from typing_extensions import Annotated
 
 
@@ -59,3 +62,64 @@ def llm_provider():
         return get_llm_provider()
     except ValueError:
         raise pytest.skip(reason="No available LLM")
+
+
+@pytest.fixture()
+def echo_llm(monkeypatch):
+    """Replaces the LLM transducers of AG with an offline one that answers with the upper-cased SOURCE.
+    Sources containing "fail" raise, batched prompts (ITEM 0:..., ITEM 1:...) are answered item by item.
+    Returns the list of prompts sent to the transducers."""
+    from agentics import AG
+    from agentics.core.async_executor import PydanticTransducer
+
+    prompts = []
+
+    class EchoTransducer(PydanticTransducer):
+        def __init__(self, atype, instructions, **kwargs):
+            self.atype = atype
+            self.llm = None
+            self.intentional_definiton = instructions
+            super().__init__(**kwargs)
+
+        def _answer(self, atype, prompt: str) -> BaseModel:
+            source = prompt.split("SOURCE:\n", 1)[1].strip()
+            if "fail" in source:
+                raise ValueError("cannot transduce")
+            return atype(answer=source.upper())
+
+        async def _execute(self, input: str) -> BaseModel:
+            prompts.append(input)
+            await asyncio.sleep(0.001 * (len(input) % 3))
+            if "states" in self.atype.model_fields:
+                item_type = self.atype.model_fields["states"].annotation.__args__[0]
+                items = re.split(r"\nITEM \d+:", input)[1:]
+                return self.atype(states=[self._answer(item_type, i) for i in items])
+            return self._answer(self.atype, input)
+
+    def make_transducer(self, instructions, atype=None, usage=None, logprobs=None):
+        return EchoTransducer(
+            atype
+            or (
+                self.subset_atype(self.transduce_fields)
+                if self.transduce_fields
+                else self.atype
+            ),
+            instructions,
+            max_workers=self.max_workers,
+            max_retries=0,
+            max_permanent_retries=0,
+        )
+
+    monkeypatch.setattr(AG, "_make_transducer", make_transducer)
+    return prompts
+
+
+@pytest.fixture()
+def offline_llm(monkeypatch):
+    """Registers a placeholder LLM provider, so that AGs built without an llm (from_csv,
+    from_jsonl...) can be created when no LLM is configured."""
+    from agentics.core.llm_connections import available_llms
+
+    llm = object()
+    monkeypatch.setitem(available_llms, "offline", llm)
+    return llm
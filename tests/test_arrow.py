@@ -0,0 +1,103 @@
+import datetime
+from typing import Any, Dict, List, Optional, Union
+
+import pytest
+from pydantic import BaseModel
+
+from agentics import AG
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+class Address(BaseModel):
+    city: Optional[str] = None
+    zip: Optional[int] = None
+
+
+class Customer(BaseModel):
+    id: int
+    name: Optional[str] = None
+    joined: Optional[datetime.datetime] = None
+    tags: List[str] = []
+    address: Optional[Address] = None
+    scores: Dict[str, float] = {}
+    extra: Optional[Dict[str, Union[int, str]]] = None
+
+
+def customers(n):
+    return [
+        Customer(
+            id=i,
+            name=f"c{i}" if i % 4 else None,
+            joined=datetime.datetime(2024, 1, 1 + i % 28),
+            tags=["a", "b"][: i % 3],
+            address=Address(city="x", zip=i) if i % 2 else None,
+            scores={"q": i / 2},
+            extra={"k": i, "v": "s"} if i % 3 else None,
+        )
+        for i in range(n)
+    ]
+
+
+def test_parquet_round_trip_keeps_types(offline_llm, tmp_path):
+    ag = AG(atype=Customer, states=customers(25))
+    path = str(tmp_path / "customers.parquet")
+    ag.to_parquet(path, chunk_size=10)
+    assert pq.ParquetFile(path).num_row_groups == 3
+    assert AG.from_parquet(path, atype=Customer, batch_size=7).states == ag.states
+    # the inferred atype keeps the Arrow types
+    inferred = AG.from_parquet(path, max_rows=12)
+    assert len(inferred) == 12
+    first = inferred[1]
+    assert first.joined == datetime.datetime(2024, 1, 2)
+    assert first.address.zip == 1 and first.scores == {"q": 0.5}
+    # fields Arrow can't represent are stored as JSON, and decoded with the inferred atype
+    assert first.extra == {"k": 1, "v": "s"}
+    assert inferred.atype.model_fields["extra"].annotation == Optional[Any]
+
+
+class Mixed(BaseModel):
+    code: Optional[Union[int, str]] = None
+    payload: Any = None
+
+
+def test_parquet_round_trip_decodes_json_with_inferred_atype(offline_llm, tmp_path):
+    states = [
+        Mixed(code="q", payload={"a": [1, 2], "b": None}),
+        Mixed(code=3, payload="s"),
+        Mixed(),
+    ]
+    path = str(tmp_path / "mixed.parquet")
+    AG(atype=Mixed, states=states).to_parquet(path)
+    inferred = AG.from_parquet(path)
+    assert [s.model_dump() for s in inferred] == [s.model_dump() for s in states]
+
+
+def test_from_parquet_reads_only_transduce_fields(offline_llm, tmp_path):
+    table = pa.table({"Customer Id": [1, 2, 3], "notes": ["a", "b", "c"]})
+    path = str(tmp_path / "raw.parquet")
+    pq.write_table(table, path)
+    ag = AG.from_parquet(path, transduce_fields=["notes"])
+    assert ag.fields == ["notes"] and ag.transduce_fields == ["notes"]
+    assert [s.notes for s in ag] == ["a", "b", "c"]
+    # column names are sanitized
+    assert [s.CustomerId for s in AG.from_parquet(path)] == [1, 2, 3]
+
+
+def test_arrow_round_trip(offline_llm):
+    ag = AG(atype=Customer, states=customers(5))
+    table = ag.to_arrow(chunk_size=2)
+    assert table.schema.field("joined").type == pa.timestamp("us")
+    assert table.schema.field("address").type == pa.struct(
+        [("city", pa.string()), ("zip", pa.int64())]
+    )
+    assert AG.from_arrow(table, atype=Customer).states == ag.states
+    assert AG.from_arrow(table.to_batches()[0], atype=Customer).states == ag.states[:2]
+
+
+def test_iter_parquet_is_lazy(tmp_path):
+    path = str(tmp_path / "rows.parquet")
+    pq.write_table(pa.table({"id": list(range(100))}), path, row_group_size=10)
+    states = AG.iter_parquet(path, batch_size=10)
+    assert [next(states).id for _ in range(15)] == list(range(15))
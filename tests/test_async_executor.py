@@ -0,0 +1,256 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from agentics.core.async_executor import aMap
+from agentics.core.concurrency import AdaptiveLimiter, get_limiter
+from agentics.core.errors import is_transient_error
+from agentics.core.llm_connections import (
+    aclose_openai_clients,
+    get_openai_client,
+    openai_client_handle,
+    openai_clients,
+    resolve_openai_client,
+)
+from agentics.core.utils import async_odered_progress, bounded_as_completed
+
+
+class InFlight:
+    """Tracks how many calls are running at the same time."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+
+    async def __call__(self, x):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            await asyncio.sleep(0.001 * (x % 3))
+            if x == 7:
+                raise ValueError("boom")
+            return x * 2
+        finally:
+            self.current -= 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_pool_limits_in_flight_and_keeps_order():
+    work = InFlight()
+    results = await async_odered_progress(
+        range(50), work, max_workers=4, transient_pbar=True
+    )
+    assert work.peak <= 4
+    assert isinstance(results[7], ValueError)
+    assert [r for i, r in enumerate(results) if i != 7] == [
+        i * 2 for i in range(50) if i != 7
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bounded_pool_consumes_inputs_lazily():
+    pulled = []
+
+    def source():
+        for i in range(1000):
+            pulled.append(i)
+            yield i
+
+    async def work(x):
+        return x
+
+    stream = bounded_as_completed(source(), work, max_workers=3)
+    await anext(stream)
+    await stream.aclose()
+    assert len(pulled) <= 4
+
+
+@pytest.mark.asyncio
+async def test_bounded_pool_accepts_async_iterables():
+    async def source():
+        for i in range(10):
+            await asyncio.sleep(0)
+            yield i
+
+    async def work(x):
+        return x + 1
+
+    results = await async_odered_progress(source(), work, max_workers=2)
+    assert results == list(range(1, 11))
+
+
+@pytest.mark.asyncio
+async def test_amap_executor_uses_worker_pool():
+    work = InFlight()
+    mapper = aMap(func=work, max_workers=5, max_retries=0)
+    results = await mapper.execute(*range(20), transient_pbar=True)
+    assert work.peak <= 5
+    assert results[3] == 6
+
+
+class Flaky:
+    """Fails each input with the given errors before succeeding"""
+
+    def __init__(self, *errors):
+        self.errors = errors
+        self.calls = {}
+
+    async def __call__(self, x):
+        n = self.calls[x] = self.calls.get(x, 0) + 1
+        if n <= len(self.errors):
+            raise self.errors[n - 1]
+        return x
+
+
+def validation_error():
+    class M(BaseModel):
+        x: int
+
+    try:
+        M(x="nope")
+    except ValidationError as e:
+        return e
+
+
+def test_errors_are_classified():
+    request = httpx.Request("GET", "http://llm")
+    assert is_transient_error(asyncio.TimeoutError())
+    assert is_transient_error(httpx.ConnectError("down"))
+    for status, transient in ((429, True), (503, True), (400, False)):
+        error = httpx.HTTPStatusError(
+            "", request=request, response=httpx.Response(status, request=request)
+        )
+        assert is_transient_error(error) is transient
+    assert not is_transient_error(validation_error())
+
+
+@pytest.mark.asyncio
+async def test_retries_use_separate_budgets_per_error_class():
+    transient = Flaky(TimeoutError(), TimeoutError())
+    mapper = aMap(func=transient, max_retries=2, retry_base_delay=0.001)
+    assert await mapper.execute(*range(3), transient_pbar=True) == [0, 1, 2]
+
+    permanent = Flaky(validation_error(), validation_error())
+    mapper = aMap(func=permanent, max_permanent_retries=1, retry_base_delay=0.001)
+    results = await mapper.execute(*range(3), transient_pbar=True)
+    assert all(isinstance(r, ValidationError) for r in results)
+    assert permanent.calls == {0: 2, 1: 2, 2: 2}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_executions_do_not_share_retry_state():
+    mapper = aMap(func=Flaky(TimeoutError()), max_retries=1, retry_base_delay=0.001)
+    first, second = await asyncio.gather(
+        mapper.execute(*range(10), transient_pbar=True),
+        mapper.execute(*range(10, 20), transient_pbar=True),
+    )
+    assert first == list(range(10)) and second == list(range(10, 20))
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_increases_and_backs_off():
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=6)
+    for _ in range(20):
+        async with limiter.slot():
+            pass
+    assert limiter.limit == 6
+
+    with pytest.raises(TimeoutError):
+        async with limiter.slot():
+            raise TimeoutError()
+    assert limiter.limit == 3
+    assert [h["reason"] for h in limiter.history][-1] == "decrease"
+
+    with pytest.raises(ValueError):
+        async with limiter.slot():
+            raise ValueError("permanent errors don't change the limit")
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_executor_respects_adaptive_limit():
+    work = InFlight()
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+    mapper = aMap(func=work, max_workers=10, limiter=limiter, max_retries=0)
+    await mapper.execute(*range(30), transient_pbar=True)
+    assert work.peak <= 2
+    assert limiter.in_flight == 0
+
+
+def test_limiters_are_shared_per_provider():
+    assert get_limiter("watsonx") is get_limiter("watsonx")
+    assert get_limiter("watsonx") is not get_limiter("openai")
+
+
+@pytest.mark.asyncio
+async def test_openai_clients_are_pooled_per_server():
+    client = get_openai_client("http://localhost:8000/v1")
+    assert client is get_openai_client("http://localhost:8000/v1")
+    assert client is not get_openai_client("http://localhost:8000/v1", api_key="key")
+    await aclose_openai_clients()
+    assert get_openai_client("http://localhost:8000/v1") is not client
+    await aclose_openai_clients()
+
+
+class CompletionHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible chat completion endpoint, keeping connections alive"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps(
+            {
+                "id": "1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "test",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": "ok"},
+                    }
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def completion_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1"
+    server.shutdown()
+
+
+def test_shared_clients_survive_separate_event_loops(completion_server):
+    handle = openai_client_handle(completion_server)
+
+    async def complete():
+        client = resolve_openai_client(handle)
+        response = await client.with_options(max_retries=0).chat.completions.create(
+            model="test", messages=[{"role": "user", "content": "hi"}]
+        )
+        return client, response.choices[0].message.content
+
+    first, output = asyncio.run(complete())
+    # the pooled connections of the first loop are not reused by the second one
+    second, output_again = asyncio.run(complete())
+    assert output == output_again == "ok"
+    assert first is not second
+    assert first not in openai_clients.values()
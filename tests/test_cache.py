@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from agentics.core.async_executor import (
+    PydanticTransducer,
+    PydanticTransducerLLM,
+    PydanticTransducerVLLM,
+)
+from agentics.core.cache import TransductionCache, get_transduction_cache
+
+
+class Answer(BaseModel):
+    answer: Optional[str] = None
+
+
+class CountingTransducer(PydanticTransducer):
+    def __init__(self, **kwargs):
+        self.atype = Answer
+        self.llm = None
+        self.intentional_definiton = "Answer the question"
+        self.calls = 0
+        super().__init__(**kwargs)
+
+    async def _execute(self, input: str) -> BaseModel:
+        self.calls += 1
+        return Answer(answer=input.upper())
+
+
+def test_cache_key_depends_on_all_components():
+    key = TransductionCache.make_key("m", "i", Answer, "p")
+    assert key == TransductionCache.make_key("m", "i", Answer, "p")
+    assert key != TransductionCache.make_key("other", "i", Answer, "p")
+    assert key != TransductionCache.make_key("m", "other", Answer, "p")
+    assert key != TransductionCache.make_key("m", "i", Answer, "other")
+
+
+def test_cache_lru_and_size_eviction(tmp_path):
+    cache = TransductionCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.stats()["entries"] == 2
+
+    cache = TransductionCache(":memory:", max_bytes=10)
+    cache.set("a", "x" * 6)
+    cache.set("b", "y" * 6)
+    assert cache.get("a") is None
+    assert cache.get("b") == "y" * 6
+
+
+def test_cache_ttl_expires_entries():
+    cache = TransductionCache(":memory:", ttl=-1)
+    cache.set("a", "1")
+    assert cache.get("a") is None
+    assert cache.misses == 1
+
+
+def test_get_transduction_cache_reuses_stores(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    assert get_transduction_cache(path) is get_transduction_cache(path)
+    assert get_transduction_cache(None) is None
+
+
+@pytest.mark.asyncio
+async def test_transducer_serves_hits_and_honours_modes():
+    cache = TransductionCache(":memory:")
+    transducer = CountingTransducer(cache=cache)
+    await transducer.execute("a", "b", transient_pbar=True)
+    outputs = await transducer.execute("a", "b", transient_pbar=True)
+    assert [o.answer for o in outputs] == ["A", "B"]
+    assert transducer.calls == 2
+    assert cache.hits == 2
+
+    transducer.cache_mode = "refresh"
+    await transducer.execute("a")
+    assert transducer.calls == 3
+
+    transducer.cache_mode = "bypass"
+    await transducer.execute("a")
+    assert transducer.calls == 4
+    assert cache.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_key_covers_prompt_and_sampling_params():
+    cache = TransductionCache(":memory:")
+    transducer = CountingTransducer(cache=cache)
+    transducer.llm = SimpleNamespace(model="m", temperature=0)
+    await transducer.execute("a")
+    await transducer.execute("a")
+    assert transducer.calls == 1
+    transducer.llm.temperature = 0.7
+    await transducer.execute("a")
+    assert transducer.calls == 2
+
+    llm = SimpleNamespace(model="m", temperature=0)
+    context = PydanticTransducerLLM(Answer, llm=llm).cache_context
+    assert context == PydanticTransducerLLM(Answer, llm=llm).cache_context
+    assert (
+        context != PydanticTransducerLLM(Answer, llm=llm, role="Critic").cache_context
+    )
+    assert (
+        context
+        != PydanticTransducerLLM(Answer, llm=llm, expected_output="x").cache_context
+    )
+
+    vllm = PydanticTransducerVLLM(Answer, model="m", request_timeout=5)
+    assert vllm.model_id == "m"
+    assert vllm.cache_context == PydanticTransducerVLLM(Answer, model="m").cache_context
+    assert (
+        vllm.cache_context
+        != PydanticTransducerVLLM(Answer, model="m", n_samples=3).cache_context
+    )
+    assert (
+        vllm.cache_context
+        != PydanticTransducerVLLM(Answer, model="m", temperature=1).cache_context
+    )
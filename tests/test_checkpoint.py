@@ -0,0 +1,67 @@
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from agentics import AG
+from agentics.core.checkpoint import CheckpointStore
+
+
+class Answer(BaseModel):
+    answer: Optional[str] = None
+
+
+class Counter(BaseModel):
+    value: Optional[int] = None
+
+
+def test_checkpoint_store_matches_position_and_hash(tmp_path):
+    store = CheckpointStore(str(tmp_path / "ckpt.jsonl"))
+    with store:
+        store.append(0, "h0", Counter(value=1))
+        store.append(1, "h1", Counter(value=2))
+    with open(store.path, "a") as f:
+        f.write('{"index": 2, "hash"')  # truncated by a crash
+    assert store.completed(["h0", "other", "h2"]) == {0: {"value": 1}}
+
+
+@pytest.mark.asyncio
+async def test_amap_resumes_from_checkpoint(tmp_path):
+    path = str(tmp_path / "amap.jsonl")
+    calls = []
+
+    async def double(state: Counter) -> Counter:
+        calls.append(state.value)
+        if state.value == 3:
+            raise ValueError("crash")
+        return Counter(value=state.value * 2)
+
+    states = [Counter(value=i) for i in range(5)]
+    ag = AG(atype=Counter, llm=None, states=list(states), checkpoint_path=path)
+    ag = await ag.amap(double)
+    assert [s.value for s in ag] == [0, 2, 4, 3, 8]
+    with open(path) as f:
+        assert len(f.readlines()) == 4
+
+    calls.clear()
+    ag = AG(atype=Counter, llm=None, states=list(states), checkpoint_path=path)
+    ag = await ag.amap(double, resume=True)
+    assert calls == [3, 3]  # only the failed state, with its retry
+    assert [s.value for s in ag] == [0, 2, 4, 3, 8]
+
+
+@pytest.mark.asyncio
+async def test_transduction_resumes_from_checkpoint(tmp_path, echo_llm):
+    path = str(tmp_path / "lshift.jsonl")
+    target = AG(atype=Answer, llm=None, checkpoint_path=path)
+    await (target << ["a", "b", "c"])
+    with open(path) as f:
+        entries = [json.loads(line) for line in f]
+    assert sorted(e["index"] for e in entries) == [0, 1, 2]
+
+    echo_llm.clear()
+    target.resume_from_checkpoint = True
+    output = await (target << ["a", "b", "d"])
+    assert [s.answer for s in output] == ["A", "B", "D"]
+    assert len(echo_llm) == 1
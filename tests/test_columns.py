@@ -0,0 +1,189 @@
+from typing import List, Optional
+
+import numpy as np
+import pytest
+from pydantic import BaseModel, Field
+
+from agentics import AG
+from agentics.core.columns import ColumnarStates
+from agentics.core.errors import AmapError
+
+
+class Product(BaseModel):
+    name: Optional[str] = None
+    price: Optional[float] = None
+    released: Optional[str] = None
+
+
+def products():
+    return AG(
+        atype=Product,
+        llm=None,
+        states=[
+            Product(name=" Pen ", price=2.0, released="2024-01-05"),
+            Product(name="Ink", price=None, released="2023-12-31"),
+            Product(name="Pad", price=5.0),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_vmap_transforms_whole_columns():
+    calls = []
+
+    def scale(price):
+        calls.append(price)
+        return price * 1.1
+
+    ag = await products().vmap(scale, fields=["price"])
+    assert len(calls) == 1 and isinstance(calls[0], np.ndarray)
+    assert ag[0].price == pytest.approx(2.2) and ag[2].price == pytest.approx(5.5)
+    # missing values come back as None rather than NaN
+    assert ag[1].price is None
+
+
+@pytest.mark.asyncio
+async def test_vmap_adds_new_fields_in_bulk():
+    def flags(name, price):
+        return {"name": np.char.strip(name.astype(str)), "expensive": price > 3}
+
+    ag = await products().vmap(flags, fields=["name", "price"])
+    assert [s.name for s in ag] == ["Pen", "Ink", "Pad"]
+    assert [s.expensive for s in ag] == [False, False, True]
+    assert "expensive" in ag.atype.model_fields
+    assert all(isinstance(s, ag.atype) for s in ag)
+
+
+@pytest.mark.asyncio
+async def test_vmap_with_pandas_columns():
+    import pandas as pd
+
+    def normalize_dates(frame):
+        return pd.to_datetime(frame["released"]).dt.strftime("%d/%m/%Y")
+
+    ag = await products().vmap(
+        normalize_dates, fields=["released"], column_format="pandas"
+    )
+    assert [s.released for s in ag] == ["05/01/2024", "31/12/2023", None]
+
+
+@pytest.mark.asyncio
+async def test_vmap_checks_column_lengths():
+    with pytest.raises(AmapError):
+        await products().vmap(lambda price: price[:1], fields=["price"])
+
+
+class Price(BaseModel):
+    name: Optional[str] = None
+    amount: Optional[float] = None
+
+
+@pytest.mark.asyncio
+async def test_columnar_states_keep_the_ag_api():
+    ag = products().to_columnar()
+    assert isinstance(ag.states, ColumnarStates)
+    assert str(ag.states.frame["price"].dtype) == "Float64"
+    assert len(ag) == 3 and ag[0] == Product(
+        name=" Pen ", price=2.0, released="2024-01-05"
+    )
+    assert [s.name for s in ag] == [" Pen ", "Ink", "Pad"]
+    assert ag[1].price is None and ag[-1].name == "Pad"
+
+    # states are built on access, changes are written back by assignment
+    state = ag[2]
+    state.price = 6.0
+    ag[2] = state
+    assert ag[2].price == 6.0
+    ag[-1] = Product(name="Box")
+    assert ag[2].name == "Box" and len(ag) == 3
+    with pytest.raises(IndexError):
+        ag[3] = state
+    with pytest.raises(IndexError):
+        ag.states[-4] = state
+
+    ag.append(Product(name="Cap"))
+    assert len(ag) == 4 and isinstance(ag.states, ColumnarStates)
+    assert isinstance(ag.filter_states(1, 3).states, ColumnarStates)
+    assert ag.to_dataframe()["name"].tolist() == [" Pen ", "Ink", "Box", "Cap"]
+
+
+@pytest.mark.asyncio
+async def test_columnar_bulk_operations():
+    ag = products().to_columnar()
+    projected = ag.rebind_atype(Price, {"name": "name", "price": "amount"})
+    assert [(s.name, s.amount) for s in projected] == [
+        (" Pen ", 2.0),
+        ("Ink", None),
+        ("Pad", 5.0),
+    ]
+
+    ag = await ag.vmap(lambda price: price * 2, fields=["price"])
+    assert isinstance(ag.states, ColumnarStates)
+    assert [s.price for s in ag] == [4.0, None, 10.0]
+
+    async def shout(state: Product) -> Product:
+        state.name = state.name.upper()
+        return state
+
+    await ag.amap(shout)
+    assert isinstance(ag.states, ColumnarStates)
+    assert ag[1].name == "INK"
+
+
+def test_columnar_merge_and_product():
+    left = AG(
+        atype=Product, llm=None, states=[Product(name="a"), Product(name="b")]
+    ).to_columnar()
+    right = AG(atype=Price, llm=None, states=[Price(amount=1.0)])
+    merged = left.merge(right)
+    assert [(s.name, s.amount) for s in merged] == [(None, 1.0), ("b", None)]
+
+    product = left.product(
+        AG(atype=Price, llm=None, states=[Price(amount=1.0), Price(amount=2.0)])
+    )
+    assert [(s.name, s.amount) for s in product] == [
+        ("a", 1.0),
+        ("a", 2.0),
+        ("b", 1.0),
+        ("b", 2.0),
+    ]
+
+
+def test_columnar_from_dataframe_validates_chunks():
+    import pandas as pd
+
+    frame = pd.DataFrame({"name": ["x", "y"], "price": ["1.5", None]})
+    states = ColumnarStates.from_frame(Product, frame, chunk_size=1)
+    assert [s.price for s in states] == [1.5, None]
+    assert states.frame["released"].isna().all()
+
+
+class Tagged(BaseModel):
+    tags: List[str] = Field(default_factory=list)
+    score: float = 1.0
+
+
+def test_columnar_append_is_buffered_until_read():
+    states = ColumnarStates.from_states([Product(name="a")], Product)
+    frame = states.frame
+    for i in range(500):
+        states.append(Product(name=str(i)))
+    states.extend(ColumnarStates.from_states([Product(name="z")], Product))
+    assert states.frame is not frame and len(states) == 502
+    assert states.frame is states.frame
+    assert [s.name for s in states][-3:] == ["498", "499", "z"]
+
+
+def test_columnar_merge_fills_missing_fields_with_defaults():
+    left = AG(atype=Product, llm=None, states=[Product(name="a"), Product(name="b")])
+    right = AG(atype=Tagged, llm=None, states=[Tagged(tags=["x"], score=2.0)])
+    merged = left.to_columnar().merge(right)
+    assert [(s.name, s.tags, s.score) for s in merged] == [
+        ("a", ["x"], 2.0),
+        ("b", [], 1.0),
+    ]
+    assert [(s.name, s.tags, s.score) for s in left.merge(right)] == [
+        (s.name, s.tags, s.score) for s in merged
+    ]
+    padded = ColumnarStates.from_columns(Tagged, {}, 2)
+    assert padded[0].tags == [] and padded[0].tags is not padded[1].tags
@@ -0,0 +1,59 @@
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from agentics import AG
+from agentics.core.fewshot import FewShotIndex
+
+
+class Question(BaseModel):
+    question: Optional[str] = None
+
+
+class Answer(BaseModel):
+    question: Optional[str] = None
+    answer: Optional[str] = None
+
+
+def test_index_selects_similar_examples_within_budget():
+    index = FewShotIndex(
+        ["capital of france", "capital of italy", "boiling point of water"],
+        ["paris", "rome", "100"],
+    )
+    assert index.select("what is the capital of france", k=1) == [
+        ("capital of france", "paris")
+    ]
+    assert index.select("capital of france", k=2, exclude=0) == [
+        ("capital of italy", "rome"),
+        ("boiling point of water", "100"),
+    ]
+    assert index.select("capital of france", k=3, max_tokens=15) == [
+        ("capital of france", "paris")
+    ]
+    assert index.select("water", k=2, strategy="random") == index.select(
+        "water", k=2, strategy="random"
+    )
+
+
+@pytest.mark.asyncio
+async def test_transduction_adds_per_state_few_shots(echo_llm):
+    questions = ["capital of france", "capital of italy", "boiling point of water"]
+    source = AG(
+        atype=Question,
+        llm=None,
+        states=[Question(question=q) for q in questions + ["capital city of spain"]],
+        transduce_fields=["question"],
+    )
+    target = AG(
+        atype=Answer,
+        llm=None,
+        states=[Answer(answer=a) for a in ["paris", "rome", "100"]],
+        transduce_fields=["answer"],
+        few_shot_k=1,
+    )
+    await (target << source)
+    assert len(echo_llm) == 4
+    assert '"paris"' not in echo_llm[0]  # a state is not its own example
+    assert '"rome"' in echo_llm[0]
+    assert '"100"' not in echo_llm[3] and echo_llm[3].count("Example") == 1
@@ -0,0 +1,169 @@
+import csv
+import gzip
+import io
+import json
+import os
+from typing import Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from agentics import AG
+from agentics.core.columns import ColumnarStates
+from agentics.core.jsonio import iter_json_array, sanitize_record
+
+CSV = "id,name,score,Unit Price\n1,a,0.5,3\n2,,1.5,4\n3,c,,5\n"
+
+
+class Row(BaseModel):
+    id: int
+    name: Optional[str] = None
+    score: Optional[float] = None
+
+
+def test_from_csv_infers_string_fields(offline_llm, tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text(CSV)
+    ag = AG.from_csv(str(path), chunk_size=2)
+    assert ag.fields == ["id", "name", "score", "UnitPrice"]
+    assert [s.name for s in ag] == ["a", "", "c"]
+    # columns are matched to their sanitized field names
+    assert [s.UnitPrice for s in ag] == ["3", "4", "5"]
+
+
+def test_from_csv_validates_chunks(offline_llm):
+    ag = AG.from_csv(io.StringIO(CSV), atype=Row, usecols=["id", "score"], max_rows=2)
+    assert [(s.id, s.score, s.name) for s in ag] == [(1, 0.5, None), (2, 1.5, None)]
+    with pytest.raises(ValidationError):
+        AG.from_csv(CSV, atype=Row)  # "" is not a valid score
+
+
+def test_from_csv_trusted_and_columnar(offline_llm, tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text(CSV)
+    for engine in ("c", "pyarrow"):
+        trusted = AG.from_csv(str(path), atype=Row, trusted=True, engine=engine)
+        # parsed columns are stored as they are, without a pydantic object per row
+        assert isinstance(trusted.states, ColumnarStates)
+        assert trusted[2].score is None and trusted[0].id == 1
+        assert [s.name for s in trusted] == ["a", "", "c"]
+    ag = AG.from_csv(
+        str(path), atype=Row, usecols=["id", "name"], columnar=True, engine="pyarrow"
+    )
+    assert isinstance(ag.states, ColumnarStates)
+    assert [(s.id, s.name) for s in ag] == [(1, "a"), (2, ""), (3, "c")]
+
+
+def test_from_csv_short_rows_read_as_none(offline_llm, tmp_path):
+    path = tmp_path / "short.csv"
+    path.write_text("id,name,score\n1\n2,,\n3,c,0.5\n")
+    for engine in (None, "pyarrow"):
+        ag = AG.from_csv(str(path), engine=engine)
+        assert [(s.id, s.name, s.score) for s in ag] == [
+            ("1", None, None),
+            ("2", "", ""),
+            ("3", "c", "0.5"),
+        ]
+
+
+def test_from_csv_pyarrow_streams_blocks(offline_llm, tmp_path):
+    from agentics.core.csvio import iter_arrow_csv_frames
+
+    path = tmp_path / "rows.csv"
+    path.write_text("id,name\n" + "".join(f"{i},n{i}\n" for i in range(2000)))
+    frames = list(iter_arrow_csv_frames(str(path), block_size=1 << 10, max_rows=1500))
+    assert len(frames) > 1 and sum(len(f) for f in frames) == 1500
+    ag = AG.from_csv(str(path), atype=Row, engine="pyarrow", max_rows=1500)
+    assert [s.id for s in ag] == list(range(1500))
+
+
+def test_from_csv_header_only(offline_llm):
+    ag = AG.from_csv("id,name\n")
+    assert ag.fields == ["id", "name"] and len(ag) == 0
+
+
+def test_from_jsonl_stops_at_max_rows(offline_llm, tmp_path):
+    path = tmp_path / "rows.jsonl"
+    lines = [json.dumps({"id": i, "Unit Price": i * 2}) for i in range(5)]
+    # rows after max_rows are never parsed
+    path.write_text("\n".join(lines[:3] + ["", "not json"]))
+    ag = AG.from_jsonl(str(path), max_rows=3)
+    assert ag.fields == ["id", "UnitPrice"]
+    assert [s.UnitPrice for s in ag] == [0, 2, 4]
+
+
+def test_from_json_array_is_parsed_incrementally(offline_llm, tmp_path):
+    path = tmp_path / "rows.json"
+    records = [{"id": i, "name": f"n{i}", "tags": [i, [i]]} for i in range(50)]
+    path.write_text(json.dumps(records, indent=1))
+    items = list(iter_json_array(str(path), read_size=7))
+    assert items == records
+    ag = AG.from_jsonl(str(path), atype=Row, jsonl=False, max_rows=10)
+    assert [s.id for s in ag] == list(range(10))
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO('[{"id": 1}, {"id"')))
+
+
+def test_sanitize_record_keeps_nested_structure():
+    record = {"Unit Price": {"in usd": 1}, "items": [{"a b": 2}], "ok": 3}
+    assert sanitize_record(record) == {
+        "UnitPrice": {"inusd": 1},
+        "items": [{"ab": 2}],
+        "ok": 3,
+    }
+
+
+def test_iter_jsonl_is_lazy(tmp_path):
+    path = tmp_path / "rows.jsonl"
+    path.write_text("\n".join(json.dumps({"id": i}) for i in range(10)) + "\nbroken")
+    states = AG.iter_jsonl(str(path), atype=Row, chunk_size=4)
+    assert [next(states).id for _ in range(8)] == list(range(8))
+
+
+class Order(BaseModel):
+    id: int
+    customer: Optional[str] = None
+    items: List[str] = []
+    address: Optional[Dict[str, str]] = None
+
+
+def orders(n):
+    return [
+        Order(id=i, customer=f"c{i}", items=["a", "b"][: i % 3], address={"city": "x"})
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("file_name", ["orders.jsonl", "orders.jsonl.gz"])
+def test_to_jsonl_round_trip(offline_llm, tmp_path, file_name):
+    ag = AG(atype=Order, states=orders(25))
+    path = str(tmp_path / file_name)
+    assert ag.to_jsonl(path, chunk_size=10) == [path]
+    if file_name.endswith(".gz"):
+        with gzip.open(path, "rt") as f:
+            lines = f.read().splitlines()
+    else:
+        lines = (tmp_path / file_name).read_text().splitlines()
+    assert [Order.model_validate_json(line) for line in lines] == ag.states
+
+
+def test_to_jsonl_writes_shards(offline_llm, tmp_path):
+    ag = AG(atype=Order, states=orders(10))
+    paths = ag.to_jsonl(str(tmp_path / "orders.jsonl"), shards=3)
+    assert [os.path.basename(p) for p in paths] == [
+        f"orders-0000{i}-of-00003.jsonl" for i in range(3)
+    ]
+    states = [state for path in paths for state in AG.iter_jsonl(path, atype=Order)]
+    assert states == ag.states
+
+
+def test_to_csv_writes_nested_fields_as_json(offline_llm, tmp_path):
+    ag = AG(atype=Order, states=orders(3) + [Order(id=3)])
+    path = str(tmp_path / "orders.csv")
+    ag.to_csv(path, chunk_size=2)
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == ["id", "customer", "items", "address"]
+    assert [json.loads(row["items"]) for row in rows] == [[], ["a"], ["a", "b"], []]
+    assert json.loads(rows[0]["address"]) == {"city": "x"}
+    assert rows[3]["customer"] == rows[3]["address"] == ""
@@ -0,0 +1,37 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from agentics import AG
+from agentics.core.atype import make_all_fields_optional
+from agentics.core.utils import (
+    get_json_schema,
+    get_type_adapter,
+    make_states_list_model,
+)
+
+
+class Movie(BaseModel):
+    title: Optional[str] = None
+    year: Optional[int] = None
+    genres: List[str] = []
+
+
+def test_derived_models_are_created_once():
+    ag = AG(atype=Movie, llm=None)
+    assert ag.subset_atype(["title"]) is ag.subset_atype(["title"])
+    assert ag.subset_atype(["title"]) is not ag.subset_atype(["year"])
+    assert make_states_list_model(Movie) is make_states_list_model(Movie)
+    assert make_all_fields_optional(Movie) is make_all_fields_optional(Movie)
+    assert (
+        ag.add_attribute("rating", float).atype
+        is ag.add_attribute("rating", float).atype
+    )
+
+
+def test_schemas_and_adapters_are_shared():
+    assert get_json_schema(Movie) is get_json_schema(Movie)
+    assert get_json_schema(Movie) == Movie.model_json_schema()
+    adapter = get_type_adapter(List[Movie])
+    assert adapter is get_type_adapter(List[Movie])
+    assert adapter.validate_python([{"title": "Alien"}])[0].title == "Alien"
@@ -0,0 +1,145 @@
+import asyncio
+from typing import Optional
+
+import pytest
+from loguru import logger
+from pydantic import BaseModel
+
+from agentics import AG
+from agentics.core.reduce import ReductionIndex, TreeReducer
+
+
+class Answer(BaseModel):
+    answer: Optional[str] = None
+
+
+@pytest.mark.asyncio
+async def test_tree_reducer_builds_the_tree_and_keeps_order():
+    calls = []
+
+    async def concat(values):
+        await asyncio.sleep(0.001 * len(values))
+        calls.append(values)
+        return "".join(values)
+
+    root = await TreeReducer(concat, fan_in=3, max_workers=2)(iter("abcdefghij"))
+    assert root.value == "abcdefghij"
+    # the lone "j" reduction is moved up to the root without being reduced again
+    assert calls[-1] == ["abcdefghi", "j"] and len(calls) == 6
+    assert (root.start, root.end) == (0, 10)
+    assert sorted(len(n.children) for n in root.walk() if n.level == 1) == [1, 3, 3, 3]
+    assert [n.level for n in root.children] == [2, 1]
+    assert max(n.level for n in root.walk()) == 3
+
+
+@pytest.mark.asyncio
+async def test_tree_reducer_starts_parents_before_the_level_is_done():
+    order = []
+
+    async def reduce(values):
+        # the first group is slow, the second level can't wait for it
+        if values[0] == "a":
+            await asyncio.sleep(0.05)
+        order.append("".join(values))
+        return "".join(values)
+
+    root = await TreeReducer(reduce, fan_in=2)(["a", "b", "c", "d", "e", "f", "g", "h"])
+    assert root.value == "abcdefgh"
+    assert order.index("efgh") < order.index("ab")
+
+
+@pytest.mark.asyncio
+async def test_tree_reducer_skips_failed_children():
+    async def reduce(values):
+        if "x" in values:
+            raise ValueError("boom")
+        return "".join(values)
+
+    warnings = []
+    sink = logger.add(warnings.append, level="WARNING")
+    try:
+        root = await TreeReducer(reduce, fan_in=2, keep_tree=False)(
+            ["a", "b", "x", "y"]
+        )
+    finally:
+        logger.remove(sink)
+    assert root.value == "ab"
+    assert len(warnings) == 1 and "failed children" in warnings[0]
+    assert root.children == []
+
+
+@pytest.mark.asyncio
+async def test_areduce_transduction_does_not_mutate_the_target(echo_llm):
+    target = AG(
+        atype=Answer, llm=None, transduction_type="areduce", areduce_batch_size=2
+    )
+    output = await (target << ["a", "b", "c"])
+    assert len(output) == 1 and output[0].answer
+    assert len(output.areduce_batches) == 2
+    assert output.areduce_tree.end == 3
+    assert target.transduction_type == "areduce"
+    assert target.areduce_batches == [] and len(target) == 0
+
+
+class Summary(BaseModel):
+    text: Optional[str] = None
+
+
+@pytest.mark.asyncio
+async def test_reduction_index_reuses_cached_nodes():
+    calls = []
+
+    async def concat(values):
+        calls.append(len(values))
+        return Summary(
+            text="".join(v.text if isinstance(v, Summary) else v for v in values)
+        )
+
+    items = [chr(ord("a") + i) for i in range(20)]
+    index = ReductionIndex(items, concat, Summary, batch_size=2, fan_in=2)
+    assert index.cover(2, 16) == [(0, 1), (1, 1), (2, 1)]
+
+    root = await index.query(3, 16)
+    assert root.value.text == "".join(items[3:17])
+    assert [(c.start, c.end) for c in root.children] == [
+        (3, 4),
+        (4, 8),
+        (8, 16),
+        (16, 17),
+    ]
+
+    # a new index over the same content and cache only reduces the new parts
+    calls.clear()
+    index = ReductionIndex(
+        items, concat, Summary, batch_size=2, fan_in=2, cache=index.cache
+    )
+    root = await index.query(4, 15)
+    assert root.value.text == "".join(items[4:16])
+    assert calls == [2]  # combining the two cached nodes
+
+
+@pytest.mark.asyncio
+async def test_reduction_index_hashes_only_queried_items():
+    async def concat(values):
+        return Summary(
+            text="".join(v.text if isinstance(v, Summary) else v for v in values)
+        )
+
+    items = [str(i % 10) for i in range(100_000)]
+    index = ReductionIndex(items, concat, Summary, batch_size=10, fan_in=10)
+    root = await index.query(50_000, 50_009)
+    assert root.value.text == "0123456789"
+    assert len(index._item_hashes) == 10
+
+
+@pytest.mark.asyncio
+async def test_areduce_range(echo_llm):
+    source = AG(
+        atype=Answer, llm=None, states=[Answer(answer=str(i)) for i in range(8)]
+    )
+    target = AG(atype=Answer, llm=None, areduce_batch_size=2)
+    output = await target.areduce_range(source, 1, 6)
+    assert len(output) == 1
+    calls = len(echo_llm)
+    await target.areduce_range(source, 1, 6)
+    assert len(echo_llm) == calls
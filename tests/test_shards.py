@@ -0,0 +1,96 @@
+import json
+import os
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from agentics import AG
+from agentics.core.shards import shard_ranges
+
+
+class Row(BaseModel):
+    value: Optional[int] = None
+    pid: Optional[int] = None
+
+
+class Answer(BaseModel):
+    answer: Optional[str] = None
+    pid: Optional[int] = None
+
+
+class EchoLLM:
+    """Answers with the transduced source, tagged with the process serving the call"""
+
+    async def acall(self, messages, response_model=None):
+        source = messages[-1]["content"].split("SOURCE:\n")[-1]
+        return json.dumps({"answer": source.upper(), "pid": os.getpid()})
+
+
+def square(state: Row) -> Row:
+    state.value = state.value**2
+    state.pid = os.getpid()
+    return state
+
+
+def test_shard_ranges_are_balanced_and_contiguous():
+    assert shard_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert shard_ranges(2, 4) == [(0, 1), (1, 2)]
+
+
+@pytest.mark.asyncio
+async def test_sharded_amap_keeps_order():
+    ag = AG(atype=Row, states=[Row(value=i) for i in range(40)], llm=None)
+    await ag.amap(square, shards=4)
+    assert [s.value for s in ag] == [i**2 for i in range(40)]
+    pids = {s.pid for s in ag}
+    assert len(pids) > 1 and os.getpid() not in pids
+
+
+@pytest.mark.asyncio
+async def test_sharded_amap_with_crewai_llm():
+    from crewai import LLM
+
+    llm = LLM(model="openai/gpt-4o-mini", api_key="test", temperature=0.2)
+    ag = AG(atype=Row, states=[Row(value=i) for i in range(8)], llm=llm)
+    await ag.amap(square, shards=2)
+    assert [s.value for s in ag] == [i**2 for i in range(8)]
+    assert os.getpid() not in {s.pid for s in ag}
+
+
+@pytest.mark.asyncio
+async def test_sharded_transduction_reassembles_outputs():
+    target = AG(atype=Answer, llm=EchoLLM(), shards=3, max_workers=6)
+    output = await (target << [f"q{i}" for i in range(30)])
+    assert [s.answer for s in output] == [f"Q{i}" for i in range(30)]
+    assert len({s.pid for s in output}) > 1
+
+
+class Question(BaseModel):
+    question: Optional[str] = None
+
+
+class FewShotLLM:
+    """Tells whether the few shot of the first state was added to the prompt"""
+
+    async def acall(self, messages, response_model=None):
+        seen = "EXAMPLE-ANSWER" in messages[-1]["content"]
+        return json.dumps({"answer": "seen" if seen else "unseen"})
+
+
+@pytest.mark.asyncio
+async def test_sharded_transduction_draws_few_shots_from_all_states():
+    target = AG(
+        atype=Answer,
+        llm=FewShotLLM(),
+        shards=2,
+        transduce_fields=["answer"],
+        few_shot_strategy="first",
+        states=[Answer(answer="EXAMPLE-ANSWER")] + [Answer() for _ in range(5)],
+    )
+    source = AG(
+        atype=Question, states=[Question(question=f"q{i}") for i in range(6)], llm=None
+    )
+    output = await (target << source)
+    assert len(output) == 6
+    assert [s.answer for s in output][1:] == ["seen"] * 5
@@ -0,0 +1,60 @@
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from agentics import AG
+
+
+class Question(BaseModel):
+    question: Optional[str] = None
+
+
+class Answer(BaseModel):
+    question: Optional[str] = None
+    answer: Optional[str] = None
+
+
+async def add_mark(state: Question) -> Question:
+    if state.question == "fail":
+        raise ValueError("boom")
+    return Question(question=state.question + "!")
+
+
+@pytest.mark.asyncio
+async def test_amap_stream_yields_every_state_from_async_source():
+    async def source():
+        for q in ["a", "fail", "c"]:
+            yield Question(question=q)
+
+    ag = AG(atype=Question, llm=None, max_workers=2)
+    results = dict([pair async for pair in ag.amap_stream(add_mark, states=source())])
+    assert results[0].question == "a!"
+    assert results[1].question == "fail"
+    assert results[2].question == "c!"
+    assert ag.states == []
+
+
+@pytest.mark.asyncio
+async def test_astream_matches_lshift(echo_llm):
+    questions = ["abc", "de", "f", "fail"]
+    target = AG(atype=Answer, llm=None, max_workers=2)
+
+    streamed = {i: s async for i, s in target.astream(questions)}
+    transduced = await (target << questions)
+
+    assert [streamed[i] for i in range(len(questions))] == transduced.states
+    assert streamed[0].answer == "ABC"
+    assert streamed[3] == Answer()
+
+
+@pytest.mark.asyncio
+async def test_astream_merges_source_states(echo_llm):
+    source = AG(
+        atype=Question,
+        llm=None,
+        states=[Question(question="x"), Question(question="yy")],
+    )
+    target = AG(atype=Answer, llm=None, transduce_fields=["answer"])
+    streamed = {i: s async for i, s in target.astream(source)}
+    assert streamed[1] == Answer(question="yy", answer='{"QUESTION": "YY"}')
@@ -0,0 +1,197 @@
+import asyncio
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+from crewai.events import crewai_event_bus
+from crewai.events.types.llm_events import LLMCallCompletedEvent, LLMCallType
+from pydantic import BaseModel
+
+from agentics import AG
+from agentics.core.async_executor import PydanticTransducerLLM
+from agentics.core.prompts import PromptUsage
+
+
+class Answer(BaseModel):
+    answer: Optional[str] = None
+
+
+@pytest.mark.asyncio
+async def test_batched_transduction_splits_outputs_by_position(echo_llm):
+    target = AG(atype=Answer, llm=None, transduction_batch_size=2)
+    output = await (target << ["a", "b", "c", "d", "e"])
+    assert [s.answer for s in output] == ["A", "B", "C", "D", "E"]
+    assert len(echo_llm) == 3
+
+
+@pytest.mark.asyncio
+async def test_batched_transduction_falls_back_to_single_states(echo_llm):
+    target = AG(atype=Answer, llm=None, transduction_batch_size=2)
+    output = await (target << ["a", "b", "c", "fail"])
+    assert [s.answer for s in output] == ["A", "B", "C", None]
+    # two batches, then the failed batch is retried one state at a time
+    assert len(echo_llm) == 4
+
+
+class FakeLLM:
+    """Stands in for a crewai LLM, recording the messages it receives"""
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.messages = []
+
+    async def acall(self, messages, response_model=None):
+        self.messages.append(messages)
+        return self.answer
+
+
+@pytest.mark.asyncio
+async def test_transduction_without_tools_uses_a_single_completion():
+    llm = FakeLLM('```json\n{"answer": "A"}\n```')
+    target = AG(atype=Answer, llm=llm, instructions="Answer the question")
+    transducer = target._make_transducer("Answer the question")
+    assert isinstance(transducer, PydanticTransducerLLM)
+
+    output = await (target << ["a", "b"])
+    assert [s.answer for s in output] == ["A", "A"]
+    assert len(llm.messages) == 2
+    system, user = llm.messages[0]
+    assert system["role"] == "system" and "Task Executor" in system["content"]
+    # the instructions are part of the prefix shared by all prompts, the source comes last
+    assert "Answer the question" in system["content"]
+    assert llm.messages[1][0] == system
+    assert user["content"] == "\nSOURCE:\na"
+
+
+class SlowLLM:
+    """Async LLM tracking how many completions run at the same time"""
+
+    def __init__(self):
+        self.current = self.peak = 0
+
+    async def acall(self, messages, **kwargs):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        await asyncio.sleep(0.01)
+        self.current -= 1
+        return messages.upper()
+
+
+class SyncOnlyLLM:
+    """LLM with a blocking call and no native async support"""
+
+    async def acall(self, messages, **kwargs):
+        raise NotImplementedError
+
+    def call(self, messages, **kwargs):
+        time.sleep(0.01)
+        return messages[::-1]
+
+
+@pytest.mark.asyncio
+async def test_string_transduction_runs_completions_concurrently():
+    llm = SlowLLM()
+    target = AG(llm=llm, max_workers=4)
+    assert await (target << "hi") == "HI"
+    output = await (target << [f"q{i}" for i in range(12)])
+    assert output == [f"Q{i}" for i in range(12)]
+    assert 1 < llm.peak <= 4
+
+
+@pytest.mark.asyncio
+async def test_string_transduction_offloads_blocking_llms():
+    target = AG(llm=SyncOnlyLLM(), max_workers=4)
+    assert await (target << "abc") == "cba"
+    output = await (target << ["ab", "cd"])
+    assert output == ["ba", "dc"]
+
+
+def test_transduction_with_tools_keeps_the_crew(monkeypatch):
+    crews = []
+    monkeypatch.setattr(
+        "agentics.core.agentics.PydanticTransducerCrewAI",
+        lambda *args, **kwargs: crews.append(kwargs["tools"]) or SimpleNamespace(),
+    )
+    tool = object()
+    AG(atype=Answer, llm=FakeLLM(None), tools=[tool])._make_transducer("x")
+    assert crews == [[tool]]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_inputs_are_transduced_once(echo_llm):
+    target = AG(atype=Answer, llm=None)
+    output = await (target << ["a", "b", "a", "a"])
+    assert [s.answer for s in output] == ["A", "B", "A", "A"]
+    assert len(echo_llm) == 2
+    assert output.deduplicated_calls == 2
+    assert target.deduplicated_calls == 0
+    assert output[0] is not output[2]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_transductions_report_their_own_dedup(echo_llm):
+    target = AG(atype=Answer, llm=None)
+    first, second = await asyncio.gather(
+        target << ["a", "a"], target << ["b", "b", "b"]
+    )
+    assert (first.deduplicated_calls, second.deduplicated_calls) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_normalizer_folds_near_duplicates(echo_llm):
+    target = AG(atype=Answer, llm=None, dedup_normalizer=str.lower)
+    output = await (target << ["a", "A", "b"])
+    assert [s.answer for s in output] == ["A", "A", "B"]
+    assert len(echo_llm) == 2
+
+
+class UsageLLM:
+    """
+    Tracks the usage of each completion in one summary and emits it with the completed event,
+    as crewai LLMs do
+    """
+
+    model = "usage"
+
+    def __init__(self):
+        self.prompt_tokens = 0
+
+    async def acall(self, messages, response_model=None):
+        await asyncio.sleep(0.01)
+        usage = {"prompt_tokens": 10, "cached_prompt_tokens": 4, "completion_tokens": 1}
+        self.prompt_tokens += usage["prompt_tokens"]
+        crewai_event_bus.emit(
+            self,
+            LLMCallCompletedEvent(
+                messages=messages,
+                response='{"answer": "x"}',
+                call_type=LLMCallType.LLM_CALL,
+                model=self.model,
+                call_id=str(uuid.uuid4()),
+                usage=usage,
+            ),
+        )
+        return '{"answer": "x"}'
+
+
+@pytest.mark.asyncio
+async def test_concurrent_transducers_count_their_own_completions():
+    llm = UsageLLM()
+    first = PydanticTransducerLLM(Answer, llm=llm)
+    second = PydanticTransducerLLM(Answer, llm=llm)
+    first.usage, second.usage = PromptUsage(), PromptUsage()
+    await asyncio.gather(
+        first.execute("a", "b", "c", transient_pbar=True),
+        second.execute("d", "e", transient_pbar=True),
+    )
+    assert llm.prompt_tokens == 50
+    assert first.usage.as_dict() == {
+        "requests": 3,
+        "prompt_tokens": 30,
+        "cached_tokens": 12,
+        "uncached_tokens": 18,
+        "completion_tokens": 3,
+    }
+    assert second.usage.requests == 2 and second.usage.prompt_tokens == 20
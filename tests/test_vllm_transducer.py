@@ -0,0 +1,140 @@
+import json
+from typing import Optional
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+from pydantic import BaseModel
+
+from agentics import AG
+from agentics.core.async_executor import PydanticTransducerVLLM
+
+
+class Answer(BaseModel):
+    answer: Optional[str] = None
+
+
+def fake_server(*samples, requests=None):
+    """OpenAI-compatible client answering every chat completion with the given samples"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if requests is not None:
+            requests.append(body)
+        logprobs = {"content": [{"token": "x", "logprob": -0.1, "top_logprobs": []}]}
+        choices = [
+            {
+                "index": i,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": sample},
+                "logprobs": logprobs if body.get("logprobs") else None,
+            }
+            for i, sample in enumerate(samples[: body.get("n", 1)])
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "id": "cmpl",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": choices,
+                "usage": {
+                    "prompt_tokens": 100,
+                    "completion_tokens": 5,
+                    "total_tokens": 105,
+                    "prompt_tokens_details": {"cached_tokens": 80},
+                },
+            },
+        )
+
+    return AsyncOpenAI(
+        base_url="http://vllm/v1",
+        api_key="EMPTY",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_vllm_transducer_uses_guided_json():
+    requests = []
+    transducer = PydanticTransducerVLLM(
+        Answer,
+        llm=fake_server('{"answer": "A"}', requests=requests),
+        model="test-model",
+        max_workers=2,
+        role="ignored crew param",
+    )
+    outputs = await transducer.execute("a", "b", "c", transient_pbar=True)
+    assert [o.answer for o in outputs] == ["A", "A", "A"]
+    assert len(requests) == 3
+    assert requests[0]["guided_json"] == Answer.model_json_schema()
+    assert "role" not in requests[0]
+    system, user = requests[0]["messages"]
+    assert system == requests[1]["messages"][0]
+    assert user["content"] in ("a", "b", "c")
+
+
+@pytest.mark.asyncio
+async def test_vllm_transducer_votes_among_samples_and_keeps_logprobs():
+    transducer = PydanticTransducerVLLM(
+        Answer,
+        llm=fake_server(
+            '{"answer": "B"}', "not json", '{"answer": "C"}', '{"answer": "C"}'
+        ),
+        model="test-model",
+        n_samples=4,
+        logprobs=True,
+    )
+    transducer.logprobs = {}
+    [output] = await transducer.execute("a")
+    assert output.answer == "C"
+    assert len(transducer.logprobs["a"]["contents"]) == 4
+    assert transducer.logprobs["a"]["logprobs"][0]["logprob"] == [-0.1]
+
+
+@pytest.mark.asyncio
+async def test_ag_returns_logprobs_by_position():
+    target = AG(
+        atype=Answer,
+        llm=fake_server('{"answer": "A"}'),
+        sampling_params={"model": "test-model", "logprobs": True},
+    )
+    output = await (target << ["a", "b", "a"])
+    assert len(output.logprobs) == 3
+    assert all(lp["contents"] == ['{"answer": "A"}'] for lp in output.logprobs)
+    # duplicated inputs share the logprobs of the call made for them
+    assert output.logprobs[0] is output.logprobs[2]
+    assert target.logprobs is None
+    output = await (AG(atype=Answer, llm=fake_server('{"answer": "A"}')) << ["a"])
+    assert output.logprobs is None
+
+
+@pytest.mark.asyncio
+async def test_ag_transduces_with_openai_compatible_client():
+    target = AG(
+        atype=Answer,
+        llm=fake_server('{"answer": "A"}', '{"answer": "A"}'),
+        sampling_params={"n_samples": 2, "model": "test-model"},
+    )
+    output = await (target << ["a", "b"])
+    assert [s.answer for s in output] == ["A", "A"]
+
+
+@pytest.mark.asyncio
+async def test_ag_reports_cached_prompt_tokens():
+    target = AG(
+        atype=Answer,
+        llm=fake_server('{"answer": "A"}'),
+        sampling_params={"model": "test-model"},
+    )
+    output = await (target << ["a", "b"])
+    assert target.prompt_usage is None
+    assert output.prompt_usage.as_dict() == {
+        "requests": 2,
+        "prompt_tokens": 200,
+        "cached_tokens": 160,
+        "uncached_tokens": 40,
+        "completion_tokens": 10,
+    }
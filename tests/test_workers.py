@@ -0,0 +1,79 @@
+import os
+import re
+import threading
+
+import pytest
+from pydantic import create_model
+
+from agentics import AG
+from agentics.core.workers import StateWorkers
+
+
+def make_document():
+    """A dynamically created atype, which pickle can't import from this module"""
+    return create_model(
+        "Document", text=(str, ...), numbers=(list, []), worker=(int, 0)
+    )
+
+
+def extract_numbers(state):
+    state.numbers = [int(n) for n in re.findall(r"\d+", state.text)]
+    state.worker = os.getpid()
+    return state
+
+
+def tag_thread(state):
+    state.worker = threading.get_ident()
+    return state
+
+
+def documents(n):
+    Document = make_document()
+    return [Document(text=f"doc {i} has {i * 2} numbers") for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_amap_runs_sync_functions_in_processes():
+    states = documents(20)
+    Document = type(states[0])
+    ag = AG(atype=Document, states=states, llm=None, max_workers=3)
+    await ag.amap(extract_numbers, executor="process")
+    assert [s.numbers for s in ag] == [[i, i * 2] for i in range(20)]
+    # states are rebuilt as the dynamic atype they were sent as
+    assert all(type(s) is Document for s in ag)
+    assert os.getpid() not in {s.worker for s in ag}
+
+
+@pytest.mark.asyncio
+async def test_amap_runs_sync_functions_in_threads():
+    ag = AG(states=documents(10), llm=None, max_workers=2)
+    await ag.amap(tag_thread)
+    assert threading.get_ident() not in {s.worker for s in ag}
+
+
+@pytest.mark.asyncio
+async def test_apply_with_process_executor_keeps_order():
+    ag = AG(states=documents(10), llm=None)
+    await ag.apply(extract_numbers, first_n=6, executor="process", max_workers=2)
+    assert [s.numbers for s in ag] == [[i, i * 2] for i in range(6)] + [[]] * 4
+
+
+@pytest.mark.asyncio
+async def test_process_executor_rejects_local_functions():
+    ag = AG(states=documents(2), llm=None)
+    with pytest.raises(ValueError):
+        await ag.amap(lambda state: state, executor="process")
+
+
+def test_process_workers_default_to_one_per_cpu_and_avoid_fork_with_threads():
+    started = threading.Event()
+    thread = threading.Thread(target=started.wait)
+    thread.start()
+    try:
+        with StateWorkers(extract_numbers, "process") as workers:
+            assert workers.pool._max_workers == os.cpu_count()
+            # forking while other threads run can deadlock the workers
+            assert workers.pool._mp_context.get_start_method() != "fork"
+    finally:
+        started.set()
+        thread.join()